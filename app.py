@@ -0,0 +1,17 @@
+# ============================================================================
+# SERVER ENTRY POINT
+# ============================================================================
+# Runs the portfolio (main.py) with the extra HTTP routes from
+# portfolio/server.py, such as on-demand image resizing, after warming up
+# its caches (portfolio/warmup.py):
+#
+#   streamlit run app.py
+#
+# `streamlit run main.py` still works, without those routes.
+# ============================================================================
+
+import streamlit as st
+
+from portfolio import server, warmup
+
+app = st.App("main.py", routes=server.routes(), lifespan=warmup.lifespan)
@@ -0,0 +1 @@
+"""Helpers shared by the Streamlit portfolio app (main.py) and its build tools."""
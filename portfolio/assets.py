@@ -0,0 +1,351 @@
+# ============================================================================
+# PRECOMPRESSED ASSETS
+# ============================================================================
+# The page's large text payloads (the CSS bundle and the social, timeline,
+# Instagram and YouTube component documents) are files under static/, each
+# with a brotli (.br) and a gzip (.gz) copy made once when the file is
+# written:
+#
+#   static/css/portfolio.<hash>.css        + .css.br, .css.gz
+#   static/components/<hash>.html         + .html.br, .html.gz
+#
+# The /assets route (portfolio/server.py) sends the smallest copy the
+# browser's Accept-Encoding allows, so no request pays for compression.
+# Without that route (`streamlit run main.py`) the page falls back to
+# app/static links and srcdoc components, as before.
+#
+# Component documents are published by the app itself, when a section first
+# renders one (the warm-up renders them all at server start). The build
+# writes the CSS bundle and compresses every text file under static/ that
+# has no up-to-date copies yet (e.g. after an image or font build).
+#
+# Every URL the page links on /assets changes with the file's contents:
+# built files already carry their content hash in the name, the others
+# (video posters, photo derivatives) get a `?v=<hash>` query. The route serves both with
+# `Cache-Control: immutable` and a strong ETag made from that hash.
+#
+# Build:   python -m portfolio.assets [--force]   (gzip only without brotli)
+# Runtime: assets.publish(document, ".html") -> static/components/<hash>.html
+#          assets.negotiate(path, accept_encoding) -> (file to send, encoding)
+#          assets.version(path) -> content hash for URLs and ETags
+# ============================================================================
+
+import argparse
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+STATIC_DIR = ROOT / "static"
+COMPONENTS_DIR = STATIC_DIR / "components"
+
+# Text formats worth compressing; images, fonts and videos already are
+COMPRESSIBLE = (".css", ".js", ".svg", ".html", ".json", ".txt", ".xml", ".webmanifest")
+
+# Encodings in order of preference, with the suffix of their copies
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+BROTLI_QUALITY = 11
+GZIP_LEVEL = 9
+
+MEDIA_TYPES = {
+    ".avif": "image/avif",
+    ".webp": "image/webp",
+    ".woff2": "font/woff2",
+    ".webmanifest": "application/manifest+json",
+}
+
+# Paths under static/ that the builds write under a hash of their own
+# bytes, exactly as each one names them. Anything else is versioned with ?v=
+# instead, however hex its name looks: video posters, files dropped into
+# static/ by hand, and photo derivatives, whose names carry the hash of the
+# source photo and so survive a re-encode at a new quality or size.
+_HASHED_PATHS = tuple(re.compile(pattern) for pattern in (
+    r"css/portfolio\.[0-9a-f]{12}\.css",                # portfolio/styles.py
+    r"fonts/[a-z]+-\d+\.[0-9a-f]{10}\.woff2",           # portfolio/fonts.py
+    r"components/[0-9a-f]{16}\.html",                  # publish()
+    r"pwa/icon-\d+\.[0-9a-f]{12}\.png",                # portfolio/pwa.py
+    r"offline/[0-9a-f]{12}/[^.][^/]*(?:/[^.][^/]*)*",   # portfolio/pwa.py
+))
+
+_published = {}
+_versions = {}
+_lock = threading.Lock()
+
+
+# ============================================================================
+# CONTENT HASHES
+# ============================================================================
+
+def version(path):
+    """
+    Short hash of a file's contents, for versioned URLs and strong ETags
+
+    Computed once per process and file change (keyed by mtime and size).
+
+    Args:
+        path (str | Path): Any file, e.g. a photo, video or poster
+
+    Returns:
+        str: 12 hex digits
+
+    Raises:
+        OSError: When the file can't be read
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _versions.get(path)
+    if cached is None or cached[0] != key:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        cached = (key, digest.hexdigest()[:12])
+        _versions[path] = cached
+    return cached[1]
+
+
+def content_hashed(path):
+    """True when a file under static/ was written under its content hash."""
+    try:
+        relative = Path(path).resolve().relative_to(STATIC_DIR).as_posix()
+    except ValueError:
+        return False
+    return any(pattern.fullmatch(relative) for pattern in _HASHED_PATHS)
+
+
+# ============================================================================
+# COMPRESSION
+# ============================================================================
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _encode(data, encoding):
+    if encoding == "br":
+        brotli = _brotli()
+        return brotli.compress(data, quality=BROTLI_QUALITY) if brotli else None
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _write(path, data):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def compress(path, force=False):
+    """
+    Write the .br and .gz copies of a file, unless they are up to date
+
+    A copy that wouldn't be smaller than the file itself is not written (and
+    a stale one is removed), so tiny files are always sent as they are.
+
+    Args:
+        path (Path): File under static/
+        force (bool): Rewrite copies even when they are newer than the file
+
+    Returns:
+        dict: encoding -> size in bytes of its copy, for the copies that exist
+    """
+    path = Path(path)
+    source_mtime = path.stat().st_mtime_ns
+    data = None
+    sizes = {}
+    for encoding, suffix in ENCODINGS:
+        copy = path.with_name(path.name + suffix)
+        try:
+            stat = copy.stat()
+        except OSError:
+            stat = None
+        if stat and stat.st_mtime_ns >= source_mtime and not force:
+            sizes[encoding] = stat.st_size
+            continue
+        if data is None:
+            data = path.read_bytes()
+        encoded = _encode(data, encoding)
+        if encoded is None or len(encoded) >= len(data):
+            if stat:
+                copy.unlink()
+            continue
+        _write(copy, encoded)
+        sizes[encoding] = len(encoded)
+    return sizes
+
+
+def publish(body, suffix=".html"):
+    """
+    Write a generated text asset under its content hash, with its copies
+
+    Args:
+        body (str): File contents, e.g. a component document
+        suffix (str): File extension
+
+    Returns:
+        Path: static/components/<hash><suffix>
+    """
+    data = body.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    with _lock:
+        path = _published.get(digest)
+        if path is None:
+            path = COMPONENTS_DIR / f"{digest}{suffix}"
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _write(path, data)
+            compress(path)
+            _published[digest] = path
+    return path
+
+
+# ============================================================================
+# SERVING
+# ============================================================================
+
+def resolve(name):
+    """
+    Map a path on the /assets route to a file under static/
+
+    Returns:
+        Path: The file; None when it doesn't exist, lies outside static/ or
+            is itself a compressed copy or temporary file
+    """
+    path = (STATIC_DIR / name).resolve()
+    try:
+        relative = path.relative_to(STATIC_DIR)
+    except ValueError:
+        return None
+    if any(part.startswith(".") for part in relative.parts):
+        return None
+    if path.suffix in (".br", ".gz", ".tmp") or not path.is_file():
+        return None
+    return path
+
+
+def media_type(path):
+    """Content-Type of a file served from static/."""
+    suffix = Path(path).suffix.lower()
+    return MEDIA_TYPES.get(suffix) or mimetypes.guess_type(str(path))[0] or "application/octet-stream"
+
+
+def parse_accept_encoding(header):
+    """
+    Parse an Accept-Encoding header
+
+    Returns:
+        dict: content coding (lower case, "x-gzip" as "gzip") -> q value
+    """
+    accepted = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted["gzip" if coding == "x-gzip" else coding] = q
+    return accepted
+
+
+def negotiate(path, accept_encoding):
+    """
+    Pick the copy of `path` to send for an Accept-Encoding header
+
+    Brotli wins over gzip unless the client gives gzip a higher q value.
+    Copies older than the file are ignored.
+
+    Args:
+        path (Path): File under static/, from resolve()
+        accept_encoding (str): The request's Accept-Encoding header
+
+    Returns:
+        tuple: (Path to send, content coding or None for the file itself)
+    """
+    accepted = parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = (path, None), 0.0
+    source_mtime = None
+    for encoding, suffix in ENCODINGS:
+        q = accepted.get(encoding, wildcard)
+        if q <= best_q:
+            continue
+        copy = path.with_name(path.name + suffix)
+        try:
+            stat = copy.stat()
+        except OSError:
+            continue
+        if source_mtime is None:
+            source_mtime = path.stat().st_mtime_ns
+        if stat.st_mtime_ns >= source_mtime:
+            best, best_q = (copy, encoding), q
+    return best
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def build(force=False):
+    """
+    Write the CSS bundle and compress every text file under static/
+
+    Args:
+        force (bool): Recompress files whose copies are up to date
+
+    Returns:
+        list: (path relative to the repo, size, {encoding: size}) per file
+    """
+    from portfolio import styles
+
+    styles.write_bundle()
+    report = []
+    for directory, _, names in os.walk(STATIC_DIR):
+        for name in sorted(names):
+            path = Path(directory) / name
+            if path.suffix.lower() not in COMPRESSIBLE:
+                continue
+            sizes = compress(path, force=force)
+            report.append((path.relative_to(ROOT).as_posix(), path.stat().st_size, sizes))
+    return sorted(report)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write brotli and gzip copies of the text assets under static/.")
+    parser.add_argument("--force", action="store_true", help="recompress every file")
+    args = parser.parse_args(argv)
+
+    if _brotli() is None:
+        print("brotli is not installed: writing gzip copies only")
+    report = build(force=args.force)
+    total = {"identity": 0, "br": 0, "gzip": 0}
+    for path, size, sizes in report:
+        total["identity"] += size
+        for encoding, _ in ENCODINGS:
+            total[encoding] += sizes.get(encoding, size)
+        copies = "  ".join(f"{encoding} {sizes[encoding]:>7}" for encoding, _ in ENCODINGS if encoding in sizes)
+        print(f"{size:>8}  {copies or 'not compressed':<28}  {path}")
+    print(
+        f"{len(report)} files: {total['identity'] / 1024:.1f} KB, "
+        f"br {total['br'] / 1024:.1f} KB, gzip {total['gzip'] / 1024:.1f} KB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+# ============================================================================
+# RENDER BENCHMARKS
+# ============================================================================
+# Runs main.py headlessly with Streamlit's AppTest harness, once per tab
+# (`?section=<slug>`), and measures what each tab costs to render:
+#
+#   time_ms         median script run time over several warm runs
+#   first_ms        the tab's first run in this process. Caches shared by
+#                   every tab (imports, content, templates, icons) are only
+#                   empty for the first tab measured; use
+#                   `python -m portfolio.warmup` for a real cold start
+#   elements        elements in the rendered tree
+#   delta_bytes     serialized size of those elements (what is sent over
+#                   the websocket)
+#   html_bytes      raw HTML/CSS inside them (st.markdown bodies and
+#                   components.html documents)
+#   media_bytes     bytes registered with the media file manager (st.image,
+#                   st.video), which every session keeps in memory
+#
+# Each run is appended to benchmarks/history.json and compared with the
+# median of the previous runs; a metric that grows past its threshold is
+# reported as a regression and the command exits with status 1, so a new
+# gallery event or embed that doubles a tab's cost is caught before deploy.
+#
+# Run:     python -m portfolio.bench [--runs 5] [--section gallery] [--no-record]
+# ============================================================================
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from portfolio.sections import SECTION_SLUGS
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT_PATH = ROOT / "main.py"
+HISTORY_PATH = ROOT / "benchmarks" / "history.json"
+
+# Allowed growth over the baseline before a metric counts as a regression,
+# as a ratio, plus an absolute slack so tiny values don't trip on noise
+THRESHOLDS = {
+    "time_ms": (1.5, 20),
+    "elements": (1.25, 2),
+    "delta_bytes": (1.25, 1024),
+    "html_bytes": (1.25, 1024),
+    "media_bytes": (1.25, 16 * 1024),
+}
+
+# Previous runs the baseline is the median of
+BASELINE_RUNS = 5
+
+RUN_TIMEOUT = 60
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def elements(node):
+    """Yield every element (leaf) node of an AppTest element tree."""
+    children = getattr(node, "children", None)
+    if children:
+        for child in children.values():
+            yield from elements(child)
+    elif getattr(node, "proto", None) is not None:
+        yield node
+
+
+def _html_bytes(element):
+    proto = element.proto
+    for field in ("body", "srcdoc"):
+        value = getattr(proto, field, None)
+        if isinstance(value, str):
+            return len(value.encode("utf-8"))
+    return 0
+
+
+class MediaCounter:
+    """Records the files handed to the media file manager while active."""
+
+    def __init__(self):
+        # (mimetype, bytes) per file
+        self.files = []
+
+    @property
+    def bytes(self):
+        return sum(size for _, size in self.files)
+
+    def __enter__(self):
+        from streamlit.runtime.media_file_manager import MediaFileManager
+
+        self._original = original = MediaFileManager.add
+        files = self.files
+
+        def add(manager, path_or_data, mimetype, *args, **kwargs):
+            if isinstance(path_or_data, bytes):
+                files.append((mimetype, len(path_or_data)))
+            elif isinstance(path_or_data, str) and os.path.isfile(path_or_data):
+                files.append((mimetype, os.path.getsize(path_or_data)))
+            return original(manager, path_or_data, mimetype, *args, **kwargs)
+
+        MediaFileManager.add = add
+        return self
+
+    def __exit__(self, *exc):
+        from streamlit.runtime.media_file_manager import MediaFileManager
+
+        MediaFileManager.add = self._original
+        return False
+
+
+def quiet_logs():
+    """Silence the warnings bare-mode AppTest runs log for every element."""
+    from streamlit import config, logger
+
+    config.set_option("logger.level", "error")
+    logger.set_log_level("error")
+
+
+def render(slug):
+    """
+    Run main.py headlessly with one tab open
+
+    Args:
+        slug (str): Section slug, e.g. "gallery"
+
+    Returns:
+        tuple: (AppTest after the run, run time in seconds, MediaCounter)
+
+    Raises:
+        RuntimeError: When the script raised an exception
+    """
+    from streamlit.testing.v1 import AppTest
+
+    # AppTest resolves paths in main.py against the working directory; the
+    # caller's is restored afterwards
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        at = AppTest.from_file(str(SCRIPT_PATH), default_timeout=RUN_TIMEOUT)
+        at.query_params["section"] = slug
+        with MediaCounter() as media:
+            start = time.perf_counter()
+            at.run()
+            elapsed = time.perf_counter() - start
+    finally:
+        os.chdir(cwd)
+    if at.exception:
+        raise RuntimeError(f"{slug}: {at.exception[0].value}")
+    return at, elapsed, media
+
+
+def run_section(slug):
+    """
+    Render one tab headlessly and measure it
+
+    Args:
+        slug (str): Section slug, e.g. "gallery"
+
+    Returns:
+        dict: time_ms, elements, delta_bytes, html_bytes and media_bytes
+
+    Raises:
+        RuntimeError: When the script raised an exception
+    """
+    at, elapsed, media = render(slug)
+    found = list(elements(at._tree))
+    return {
+        "time_ms": round(elapsed * 1000, 1),
+        "elements": len(found),
+        "delta_bytes": sum(e.proto.ByteSize() for e in found),
+        "html_bytes": sum(_html_bytes(e) for e in found),
+        "media_bytes": media.bytes,
+    }
+
+
+def benchmark(slugs, runs=5):
+    """
+    Measure each section: its first run, then `runs` warm ones
+
+    Args:
+        slugs (list): Section slugs to measure
+        runs (int): Warm runs per section; the median time is reported
+
+    Returns:
+        dict: slug -> metrics
+    """
+    results = {}
+    for slug in slugs:
+        first = run_section(slug)
+        warm = [run_section(slug) for _ in range(runs)]
+        result = dict(warm[-1])
+        result["time_ms"] = round(statistics.median(r["time_ms"] for r in warm), 1)
+        result["first_ms"] = first["time_ms"]
+        results[slug] = result
+    return results
+
+
+# ============================================================================
+# HISTORY AND THRESHOLDS
+# ============================================================================
+
+def read_history(path=HISTORY_PATH):
+    """Return the recorded runs, oldest first."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["runs"]
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def append_history(entry, path=HISTORY_PATH):
+    """Add a run to the history file."""
+    path = Path(path)
+    runs = read_history(path) + [entry]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"runs": runs}, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def baseline(history, slug):
+    """Median of each metric over the last BASELINE_RUNS runs of a section."""
+    previous = [run["sections"][slug] for run in history if slug in run["sections"]][-BASELINE_RUNS:]
+    if not previous:
+        return None
+    return {
+        metric: statistics.median(run[metric] for run in previous if metric in run)
+        for metric in THRESHOLDS
+        if any(metric in run for run in previous)
+    }
+
+
+def regressions(results, history):
+    """
+    Compare results with the history
+
+    Returns:
+        list: (slug, metric, baseline value, new value) for every metric
+            above its threshold
+    """
+    found = []
+    for slug, metrics in results.items():
+        base = baseline(history, slug)
+        if not base:
+            continue
+        for metric, (ratio, slack) in THRESHOLDS.items():
+            if metric in base and metrics[metric] > max(base[metric] * ratio, base[metric] + slack):
+                found.append((slug, metric, base[metric], metrics[metric]))
+    return found
+
+
+def git_revision():
+    """Short hash of the checked-out commit, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the render cost of every portfolio tab.")
+    parser.add_argument("--runs", type=int, default=5, help="warm runs per section (default 5)")
+    parser.add_argument(
+        "--section", action="append", choices=list(SECTION_SLUGS.values()),
+        help="only measure this section (repeatable)",
+    )
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH, help="history file (default: benchmarks/history.json)")
+    parser.add_argument("--no-record", action="store_true", help="compare without appending to the history")
+    args = parser.parse_args(argv)
+
+    quiet_logs()
+    slugs = args.section or list(SECTION_SLUGS.values())
+    results = benchmark(slugs, runs=args.runs)
+    history = read_history(args.history)
+
+    print(f"{'section':14} {'time ms':>8} {'first ms':>8} {'elements':>9} {'delta KB':>9} {'html KB':>8} {'media KB':>9}")
+    for slug, m in results.items():
+        print(
+            f"{slug:14} {m['time_ms']:8.1f} {m['first_ms']:8.1f} {m['elements']:9d} "
+            f"{m['delta_bytes'] / 1024:9.1f} {m['html_bytes'] / 1024:8.1f} {m['media_bytes'] / 1024:9.1f}"
+        )
+
+    found = regressions(results, history)
+    for slug, metric, before, after in found:
+        print(f"REGRESSION {slug} {metric}: {before:g} -> {after:g}")
+
+    if not args.no_record:
+        append_history({
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "runs": args.runs,
+            "sections": results,
+        }, args.history)
+    raise SystemExit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
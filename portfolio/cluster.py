@@ -0,0 +1,430 @@
+# ============================================================================
+# MULTI-WORKER LAUNCHER
+# ============================================================================
+# One Streamlit process runs every session's script, image handling and
+# websocket traffic on a single core. This launcher starts N Streamlit
+# workers on local ports and puts a small sticky load balancer in front:
+#
+#   browser --> :8501 balancer --> 127.0.0.1:8600  worker 0 (streamlit run app.py)
+#                              --> 127.0.0.1:8601  worker 1
+#                              ...
+#
+# A Streamlit session lives in one worker (its websocket, session state and
+# st.image files), so every request from a browser must reach the same one.
+# The first response sets a `portfolio_worker` cookie naming the worker, and
+# later requests, including the websocket upgrade, are routed by it. New
+# browsers go to the healthy worker with the fewest open connections. Once a
+# request is routed, the connection is spliced through as raw bytes, so
+# websockets and keep-alive work without the balancer parsing them.
+#
+# Workers are health-checked on /_stcore/health; one that exits is started
+# again with backoff, and its browsers reconnect to another worker (a fresh
+# session). SIGHUP restarts the workers one at a time, each after it has
+# drained, so a deploy never takes the site down. The workers share one
+# cookie secret, and the image disk cache and video files are shared
+# through the filesystem.
+#
+# Run:     python -m portfolio.cluster [--workers N] [--port 8501]
+#                                      [-- extra streamlit run options]
+# ============================================================================
+
+import argparse
+import asyncio
+import os
+import re
+import secrets
+import signal
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_PORT = 8501
+DEFAULT_BASE_PORT = 8600
+DEFAULT_SCRIPT = "app.py"
+
+COOKIE_NAME = "portfolio_worker"
+HEALTH_PATH = "/_stcore/health"
+
+# Seconds between health checks, and failed checks before a worker is
+# taken out of rotation
+HEALTH_INTERVAL = 5
+HEALTH_TIMEOUT = 3
+HEALTH_FAILURES = 3
+
+# A worker being restarted gets this long for its connections to close
+DRAIN_TIMEOUT = 30
+STARTUP_TIMEOUT = 60
+MAX_RESTART_DELAY = 30
+
+# Largest request or response head accepted, and the splice buffer size
+MAX_HEAD = 64 * 1024
+PIPE_CHUNK = 64 * 1024
+
+_COOKIE = re.compile(rf"(?:^|;)\s*{COOKIE_NAME}=w(\d+)")
+
+
+def _workers_from_env():
+    try:
+        return max(int(os.environ.get("PORTFOLIO_WORKERS", 0)), 0) or os.cpu_count() or 1
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+class Worker:
+    """
+    One `streamlit run` process on a local port
+
+    Args:
+        index (int): Worker number, used in the routing cookie
+        port (int): Port the worker listens on (127.0.0.1 only)
+        command (list): The command line, without the port
+        env (dict): Environment of the process (default: inherited)
+    """
+
+    def __init__(self, index, port, command, env=None):
+        self.index = index
+        self.port = port
+        self.command = command + ["--server.port", str(port)]
+        self.env = env
+        self.process = None
+        self.healthy = False
+        self.draining = False
+        self.failures = 0
+        self.restarts = 0
+        self.active = 0
+        self.sessions = 0
+
+    @property
+    def available(self):
+        return self.healthy and not self.draining
+
+    async def start(self):
+        self.healthy = False
+        self.failures = 0
+        self.process = await asyncio.create_subprocess_exec(*self.command, cwd=ROOT, env=self.env)
+        print(f"worker {self.index}: started on port {self.port} (pid {self.process.pid})", flush=True)
+
+    async def stop(self, timeout=10):
+        """Terminate the process, killing it if it ignores SIGTERM."""
+        self.healthy = False
+        process = self.process
+        if process is None or process.returncode is not None:
+            return
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def check(self):
+        """Ask the worker's health endpoint; True when it answers 200."""
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", self.port), HEALTH_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        try:
+            writer.write(f"GET {HEALTH_PATH} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n".encode("ascii"))
+            await writer.drain()
+            status = await asyncio.wait_for(reader.readline(), HEALTH_TIMEOUT)
+            return status.split(b" ")[1:2] == [b"200"]
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return False
+        finally:
+            writer.close()
+
+    async def wait_healthy(self, timeout=STARTUP_TIMEOUT):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.returncode is not None:
+                return False
+            if await self.check():
+                self.healthy = True
+                return True
+            await asyncio.sleep(0.5)
+        return False
+
+
+# ============================================================================
+# BALANCER
+# ============================================================================
+
+def _splice_header(head, line):
+    """Insert a header line just before the blank line ending an HTTP head."""
+    return head[:-2] + line.encode("latin-1") + b"\r\n\r\n"
+
+
+def _strip_header(head, name):
+    """Remove every line of a header (case-insensitive) from an HTTP head."""
+    lines = head.split(b"\r\n")
+    name = name.lower().encode("latin-1")
+    kept = [lines[0]] + [
+        line for line in lines[1:] if line.partition(b":")[0].strip().lower() != name
+    ]
+    return b"\r\n".join(kept)
+
+
+async def _pipe(reader, writer):
+    try:
+        while True:
+            data = await reader.read(PIPE_CHUNK)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, OSError):
+        pass
+    finally:
+        if not writer.is_closing() and writer.can_write_eof():
+            try:
+                writer.write_eof()
+            except OSError:
+                pass
+
+
+class Cluster:
+    """
+    N workers behind a sticky balancer
+
+    Args:
+        workers (int): Number of Streamlit processes
+        host (str): Address the balancer listens on
+        port (int): Port the balancer listens on
+        base_port (int): Worker i listens on base_port + i
+        script (str): Script each worker runs
+        streamlit_args (list): Extra `streamlit run` options
+    """
+
+    def __init__(self, workers, host="0.0.0.0", port=DEFAULT_PORT, base_port=DEFAULT_BASE_PORT,
+                 script=DEFAULT_SCRIPT, streamlit_args=()):
+        command = [
+            sys.executable, "-m", "streamlit", "run", script,
+            "--server.address", "127.0.0.1",
+            "--server.headless", "true",
+            *streamlit_args,
+        ]
+        # One secret for all workers, so signed cookies (XSRF) stay valid
+        # whichever worker checks them
+        env = dict(os.environ)
+        env.setdefault("STREAMLIT_SERVER_COOKIE_SECRET", secrets.token_hex(32))
+        self.workers = [Worker(i, base_port + i, command, env) for i in range(workers)]
+        self.host = host
+        self.port = port
+        self._stopping = asyncio.Event()
+        self._restarting = False
+
+    def pick(self, cookie):
+        """
+        The worker a request goes to
+
+        Args:
+            cookie (str): The request's Cookie header
+
+        Returns:
+            tuple: (Worker or None when none is available, True when the
+                browser must be sent a new routing cookie)
+        """
+        match = _COOKIE.search(cookie)
+        if match and int(match.group(1)) < len(self.workers):
+            worker = self.workers[int(match.group(1))]
+            # Draining workers keep their sessions until they are restarted
+            if worker.healthy:
+                return worker, False
+        candidates = [w for w in self.workers if w.available]
+        if not candidates:
+            return None, False
+        # Fewest open connections; ties go to the worker given fewer browsers
+        worker = min(candidates, key=lambda w: (w.active, w.sessions))
+        worker.sessions += 1
+        return worker, True
+
+    async def handle(self, client_reader, client_writer):
+        try:
+            head = await client_reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            client_writer.write(b"HTTP/1.1 431 Request Header Fields Too Large\r\nConnection: close\r\n\r\n")
+            client_writer.close()
+            return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            client_writer.close()
+            return
+
+        cookie = ""
+        for line in head.split(b"\r\n")[1:]:
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"cookie":
+                cookie = value.decode("latin-1")
+                break
+        # The balancer is the first proxy: a forwarded chain sent by the
+        # client is made up, so only the connection's own address is passed on
+        head = _strip_header(head, "X-Forwarded-For")
+        peer = client_writer.get_extra_info("peername")
+        if peer:
+            head = _splice_header(head, f"X-Forwarded-For: {peer[0]}")
+
+        # Try workers until one accepts the connection; nothing has been sent
+        # upstream yet, so a retry is safe
+        for _ in range(len(self.workers)):
+            worker, new_cookie = self.pick(cookie)
+            if worker is None:
+                break
+            try:
+                upstream_reader, upstream_writer = await asyncio.open_connection(
+                    "127.0.0.1", worker.port, limit=MAX_HEAD
+                )
+                break
+            except OSError:
+                worker.healthy = False
+                cookie = ""
+        else:
+            worker = None
+        if worker is None:
+            client_writer.write(
+                b"HTTP/1.1 503 Service Unavailable\r\nRetry-After: 5\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+            )
+            await client_writer.drain()
+            client_writer.close()
+            return
+
+        worker.active += 1
+        try:
+            upstream_writer.write(head)
+            await upstream_writer.drain()
+            if new_cookie:
+                # Only the first response needs the cookie; after it the
+                # connection is spliced without parsing
+                client_to_worker = asyncio.ensure_future(_pipe(client_reader, upstream_writer))
+                response = await upstream_reader.readuntil(b"\r\n\r\n")
+                client_writer.write(_splice_header(
+                    response, f"Set-Cookie: {COOKIE_NAME}=w{worker.index}; Path=/; HttpOnly; SameSite=Lax"
+                ))
+                await client_writer.drain()
+                await asyncio.gather(client_to_worker, _pipe(upstream_reader, client_writer))
+            else:
+                await asyncio.gather(_pipe(client_reader, upstream_writer), _pipe(upstream_reader, client_writer))
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, OSError):
+            pass
+        finally:
+            worker.active -= 1
+            upstream_writer.close()
+            client_writer.close()
+
+    # ------------------------------------------------------------------------
+    # Supervision
+    # ------------------------------------------------------------------------
+
+    async def _revive(self, worker):
+        """Start a worker that exited, after a backoff that grows per crash."""
+        delay = min(2 ** worker.restarts, MAX_RESTART_DELAY)
+        worker.restarts += 1
+        print(f"worker {worker.index}: exited ({worker.process.returncode}), restarting in {delay}s", flush=True)
+        await asyncio.sleep(delay)
+        if self._stopping.is_set():
+            return
+        await worker.start()
+        if await worker.wait_healthy():
+            worker.restarts = 0
+
+    async def supervise(self):
+        """Health-check every worker and bring back the ones that died."""
+        reviving = set()
+        while not self._stopping.is_set():
+            for worker in self.workers:
+                if worker.index in reviving or self._restarting and worker.draining:
+                    continue
+                if worker.process.returncode is not None:
+                    worker.healthy = False
+                    reviving.add(worker.index)
+                    task = asyncio.ensure_future(self._revive(worker))
+                    task.add_done_callback(lambda _, i=worker.index: reviving.discard(i))
+                elif await worker.check():
+                    worker.healthy, worker.failures = True, 0
+                else:
+                    worker.failures += 1
+                    if worker.failures >= HEALTH_FAILURES and worker.healthy:
+                        worker.healthy = False
+                        print(f"worker {worker.index}: failing health checks, out of rotation", flush=True)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), HEALTH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    async def rolling_restart(self):
+        """Restart the workers one at a time, each once it has drained."""
+        if self._restarting:
+            return
+        self._restarting = True
+        try:
+            for worker in self.workers:
+                if self._stopping.is_set():
+                    return
+                if not any(w.available for w in self.workers if w is not worker):
+                    print(f"worker {worker.index}: restarting without draining (no other worker up)", flush=True)
+                worker.draining = True
+                deadline = time.monotonic() + DRAIN_TIMEOUT
+                while worker.active and time.monotonic() < deadline:
+                    await asyncio.sleep(0.5)
+                await worker.stop()
+                await worker.start()
+                await worker.wait_healthy()
+                worker.draining = False
+        finally:
+            self._restarting = False
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, self._stopping.set)
+        loop.add_signal_handler(signal.SIGINT, self._stopping.set)
+        restarts = []
+        loop.add_signal_handler(signal.SIGHUP, lambda: restarts.append(asyncio.ensure_future(self.rolling_restart())))
+
+        for worker in self.workers:
+            await worker.start()
+        server = await asyncio.start_server(self.handle, self.host, self.port, limit=MAX_HEAD)
+        print(f"balancer: http://{self.host}:{self.port} -> {len(self.workers)} workers", flush=True)
+        await asyncio.gather(*(w.wait_healthy() for w in self.workers))
+        supervisor = asyncio.ensure_future(self.supervise())
+
+        await self._stopping.wait()
+        print("balancer: shutting down", flush=True)
+        server.close()
+        for task in restarts:
+            task.cancel()
+        await supervisor
+        await asyncio.gather(*(w.stop() for w in self.workers))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run several Streamlit workers behind a sticky load balancer.",
+        epilog="Options after `--` are passed to every `streamlit run`.",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=_workers_from_env(),
+        help="number of workers (default: PORTFOLIO_WORKERS or the CPU count)",
+    )
+    parser.add_argument("--host", default="0.0.0.0", help="address the balancer listens on (default 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"balancer port (default {DEFAULT_PORT})")
+    parser.add_argument(
+        "--base-port", type=int, default=DEFAULT_BASE_PORT,
+        help=f"first worker port; worker i uses base + i (default {DEFAULT_BASE_PORT})",
+    )
+    parser.add_argument("--script", default=DEFAULT_SCRIPT, help=f"script each worker runs (default {DEFAULT_SCRIPT})")
+    args, streamlit_args = parser.parse_known_args(argv)
+    if streamlit_args[:1] == ["--"]:
+        streamlit_args = streamlit_args[1:]
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    cluster = Cluster(args.workers, args.host, args.port, args.base_port, args.script, streamlit_args)
+    asyncio.run(cluster.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# ============================================================================
+# CONTENT STORE
+# ============================================================================
+# The portfolio's text, photo lists and media embeds live in
+# content/portfolio.json, checked against content/portfolio.schema.json. They
+# are parsed once per process into frozen dataclasses and re-read only when
+# the file changes, so edits show up in running sessions without a restart.
+#
+# Problems (schema violations, a gallery photo that does not exist) are
+# reported together when the file is loaded, as a ContentError.
+#
+# Check:   python -m portfolio.content
+# Runtime: content.load().gallery[0].photo_paths
+# ============================================================================
+
+import argparse
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CONTENT_PATH = ROOT / "content" / "portfolio.json"
+SCHEMA_PATH = ROOT / "content" / "portfolio.schema.json"
+PHOTOS_DIR = ROOT / "photos"
+
+
+class ContentError(ValueError):
+    """Raised when the content file is missing, malformed or inconsistent"""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = list(problems)
+        super().__init__(f"{path}: " + "; ".join(self.problems))
+
+
+# ============================================================================
+# MODEL
+# ============================================================================
+
+@dataclass(frozen=True)
+class TimelineItem:
+    """One stop on the education timeline"""
+    title: str
+    subtitle: str
+    icon: str
+
+
+@dataclass(frozen=True)
+class Experience:
+    """An experience card: a headline and optional detail lines"""
+    title: str
+    details: tuple = ()
+
+
+@dataclass(frozen=True)
+class GalleryEvent:
+    """A titled group of gallery photos"""
+    title: str
+    photos: tuple
+
+    @property
+    def photo_paths(self):
+        """Repo-relative paths of the event's photos, in display order"""
+        return tuple(photo_path(n) for n in self.photos)
+
+
+@dataclass(frozen=True)
+class MediaItem:
+    """One embed on the Media tab: an Instagram reel, YouTube video or local video"""
+    kind: str
+    src: str
+    caption: str = ""
+    height: int = 0
+    captioned: bool = False
+
+
+@dataclass(frozen=True)
+class MediaTab:
+    """A titled Media sub-tab and the embeds it shows, in order"""
+    title: str
+    items: tuple
+
+
+@dataclass(frozen=True)
+class Content:
+    """Everything the content file describes"""
+    education: tuple
+    skills: tuple
+    experience: tuple
+    achievements: tuple
+    gallery: tuple
+    media: tuple
+
+
+def photo_path(number):
+    """Repo-relative path of gallery photo `number`."""
+    return f"photos/{number}.jpeg"
+
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+# Covers the JSON Schema keywords the schema file uses; editors that
+# understand "$schema" give the same feedback while typing.
+
+_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+}
+
+
+def validate(value, schema, where="$"):
+    """
+    Check a decoded JSON value against a (subset of) JSON Schema
+
+    Args:
+        value: Decoded JSON value
+        schema (dict): Schema describing it
+        where (str): Location of `value`, used in messages
+
+    Returns:
+        list: One message per problem found (empty when valid)
+    """
+    expected = schema.get("type")
+    if expected:
+        ok = isinstance(value, _TYPES[expected])
+        if ok and expected in ("integer", "number"):
+            ok = not isinstance(value, bool)
+        if not ok:
+            return [f"{where} should be of type {expected}"]
+
+    problems = []
+    if isinstance(value, dict):
+        for key in schema.get("required", ()):
+            if key not in value:
+                problems.append(f"{where} is missing '{key}'")
+        properties = schema.get("properties", {})
+        for key, item in value.items():
+            if key in properties:
+                problems += validate(item, properties[key], f"{where}.{key}")
+            elif schema.get("additionalProperties") is False:
+                problems.append(f"{where} has unknown key '{key}'")
+    elif isinstance(value, list):
+        if len(value) < schema.get("minItems", 0):
+            problems.append(f"{where} needs at least {schema['minItems']} item(s)")
+        if "items" in schema:
+            for i, item in enumerate(value):
+                problems += validate(item, schema["items"], f"{where}[{i}]")
+    elif isinstance(value, str):
+        if len(value) < schema.get("minLength", 0):
+            problems.append(f"{where} must not be empty")
+        if "enum" in schema and value not in schema["enum"]:
+            problems.append(f"{where} must be one of {', '.join(schema['enum'])}")
+    elif isinstance(value, (int, float)) and "minimum" in schema:
+        if value < schema["minimum"]:
+            problems.append(f"{where} must be at least {schema['minimum']}")
+    return problems
+
+
+def _check_photos(data, photos_dir):
+    """Report gallery photos that are missing or listed twice."""
+    problems = []
+    seen = {}
+    for i, event in enumerate(data["gallery"]):
+        for number in event["photos"]:
+            where = f"$.gallery[{i}] ({event['title'].strip()})"
+            if not (photos_dir / Path(photo_path(number)).name).is_file():
+                problems.append(f"{where} lists photo {number}, but {photo_path(number)} does not exist")
+            elif number in seen:
+                problems.append(f"{where} repeats photo {number}, already shown in $.gallery[{seen[number]}]")
+            seen.setdefault(number, i)
+    return problems
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def parse(path=CONTENT_PATH, schema_path=SCHEMA_PATH, photos_dir=PHOTOS_DIR):
+    """
+    Read, validate and freeze the content file
+
+    Args:
+        path (Path): Content JSON file
+        schema_path (Path): JSON Schema the file must satisfy
+        photos_dir (Path): Directory gallery photos are looked up in
+
+    Returns:
+        Content: The validated, immutable content
+
+    Raises:
+        ContentError: Listing every problem found
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        with open(schema_path, encoding="utf-8") as f:
+            schema = json.load(f)
+    except OSError as exc:
+        raise ContentError(path, [f"cannot read {exc.filename}: {exc.strerror}"]) from exc
+    except ValueError as exc:
+        raise ContentError(path, [f"invalid JSON: {exc}"]) from exc
+
+    problems = validate(data, schema)
+    if not problems:
+        problems = _check_photos(data, Path(photos_dir))
+    if problems:
+        raise ContentError(path, problems)
+
+    return Content(
+        education=tuple(TimelineItem(**item) for item in data["education"]),
+        skills=tuple(data["skills"]),
+        experience=tuple(
+            Experience(item["title"], tuple(item.get("details", ())))
+            for item in data["experience"]
+        ),
+        achievements=tuple(data["achievements"]),
+        gallery=tuple(
+            GalleryEvent(item["title"].strip(), tuple(item["photos"]))
+            for item in data["gallery"]
+        ),
+        media=tuple(
+            MediaTab(tab["title"], tuple(
+                MediaItem(
+                    item["type"], item["src"], item.get("caption", ""),
+                    item.get("height", 0), item.get("captioned", False),
+                )
+                for item in tab["items"]
+            ))
+            for tab in data["media"]
+        ),
+    )
+
+
+# The parsed content is kept until the content or schema file's mtime
+# changes, the same way the image manifest is cached.
+_content_cache = {"key": None, "content": None}
+
+
+def load(path=CONTENT_PATH, schema_path=SCHEMA_PATH):
+    """Return the current content, re-parsing it only when a file changes."""
+    try:
+        key = (os.stat(path).st_mtime_ns, os.stat(schema_path).st_mtime_ns)
+    except OSError as exc:
+        raise ContentError(path, [f"cannot read {exc.filename}: {exc.strerror}"]) from exc
+    if key != _content_cache["key"]:
+        _content_cache["content"] = parse(path, schema_path)
+        _content_cache["key"] = key
+    return _content_cache["content"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the portfolio content file.")
+    parser.add_argument("path", nargs="?", type=Path, default=CONTENT_PATH, help="content file (default: content/portfolio.json)")
+    args = parser.parse_args(argv)
+
+    try:
+        content = parse(args.path)
+    except ContentError as exc:
+        print(f"{exc.path}: {len(exc.problems)} problem(s)")
+        for problem in exc.problems:
+            print(f"  - {problem}")
+        raise SystemExit(1)
+    photos = sum(len(event.photos) for event in content.gallery)
+    print(
+        f"ok: {len(content.education)} education entries, {len(content.skills)} skills, "
+        f"{len(content.experience)} experiences, {len(content.achievements)} achievements, "
+        f"{len(content.gallery)} gallery events ({photos} photos), "
+        f"{len(content.media)} media tabs ({sum(len(tab.items) for tab in content.media)} embeds)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# ============================================================================
+# STATIC SITE EXPORT
+# ============================================================================
+# Writes every tab of the portfolio to plain HTML so it can be hosted by any
+# static file server or CDN, with no Python running per request:
+#
+#   dist/index.html, education.html, ..., gallery.html   one page per tab
+#   dist/assets/<name>.<hash>.<ext>                      CSS, fonts, images,
+#                                                        videos, component
+#                                                        documents
+#
+# Pages use the same section code, CSS and markup as the Streamlit app.
+# Asset names carry a content hash, so they can be cached forever.
+#
+# The export directory is replaced on every run. Only a directory holding
+# the export's marker file (.portfolio-export) or nothing at all is ever
+# deleted, so a mistyped --out can't wipe anything else.
+#
+# Usage:   python -m portfolio.export [--out dist]
+# ============================================================================
+
+import argparse
+import hashlib
+import html
+import json
+import shutil
+from pathlib import Path
+
+from portfolio import fonts, styles
+from portfolio.page import HtmlPage
+from portfolio.sections import SECTION_RENDERERS, SECTION_SLUGS
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUT = ROOT / "dist"
+SITE_TITLE = "Akshat Pandey"
+
+# Written into every export directory; only directories with it are cleared
+MARKER = ".portfolio-export"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="{stylesheet}">
+{fonts}
+{head_extra}
+</head>
+<body>
+<div class="stApp">
+<nav class="st-nav" aria-label="Sections">
+{nav}
+</nav>
+<main class="block-container">
+{body}
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+def page_name(slug):
+    """File name of a section's page (Home is the site's index)."""
+    return "index.html" if slug == "home" else f"{slug}.html"
+
+
+class AssetWriter:
+    """
+    Copies files into the export's assets/ folder under content-hashed names
+
+    Args:
+        out_dir (Path): Root of the export; assets go to out_dir/assets
+    """
+
+    def __init__(self, out_dir):
+        self.dir = Path(out_dir) / "assets"
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self._urls = {}
+
+    def __call__(self, source, suffix=None):
+        """Return the URL of `source` (a path, or bytes with a suffix)."""
+        if isinstance(source, bytes):
+            data, stem = source, "component"
+        else:
+            path = Path(source)
+            if not path.is_absolute():
+                path = ROOT / path
+            key = str(path)
+            if key in self._urls:
+                return self._urls[key]
+            data, stem, suffix = path.read_bytes(), path.stem, path.suffix
+        digest = hashlib.sha256(data).hexdigest()[:10]
+        # Files built under a content hash already (fonts, CSS) keep their name
+        name = f"{stem}{suffix}" if stem.endswith(f".{digest}") else f"{stem}.{digest}{suffix}"
+        target = self.dir / name
+        if not target.exists():
+            target.write_bytes(data)
+        url = f"assets/{name}"
+        if not isinstance(source, bytes):
+            self._urls[key] = url
+        return url
+
+
+def _nav(active_slug):
+    links = []
+    for label, slug in SECTION_SLUGS.items():
+        current = ' aria-current="page"' if slug == active_slug else ""
+        links.append(f'<a href="{page_name(slug)}"{current}>{html.escape(label)}</a>')
+    return "\n".join(links)
+
+
+def _deep_link_script():
+    # Keep the app's /?section=<slug> links working on the static index page
+    slugs = json.dumps({slug: page_name(slug) for slug in SECTION_SLUGS.values()})
+    return (
+        "<script>(function(){var p=" + slugs + ","
+        "s=new URLSearchParams(location.search).get('section');"
+        "if(s&&p[s]&&p[s]!=='index.html')location.replace(p[s]);})();</script>"
+    )
+
+
+def _clear(out_dir):
+    """
+    Empty an earlier export directory and mark it as the export's
+
+    Raises:
+        FileExistsError: When out_dir is a file, or a non-empty directory
+            that an export didn't create
+    """
+    if out_dir.exists():
+        if not out_dir.is_dir():
+            raise FileExistsError(f"{out_dir} is not a directory")
+        if not (out_dir / MARKER).is_file() and any(out_dir.iterdir()):
+            raise FileExistsError(
+                f"{out_dir} is not empty and wasn't written by an export; "
+                "choose another --out or remove it first"
+            )
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+    (out_dir / MARKER).write_text("Written by python -m portfolio.export; replaced on every run.\n", encoding="utf-8")
+
+
+def export(out_dir=DEFAULT_OUT, page_class=HtmlPage):
+    """
+    Render every section to HTML and copy the assets it references
+
+    Args:
+        out_dir (Path): Export directory (replaced on every run, see _clear)
+        page_class (type): Render target, called with the AssetWriter; the
+            offline copy (portfolio/pwa.py) links the live app's URLs instead
+
+    Returns:
+        list: Paths of the pages written
+
+    Raises:
+        FileExistsError: When out_dir holds something other than an export
+    """
+    out_dir = Path(out_dir)
+    _clear(out_dir)
+    assets = AssetWriter(out_dir)
+
+    css = styles.build_bundle(styles.STYLESHEETS + ("export.css",))
+    stylesheet = assets(css.encode("utf-8"), ".css")
+    font_tags = fonts.font_tags(assets)
+
+    pages = []
+    for label, slug in SECTION_SLUGS.items():
+        page = page_class(assets)
+        SECTION_RENDERERS[label](page)
+        path = out_dir / page_name(slug)
+        path.write_text(PAGE_TEMPLATE.format(
+            title=html.escape(SITE_TITLE if slug == "home" else f"{label} · {SITE_TITLE}"),
+            stylesheet=stylesheet,
+            fonts=font_tags,
+            head_extra=_deep_link_script() if slug == "home" else "",
+            nav=_nav(slug),
+            body=page.render(),
+        ), encoding="utf-8")
+        pages.append(path)
+    return pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site.")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="output directory (default: dist/)")
+    args = parser.parse_args(argv)
+
+    try:
+        pages = export(args.out)
+    except FileExistsError as exc:
+        parser.error(str(exc))
+    asset_dir = args.out / "assets"
+    size = sum(p.stat().st_size for p in asset_dir.iterdir())
+    print(f"wrote {len(pages)} pages and {len(list(asset_dir.iterdir()))} assets ({size / 1e6:.1f} MB) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+# ============================================================================
+# WEBFONT PIPELINE
+# ============================================================================
+# Serves Poppins from the app itself instead of Google Fonts. The build cuts
+# the font down to the characters the portfolio actually displays (plus
+# printable ASCII, so small text edits don't need a rebuild) and writes it as
+# WOFF2 under a content hash:
+#
+#   fonts/Poppins-Regular.ttf  ->  static/fonts/poppins-400.<hash>.woff2
+#                                  static/fonts/manifest.json
+#
+# The source TTF is committed under fonts/ with its licence (SIL Open Font
+# License, fonts/OFL.txt), so the build needs no network. A face added to
+# FACES without its file is downloaded from the Google Fonts repository on
+# the first build. Until the font is built, text simply falls back to the
+# system sans-serif.
+#
+# Build:   python -m portfolio.fonts [--force]   (needs fonttools and brotli)
+# Runtime: fonts.font_tags(url_for) -> <link rel=preload> + @font-face CSS
+# Display: PORTFOLIO_FONT_DISPLAY environment variable (default "swap")
+# ============================================================================
+
+import argparse
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIR = ROOT / "fonts"
+OUTPUT_DIR = ROOT / "static" / "fonts"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+
+FAMILY = "Poppins"
+
+# Faces to build: CSS font-weight -> source file. The app used to load only
+# the regular weight from Google Fonts; bold text is synthesized from it.
+FACES = {
+    400: "Poppins-Regular.ttf",
+}
+SOURCE_URL = "https://github.com/google/fonts/raw/main/ofl/poppins/{name}"
+
+# Always kept in the subset
+BASE_CHARACTERS = "".join(chr(c) for c in range(0x20, 0x7F))
+
+# How text renders while the font loads (CSS font-display). "swap" shows the
+# fallback font at once and swaps Poppins in, as the Google Fonts link did.
+DEFAULT_FONT_DISPLAY = "swap"
+FONT_DISPLAYS = ("auto", "block", "swap", "fallback", "optional")
+
+# Bump when the subsetting options change so every face is rebuilt
+PIPELINE_VERSION = 1
+
+
+# ============================================================================
+# CHARACTER SET
+# ============================================================================
+
+_TAG = re.compile(r"<(script|style)\b.*?</\1>|<[^>]+>", re.S | re.I)
+
+
+def used_text():
+    """
+    Return the text the portfolio displays, from every section's markup
+
+    Sections are rendered through the static export target, so text inside
+    component documents (timeline, social links) is included too.
+
+    Returns:
+        str: Visible text with tags, scripts and styles removed
+    """
+    from portfolio.page import HtmlPage
+    from portfolio.sections import SECTION_RENDERERS
+
+    documents = []
+
+    def asset_url(source, suffix=None):
+        if isinstance(source, bytes):
+            documents.append(source.decode("utf-8"))
+        return ""
+
+    for render in SECTION_RENDERERS.values():
+        page = HtmlPage(asset_url)
+        render(page)
+        documents.append(page.render())
+    return html.unescape(_TAG.sub(" ", " ".join(documents)))
+
+
+def character_set(text):
+    """Sorted string of the characters to keep: `text` plus BASE_CHARACTERS."""
+    return "".join(sorted(set(text + BASE_CHARACTERS) - set("\n\r\t")))
+
+
+def unicode_range(codepoints):
+    """Compact CSS unicode-range for a set of code points."""
+    ranges = []
+    for cp in sorted(codepoints):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ",".join(f"U+{a:X}" if a == b else f"U+{a:X}-{b:X}" for a, b in ranges)
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def _source(name):
+    """Path of a source TTF in fonts/, downloading one that isn't committed."""
+    path = SOURCE_DIR / name
+    if not path.exists():
+        url = SOURCE_URL.format(name=name)
+        print(f"downloading {url}")
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                data = response.read()
+        except OSError as exc:
+            raise OSError(f"{path.relative_to(ROOT)} is missing and could not be downloaded ({exc})") from None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return path
+
+
+def subset(source, characters):
+    """
+    Subset a font to `characters` and encode it as WOFF2
+
+    Args:
+        source (Path): TTF/OTF file
+        characters (str): Characters to keep
+
+    Returns:
+        tuple: (WOFF2 bytes, set of code points the subset covers)
+    """
+    from fontTools import subset as ft_subset
+
+    options = ft_subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt"]
+    options.name_IDs = [1, 2]
+    options.hinting = False
+    options.desubroutinize = True
+
+    font = ft_subset.load_font(str(source), options)
+    subsetter = ft_subset.Subsetter(options)
+    subsetter.populate(text=characters)
+    subsetter.subset(font)
+    covered = set(font.getBestCmap())
+    out = io.BytesIO()
+    ft_subset.save_font(font, out, options)
+    return out.getvalue(), covered
+
+
+def read_manifest(path=MANIFEST_PATH):
+    """Read the font manifest, returning an empty one if it is missing."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"config": None, "faces": []}
+
+
+def build(force=False):
+    """
+    Subset every face in FACES and write the WOFF2 files and manifest
+
+    Faces whose source and character set are unchanged are skipped.
+
+    Args:
+        force (bool): Rebuild even when nothing changed
+
+    Returns:
+        dict: The manifest written
+    """
+    from portfolio.images import file_digest, write_manifest
+
+    characters = character_set(used_text())
+    chars_digest = hashlib.sha256(characters.encode("utf-8")).hexdigest()[:16]
+    config = {"version": PIPELINE_VERSION, "family": FAMILY, "characters": chars_digest}
+
+    old = read_manifest()
+    previous = {face["weight"]: face for face in old["faces"]} if old["config"] == config else {}
+
+    faces = []
+    for weight, name in sorted(FACES.items()):
+        source = _source(name)
+        digest = file_digest(source)
+        face = previous.get(weight)
+        if force or not face or face["source_digest"] != digest or not (ROOT / face["path"]).exists():
+            data, covered = subset(source, characters)
+            out = OUTPUT_DIR / f"{FAMILY.lower()}-{weight}.{hashlib.sha256(data).hexdigest()[:10]}.woff2"
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_bytes(data)
+            face = {
+                "weight": weight,
+                "path": out.relative_to(ROOT).as_posix(),
+                "bytes": len(data),
+                "source_digest": digest,
+                "source_bytes": source.stat().st_size,
+                "glyphs": len(covered),
+                "unicode_range": unicode_range(covered),
+            }
+        faces.append(face)
+
+    manifest = {"config": config, "faces": faces}
+    write_manifest(manifest, MANIFEST_PATH)
+
+    # Remove faces from earlier builds
+    keep = {ROOT / face["path"] for face in faces}
+    for stale in OUTPUT_DIR.glob("*.woff2"):
+        if stale not in keep:
+            stale.unlink()
+    return manifest
+
+
+# ============================================================================
+# RUNTIME
+# ============================================================================
+
+_manifest_cache = {"mtime": None, "manifest": {"config": None, "faces": []}}
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Return the current manifest, re-reading it only when it changes."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime != _manifest_cache["mtime"]:
+        _manifest_cache["manifest"] = read_manifest(path) if mtime else {"config": None, "faces": []}
+        _manifest_cache["mtime"] = mtime
+    return _manifest_cache["manifest"]
+
+
+def font_display():
+    """The font-display policy from PORTFOLIO_FONT_DISPLAY, or the default."""
+    value = os.environ.get("PORTFOLIO_FONT_DISPLAY", DEFAULT_FONT_DISPLAY).strip().lower()
+    return value if value in FONT_DISPLAYS else DEFAULT_FONT_DISPLAY
+
+
+def font_tags(url_for=None):
+    """
+    Return the markup that loads the self-hosted font
+
+    Args:
+        url_for (callable): Maps a built font path to its URL; raising
+            OSError (or passing None) embeds the font as a data: URL instead,
+            for when static files can't be served
+
+    Returns:
+        str: Preload links and an @font-face <style>, or "" when no font
+            is built (the CSS then falls back to sans-serif)
+    """
+    preloads = []
+    rules = []
+    for face in load_manifest()["faces"]:
+        path = ROOT / face["path"]
+        try:
+            if url_for is None:
+                raise OSError("no URL for static files")
+            url = url_for(face["path"])
+        except OSError:
+            try:
+                url = "data:font/woff2;base64," + base64.b64encode(path.read_bytes()).decode("ascii")
+            except OSError:
+                continue
+        else:
+            # Fetched as soon as the tag is seen, not once the CSS that uses
+            # it has been applied; fonts are always requested in CORS mode
+            preloads.append(f'<link rel="preload" href="{url}" as="font" type="font/woff2" crossorigin>')
+        rules.append(
+            f"@font-face{{font-family:'{FAMILY}';font-style:normal;font-weight:{face['weight']};"
+            f"font-display:{font_display()};src:url({url}) format('woff2');"
+            f"unicode-range:{face['unicode_range']}}}"
+        )
+    if not rules:
+        return ""
+    return "".join(preloads) + f"<style>{''.join(rules)}</style>"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the subset Poppins WOFF2 files in static/fonts/.")
+    parser.add_argument("--force", action="store_true", help="rebuild every face")
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = build(force=args.force)
+    except OSError as exc:
+        parser.exit(1, f"error: {exc}\n")
+    for face in manifest["faces"]:
+        print(
+            f"{FAMILY} {face['weight']}: {face['glyphs']} glyphs, "
+            f"{face['source_bytes'] / 1024:.0f} KB TTF -> {face['bytes'] / 1024:.1f} KB WOFF2 ({face['path']})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# ============================================================================
+# ICON SPRITE
+# ============================================================================
+# Replaces the Font Awesome CDN stylesheet. Markup keeps using the familiar
+# `<i class="fab fa-instagram"></i>` tags; inline() finds the fa-* icons a
+# document actually uses, swaps each tag for an `<svg><use>` reference and
+# prepends a hidden sprite holding only those glyphs. Icons then render
+# without any third-party request, in a few KB instead of the ~100 KB
+# stylesheet plus webfonts.
+#
+# Glyphs are Font Awesome Free 6.5.1 SVGs (icons: CC BY 4.0, see the notice
+# in each file) kept under portfolio/svg/<style>/<name>.svg. To use another
+# icon, copy its SVG from the fontawesome-free package into the matching
+# folder.
+#
+# Runtime: icons.inline(markup) -> markup with sprite, no external requests
+# Inspect: python -m portfolio.icons
+# ============================================================================
+
+import argparse
+import html
+import os
+import re
+from pathlib import Path
+
+SVG_DIR = Path(__file__).resolve().parent / "svg"
+
+# Font Awesome style classes -> glyph folder
+STYLE_DIRS = {
+    "fab": "brands",
+    "fa-brands": "brands",
+    "fas": "solid",
+    "fa-solid": "solid",
+    "far": "regular",
+    "fa-regular": "regular",
+}
+
+# Font Awesome 5 names that version 6 renamed
+ALIASES = {
+    "university": "building-columns",
+}
+
+# Classes that only select the Font Awesome font and are dropped from the SVG
+_FA_CLASSES = set(STYLE_DIRS) | {"fa"}
+
+# Sizes the SVG like the glyph it replaces: one em tall, colored by the text
+ICON_CSS = (
+    ".fa-icon{display:inline-block;height:1em;width:auto;"
+    "overflow:visible;vertical-align:-.125em;fill:currentColor}"
+)
+
+_ICON_TAG = re.compile(r'<i\s+class="([^"]*)"([^>]*)>\s*</i>')
+_VIEWBOX = re.compile(r'viewBox="([^"]+)"')
+_PATHS = re.compile(r"<path\b[^>]*/>")
+
+
+class IconError(LookupError):
+    """Raised when markup uses an icon that has no glyph under portfolio/svg/."""
+
+
+# ============================================================================
+# GLYPHS
+# ============================================================================
+
+_glyph_cache = {}
+
+
+def glyph(style, name):
+    """
+    Load one glyph's viewBox and path elements
+
+    Args:
+        style (str): Glyph folder, e.g. "brands" or "solid"
+        name (str): Icon name without the fa- prefix
+
+    Returns:
+        tuple: (viewBox, path markup)
+
+    Raises:
+        IconError: When there is no SVG for the icon
+    """
+    path = SVG_DIR / style / f"{ALIASES.get(name, name)}.svg"
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        raise IconError(f"no glyph for fa-{name}: add {path.relative_to(SVG_DIR.parent.parent)}") from None
+
+    cached = _glyph_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        source = path.read_text(encoding="utf-8")
+        cached = (mtime, _VIEWBOX.search(source).group(1), "".join(_PATHS.findall(source)))
+        _glyph_cache[path] = cached
+    return cached[1], cached[2]
+
+
+def _parse_classes(classes):
+    """Split a class list into (style, icon name, other classes)."""
+    style = None
+    name = None
+    rest = []
+    for cls in classes.split():
+        if cls in STYLE_DIRS:
+            style = STYLE_DIRS[cls]
+        elif cls.startswith("fa-") and name is None:
+            name = cls[3:]
+        elif cls not in _FA_CLASSES:
+            rest.append(cls)
+    return style or "solid", name, rest
+
+
+def used_icons(markup):
+    """Return the (style, name) pairs of every fa-* icon tag in `markup`."""
+    found = []
+    for match in _ICON_TAG.finditer(markup):
+        style, name, _ = _parse_classes(match.group(1))
+        if name and (style, name) not in found:
+            found.append((style, name))
+    return found
+
+
+def sprite(icons):
+    """
+    Build a hidden SVG sprite with one <symbol> per icon
+
+    Args:
+        icons (list): (style, name) pairs
+
+    Returns:
+        str: Sprite and its CSS, to place before the icons that use it
+    """
+    symbols = []
+    for style, name in icons:
+        view_box, paths = glyph(style, name)
+        symbols.append(f'<symbol id="{_symbol_id(style, name)}" viewBox="{view_box}">{paths}</symbol>')
+    return (
+        f"<style>{ICON_CSS}</style>"
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">'
+        f'{"".join(symbols)}</svg>'
+    )
+
+
+def _symbol_id(style, name):
+    return f"fa-{style}-{name}"
+
+
+# ============================================================================
+# MARKUP REWRITING
+# ============================================================================
+
+_inline_cache = {}
+
+
+def inline(markup):
+    """
+    Replace Font Awesome <i> tags with SVG icons from an inline sprite
+
+    Extra classes and attributes on a tag (e.g. onclick handlers) are kept
+    on the SVG. Results are memoized, since the same markup is rendered on
+    every rerun.
+
+    Args:
+        markup (str): HTML using `<i class="fas fa-...">` icons
+
+    Returns:
+        str: The markup with a sprite of only the icons it uses
+
+    Raises:
+        IconError: When an icon has no glyph under portfolio/svg/
+    """
+    cached = _inline_cache.get(markup)
+    if cached is not None:
+        return cached
+
+    icons = used_icons(markup)
+    if not icons:
+        return markup
+
+    def replace(match):
+        style, name, rest = _parse_classes(match.group(1))
+        if name is None:
+            return match.group(0)
+        view_box, _ = glyph(style, name)
+        classes = html.escape(" ".join(["fa-icon", f"fa-{name}", *rest]))
+        return (
+            f'<svg class="{classes}" viewBox="{view_box}" aria-hidden="true"{match.group(2)}>'
+            f'<use href="#{_symbol_id(style, name)}"/></svg>'
+        )
+
+    result = sprite(icons) + _ICON_TAG.sub(replace, markup)
+    # Markup comes from a handful of templates, so the cache stays small
+    _inline_cache[markup] = result
+    return result
+
+
+def main(argv=None):
+    from portfolio import content, templates
+
+    parser = argparse.ArgumentParser(description="List the icons the portfolio uses and the sprite size.")
+    parser.add_argument("files", nargs="*", help="HTML files to scan (default: the rendered site components)")
+    args = parser.parse_args(argv)
+
+    if args.files:
+        markup = "".join(Path(f).read_text(encoding="utf-8") for f in args.files)
+    else:
+        # Icons written literally in sections.py plus the data-driven timeline
+        markup = (Path(__file__).resolve().parent / "sections.py").read_text(encoding="utf-8")
+        markup += templates.render("timeline.html", education=content.load().education)
+
+    icons = used_icons(markup)
+    for style, name in icons:
+        print(f"{style:8} fa-{name}")
+    print(f"sprite: {len(icons)} icons, {len(sprite(icons).encode('utf-8')) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# ============================================================================
+# IMAGE BYTE CACHE
+# ============================================================================
+# One cache per server process, shared by every session, holding the bytes
+# handed to st.image. Entries are keyed by (path, mtime, size, width), so an
+# edited or rebuilt file is never served stale, and the least recently used
+# entries are dropped once the cache outgrows its memory budget.
+#
+# Budget:  PORTFOLIO_IMAGE_CACHE_MB environment variable (default 64)
+# Runtime: image_cache.get("photos/profile.jpg", 480) -> bytes
+#          image_cache.stats() -> hit/miss/eviction counters
+# ============================================================================
+
+import io
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from portfolio import images
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_BUDGET_MB = 64
+
+# Settings for images resized here because no derivative was built
+RESIZE_OPTIONS = {"quality": 85, "optimize": True, "progressive": True}
+
+
+class ImageCache:
+    """
+    Thread-safe LRU cache of image bytes, bounded by total size
+
+    Args:
+        budget (int): Maximum bytes held; a single larger image is not cached
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, load):
+        """Return the bytes stored under `key`, calling `load()` on a miss."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        # Load outside the lock so slow reads don't block other sessions;
+        # two sessions missing at once just both load the same bytes.
+        data = load()
+        if len(data) > self.budget:
+            return data
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = data
+                self._size += len(data)
+                while self._size > self.budget:
+                    _, dropped = self._entries.popitem(last=False)
+                    self._size -= len(dropped)
+                    self.evictions += 1
+        return data
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        """Counters and current size, for logs and metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "budget": self.budget,
+            }
+
+
+def _budget_from_env():
+    try:
+        megabytes = float(os.environ.get("PORTFOLIO_IMAGE_CACHE_MB", DEFAULT_BUDGET_MB))
+    except ValueError:
+        megabytes = DEFAULT_BUDGET_MB
+    return int(max(megabytes, 0) * 1024 * 1024)
+
+
+_cache = ImageCache(_budget_from_env())
+
+
+def _prepare(path, width):
+    """Read an image, shrinking it to `width` pixels if it is wider."""
+    data = path.read_bytes()
+    if not width:
+        return data
+
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as im:
+        # Compare the upright width: a rotated portrait is stored sideways.
+        # Browsers apply the orientation themselves to the untouched bytes
+        im = ImageOps.exif_transpose(im)
+        if im.width <= width:
+            return data
+        im = im.convert("RGB")
+        im = im.resize((width, round(im.height * width / im.width)), Image.LANCZOS)
+        out = io.BytesIO()
+        im.save(out, format="JPEG", **RESIZE_OPTIONS)
+        return out.getvalue()
+
+
+def get(source, width=None):
+    """
+    Return display-ready bytes for a photo, from memory when possible
+
+    Uses the smallest built derivative that covers `width` (see
+    portfolio/images.py) and otherwise resizes the original itself.
+
+    Args:
+        source (str): Photo path relative to the repo, e.g. "photos/2.jpeg"
+        width (int): Rendered width in device pixels, or None for full size
+
+    Returns:
+        bytes: Encoded image
+
+    Raises:
+        OSError: When the photo does not exist
+    """
+    chosen = images.pick_variant(source, width) if width else source
+    path = ROOT / chosen
+    stat = os.stat(path)
+    key = (chosen, stat.st_mtime_ns, stat.st_size, width)
+    # Derivatives are already sized and encoded; only originals are resized
+    resize_to = width if chosen == source else None
+    return _cache.get(key, lambda: _prepare(path, resize_to))
+
+
+def stats():
+    """Hit/miss/eviction counters and size of the process-wide cache."""
+    return _cache.stats()
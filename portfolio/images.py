@@ -0,0 +1,496 @@
+# ============================================================================
+# IMAGE DERIVATIVE PIPELINE
+# ============================================================================
+# Turns every original photo in photos/ into resized AVIF/WebP/JPEG versions
+# at a fixed set of widths, and keeps a content-hash manifest so only changed
+# photos are rebuilt.
+#
+# JPEG and WebP quality is chosen per derivative: the lowest setting whose
+# SSIM against the resized photo reaches a target (see portfolio/quality.py).
+#
+# The manifest also holds each photo's placeholder (dominant colour and
+# BlurHash, see portfolio/placeholders.py), computed from the same decode.
+# Photos built before placeholders existed get theirs in a batch pass that
+# decodes only those photos, without re-encoding any derivative.
+#
+# Build:   python -m portfolio.images [--workers N] [--force] [--ssim 0.97]
+# Runtime: pick_variant("photos/2.jpeg", 480) -> smallest file that fits
+#          placeholder("photos/2.jpeg") -> {"color", "image"} to paint first
+# ============================================================================
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PHOTOS_DIR = ROOT / "photos"
+OUTPUT_DIR = ROOT / "static" / "img"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+
+SOURCE_SUFFIXES = (".jpeg", ".jpg", ".png")
+WIDTHS = (320, 480, 768, 1200)
+FORMATS = ("avif", "webp", "jpeg")
+EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg"}
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg"}
+
+# Fixed encoder settings per output format. Formats without an entry (JPEG,
+# WebP) get their quality searched per image instead.
+ENCODER_OPTIONS = {
+    "avif": {"quality": 50, "speed": 6},
+}
+
+# Similarity the searched JPEG/WebP encodings must reach, and the quality
+# range searched. The floor keeps colour detail, which SSIM (computed on
+# luminance) does not see.
+SSIM_TARGET = 0.97
+QUALITY_RANGE = (40, 92)
+
+# Metadata never copied into derivatives (orientation is applied instead)
+STRIPPED_METADATA = ("exif", "xmp", "XML:com.adobe.xmp")
+
+# Bump when the derivative layout or encoder settings change so every photo
+# is rebuilt on the next run.
+PIPELINE_VERSION = 2
+
+
+# ============================================================================
+# HASHING AND MANIFEST I/O
+# ============================================================================
+
+def file_digest(path):
+    """Return a short SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def _pipeline_config(ssim_target=SSIM_TARGET):
+    """Describe the settings a manifest was built with."""
+    return {
+        "version": PIPELINE_VERSION,
+        "widths": list(WIDTHS),
+        "formats": list(available_formats()),
+        "encoder": ENCODER_OPTIONS,
+        "ssim_target": ssim_target,
+        "quality_range": list(QUALITY_RANGE),
+    }
+
+
+def available_formats():
+    """Return the output formats the installed Pillow can encode."""
+    from PIL import features
+
+    return tuple(fmt for fmt in FORMATS if fmt == "jpeg" or features.check(fmt))
+
+
+def read_manifest(path=MANIFEST_PATH):
+    """Read a manifest from disk, returning an empty one if it is missing."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"config": None, "images": {}}
+
+
+def write_manifest(manifest, path=MANIFEST_PATH):
+    """Atomically write the manifest so readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+# ============================================================================
+# DERIVATIVE BUILDER (runs inside worker processes)
+# ============================================================================
+
+def _relative(path):
+    return Path(path).resolve().relative_to(ROOT).as_posix()
+
+
+def open_source(path):
+    """
+    Decode a photo upright, as RGB, without EXIF/XMP metadata
+
+    Args:
+        path (Path): Image file
+
+    Returns:
+        PIL.Image.Image: Loaded image
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as im:
+        im = ImageOps.exif_transpose(im)
+        im = im.convert("RGB")
+    for key in STRIPPED_METADATA:
+        im.info.pop(key, None)
+    return im
+
+
+def resize(im, width):
+    """Scale an image down to `width` pixels wide (never up)."""
+    from PIL import Image
+
+    if width >= im.width:
+        return im
+    return im.resize((width, round(im.height * width / im.width)), Image.LANCZOS)
+
+
+def encode(im, fmt, ssim_target=SSIM_TARGET):
+    """
+    Encode an image with the pipeline's settings for `fmt`
+
+    Args:
+        im (PIL.Image.Image): RGB image, already resized
+        fmt (str): "avif", "webp" or "jpeg"
+        ssim_target (float): Similarity searched JPEG/WebP encodings must reach
+
+    Returns:
+        tuple: (bytes, {"quality", "ssim"}) with ssim None for fixed settings
+    """
+    import io
+
+    from portfolio import quality
+
+    if fmt in ENCODER_OPTIONS:
+        out = io.BytesIO()
+        im.save(out, format=fmt.upper(), **ENCODER_OPTIONS[fmt])
+        return out.getvalue(), {"quality": ENCODER_OPTIONS[fmt]["quality"], "ssim": None}
+    result = quality.encode_to_target(im, fmt, ssim_target, *QUALITY_RANGE)
+    return result["data"], {"quality": result["quality"], "ssim": round(result["ssim"], 4)}
+
+
+def build_derivatives(source, digest, output_dir, formats, ssim_target=SSIM_TARGET):
+    """
+    Decode one photo and write every width/format derivative for it
+
+    Args:
+        source (str): Path of the original photo
+        digest (str): Content hash of the original, used in output names
+        output_dir (str): Directory the derivatives are written to
+        formats (tuple): Output formats to encode
+        ssim_target (float): Similarity searched JPEG/WebP encodings must reach
+
+    Returns:
+        dict: Manifest entry describing the original, its placeholder and
+        its variants
+    """
+    from portfolio import placeholders
+
+    source = Path(source)
+    output_dir = Path(output_dir)
+
+    im = open_source(source)
+    width, height = im.size
+
+    # Never upscale: widths larger than the original collapse into one
+    # variant at the original width.
+    targets = sorted({min(w, width) for w in WIDTHS})
+
+    variants = []
+    for target in targets:
+        resized = resize(im, target)
+        for fmt in formats:
+            name = f"{source.stem}-{digest[:8]}-{target}w.{EXTENSIONS[fmt]}"
+            out = output_dir / name
+            data, chosen = encode(resized, fmt, ssim_target)
+            out.write_bytes(data)
+            variants.append({
+                "format": fmt,
+                "width": resized.width,
+                "height": resized.height,
+                "path": _relative(out),
+                "bytes": len(data),
+                **chosen,
+            })
+
+    return {
+        "hash": digest,
+        "width": width,
+        "height": height,
+        "bytes": source.stat().st_size,
+        "placeholder": placeholders.describe(im),
+        "variants": variants,
+    }
+
+
+def build_placeholder(source):
+    """
+    Decode one photo and compute only its placeholder
+
+    Args:
+        source (str): Path of the original photo
+
+    Returns:
+        dict: The manifest entry's "placeholder" field
+    """
+    from portfolio import placeholders
+
+    return placeholders.describe(open_source(Path(source)))
+
+
+# ============================================================================
+# INCREMENTAL BUILD
+# ============================================================================
+
+def _is_fresh(entry, digest):
+    """Check that a manifest entry matches the source and its files exist."""
+    if not entry or entry.get("hash") != digest:
+        return False
+    return all((ROOT / v["path"]).exists() for v in entry.get("variants", []))
+
+
+def _has_placeholder(entry):
+    from portfolio import placeholders
+
+    return (entry.get("placeholder") or {}).get("version") == placeholders.VERSION
+
+
+def build(photos_dir=PHOTOS_DIR, output_dir=OUTPUT_DIR, workers=None, force=False, ssim_target=SSIM_TARGET):
+    """
+    Rebuild derivatives for new or changed photos across a process pool
+
+    Args:
+        photos_dir (Path): Directory holding the original photos
+        output_dir (Path): Directory derivatives and the manifest go to
+        workers (int): Worker process count (defaults to the CPU count)
+        force (bool): Rebuild every photo even if its hash is unchanged
+        ssim_target (float): Similarity searched JPEG/WebP encodings must reach
+
+    Returns:
+        dict: Counts of built, skipped and removed photos, and of skipped
+        photos whose placeholder was (re)computed
+    """
+    photos_dir = Path(photos_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST_PATH.name
+
+    config = _pipeline_config(ssim_target)
+    previous = read_manifest(manifest_path)
+    if previous.get("config") != config:
+        force = True
+    old_images = previous.get("images", {})
+
+    sources = sorted(
+        p for p in photos_dir.iterdir()
+        if p.suffix.lower() in SOURCE_SUFFIXES
+    )
+
+    images = {}
+    jobs = []
+    placeholder_jobs = []
+    for source in sources:
+        key = _relative(source)
+        digest = file_digest(source)
+        if not force and _is_fresh(old_images.get(key), digest):
+            images[key] = old_images[key]
+            if not _has_placeholder(images[key]):
+                placeholder_jobs.append((key, source))
+        else:
+            jobs.append((key, source, digest))
+
+    if jobs or placeholder_jobs:
+        formats = tuple(config["formats"])
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                key: pool.submit(build_derivatives, str(source), digest, str(output_dir), formats, ssim_target)
+                for key, source, digest in jobs
+            }
+            placeholder_futures = {
+                key: pool.submit(build_placeholder, str(source)) for key, source in placeholder_jobs
+            }
+            for key, future in futures.items():
+                images[key] = future.result()
+            for key, future in placeholder_futures.items():
+                images[key] = {**images[key], "placeholder": future.result()}
+
+    # Remove derivatives that no longer belong to any current photo
+    keep = {v["path"] for entry in images.values() for v in entry["variants"]}
+    removed = 0
+    for stale in output_dir.iterdir():
+        if stale.name == manifest_path.name or not stale.is_file():
+            continue
+        if _relative(stale) not in keep:
+            stale.unlink()
+            removed += 1
+
+    write_manifest({"config": config, "images": images}, manifest_path)
+    return {
+        "built": len(jobs),
+        "skipped": len(sources) - len(jobs),
+        "removed": removed,
+        "placeholders": len(placeholder_jobs),
+    }
+
+
+# ============================================================================
+# RUNTIME LOOKUP
+# ============================================================================
+# The manifest is re-read only when its mtime changes, so a rebuild is picked
+# up by running sessions without a restart.
+
+_manifest_cache = {"mtime": None, "manifest": {"config": None, "images": {}}}
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Return the current manifest, re-reading it only when it changes."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime != _manifest_cache["mtime"]:
+        _manifest_cache["manifest"] = read_manifest(path) if mtime else {"config": None, "images": {}}
+        _manifest_cache["mtime"] = mtime
+    return _manifest_cache["manifest"]
+
+
+def pick_variant(source, width, formats=("jpeg",)):
+    """
+    Pick the smallest derivative of a photo that is at least `width` wide
+
+    Args:
+        source (str): Original photo path relative to the repo, e.g. "photos/2.jpeg"
+        width (int): Rendered width in device pixels the image must cover
+        formats (tuple): Acceptable output formats
+
+    Returns:
+        str: Path of the chosen derivative, or `source` when none is built
+    """
+    entry = load_manifest()["images"].get(Path(source).as_posix())
+    if not entry:
+        return source
+
+    candidates = [v for v in entry["variants"] if v["format"] in formats]
+    if not candidates:
+        return source
+
+    wide_enough = [v for v in candidates if v["width"] >= min(width, entry["width"])]
+    pool = wide_enough or [max(candidates, key=lambda v: v["width"])]
+    best = min(pool, key=lambda v: (v["bytes"], v["width"]))
+    return best["path"] if (ROOT / best["path"]).exists() else source
+
+
+def variant_set(source):
+    """
+    List every built derivative of a photo, grouped by format
+
+    Used to write `srcset` attributes, where the browser picks the width.
+
+    Args:
+        source (str): Original photo path relative to the repo, e.g. "photos/2.jpeg"
+
+    Returns:
+        dict: {"width", "height", "formats": {format: [variant, ...]}} with
+        each format's variants sorted by width, or None when nothing is built
+    """
+    entry = load_manifest()["images"].get(Path(source).as_posix())
+    if not entry or not entry["variants"]:
+        return None
+
+    formats = {}
+    for variant in sorted(entry["variants"], key=lambda v: v["width"]):
+        formats.setdefault(variant["format"], []).append(variant)
+    return {"width": entry["width"], "height": entry["height"], "formats": formats}
+
+
+def placeholder(source):
+    """
+    What to paint in a photo's place until its bytes arrive
+
+    Args:
+        source (str): Original photo path relative to the repo, e.g. "photos/2.jpeg"
+
+    Returns:
+        dict: {"color": "#rrggbb", "image": data: URI of the blurred preview},
+        or None when the manifest has no current placeholder for the photo
+    """
+    from portfolio import placeholders
+
+    entry = load_manifest()["images"].get(Path(source).as_posix())
+    if not entry or not _has_placeholder(entry):
+        return None
+    fields = entry["placeholder"]
+    try:
+        image = placeholders.preview(fields["blurhash"], entry["width"], entry["height"])
+    except ValueError:
+        return None
+    return {"color": fields["color"], "image": image}
+
+
+_size_cache = {}
+
+
+def source_size(source):
+    """
+    Return a photo's upright (width, height) without decoding it
+
+    Taken from the manifest when the photo is built, otherwise read from the
+    file header (and remembered until the file changes).
+
+    Args:
+        source (str): Original photo path relative to the repo
+
+    Returns:
+        tuple: (width, height) in pixels
+
+    Raises:
+        OSError: When the photo does not exist
+    """
+    entry = load_manifest()["images"].get(Path(source).as_posix())
+    if entry:
+        return entry["width"], entry["height"]
+
+    from PIL import Image
+
+    path = ROOT / source
+    mtime = os.stat(path).st_mtime_ns
+    cached = _size_cache.get(source)
+    if cached is None or cached[0] != mtime:
+        with Image.open(path) as im:
+            width, height = im.size
+            # EXIF orientations 5-8 are rotated by 90 degrees
+            if im.getexif().get(0x0112) in (5, 6, 7, 8):
+                width, height = height, width
+        cached = _size_cache[source] = (mtime, (width, height))
+    return cached[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build resized AVIF/WebP/JPEG versions of photos/.")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild every photo")
+    parser.add_argument("--ssim", type=float, default=SSIM_TARGET, help=f"SSIM target for JPEG/WebP (default {SSIM_TARGET})")
+    args = parser.parse_args(argv)
+
+    stats = build(workers=args.workers, force=args.force, ssim_target=args.ssim)
+    manifest = read_manifest()
+    original = sum(e["bytes"] for e in manifest["images"].values())
+    print(
+        f"built {stats['built']}, unchanged {stats['skipped']} "
+        f"({stats['placeholders']} given placeholders), "
+        f"removed {stats['removed']} stale files; originals {original / 1e6:.1f} MB"
+    )
+    for fmt in manifest["config"]["formats"]:
+        variants = [v for e in manifest["images"].values() for v in e["variants"] if v["format"] == fmt]
+        qualities = sorted(v["quality"] for v in variants)
+        if not qualities:
+            # No photos, or an encoder missing for this format
+            print(f"  {fmt:5} no files")
+            continue
+        print(
+            f"  {fmt:5} {len(variants)} files, {sum(v['bytes'] for v in variants) / 1e6:.1f} MB, "
+            f"quality {qualities[0]}-{qualities[-1]} (median {qualities[len(qualities) // 2]})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+# ============================================================================
+# RENDER METRICS
+# ============================================================================
+# Optional instrumentation of each script run: how long every tab (and every
+# gallery event within it) takes to render, and how many elements and bytes
+# it sends. main.py opens a run and a section per tab, render_gallery opens
+# a nested section per event, and StreamlitPage reports every element it
+# sends, so the sections themselves need no changes to be measured.
+#
+# Off by default; when off, section() hands back a shared no-op context and
+# record() returns straight away. Turn it on with either:
+#
+#   PORTFOLIO_METRICS=1          totals served as Prometheus text on
+#                                GET /metrics (streamlit run app.py)
+#   PORTFOLIO_METRICS_LOG=path   also append one JSON line per run to a
+#                                rotating log (PORTFOLIO_METRICS_LOG_MB per
+#                                file, default 10, five backups kept)
+#
+# Runtime: metrics.begin_run() ... with metrics.section("gallery"): ...
+#          metrics.end_run(); metrics.record("markdown", body)
+# ============================================================================
+
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime, timezone
+
+METRICS_ROUTE = "/metrics"
+
+DEFAULT_LOG_MB = 10
+LOG_BACKUPS = 5
+
+_TRUE = ("1", "true", "yes", "on")
+
+LOG_PATH = os.environ.get("PORTFOLIO_METRICS_LOG") or None
+ENABLED = os.environ.get("PORTFOLIO_METRICS", "").strip().lower() in _TRUE or LOG_PATH is not None
+
+_NULL = nullcontext()
+_local = threading.local()
+_lock = threading.Lock()
+
+# Totals since the process started, served on /metrics
+_totals = {
+    "runs": 0,
+    "run_seconds": 0.0,
+    "sections": {},   # name -> {"count", "seconds", "elements", "bytes"}
+    "kinds": {},      # element kind -> {"elements", "bytes"}
+}
+
+_logger = None
+
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+def _size(payload):
+    if isinstance(payload, str):
+        if payload.startswith(("http://", "https://")):
+            return len(payload)
+        # Local files (st.video) are sent in full through the media endpoint
+        if len(payload) < 256 and os.path.isfile(payload):
+            return os.path.getsize(payload)
+        return len(payload.encode("utf-8"))
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return len(payload)
+    return 0
+
+
+def begin_run():
+    """Start measuring a script run on this thread (no-op when disabled)."""
+    if not ENABLED:
+        return
+    _local.run = {"start": time.perf_counter(), "sections": {}, "kinds": {}}
+    _local.stack = []
+
+
+def end_run():
+    """
+    Finish the run started by begin_run() and publish it
+
+    A run cut short (st.stop, a rerun) never gets here and is dropped.
+    """
+    run = getattr(_local, "run", None)
+    if run is None:
+        return
+    _local.run = None
+    seconds = time.perf_counter() - run["start"]
+
+    with _lock:
+        _totals["runs"] += 1
+        _totals["run_seconds"] += seconds
+        for name, stats in run["sections"].items():
+            total = _totals["sections"].setdefault(name, {"count": 0, "seconds": 0.0, "elements": 0, "bytes": 0})
+            for key, value in stats.items():
+                total[key] += value
+        for kind, stats in run["kinds"].items():
+            total = _totals["kinds"].setdefault(kind, {"elements": 0, "bytes": 0})
+            for key, value in stats.items():
+                total[key] += value
+
+    logger = _run_logger()
+    if logger:
+        logger.info(json.dumps({
+            "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "seconds": round(seconds, 4),
+            "sections": {
+                name: dict(stats, seconds=round(stats["seconds"], 6)) for name, stats in run["sections"].items()
+            },
+            "kinds": run["kinds"],
+        }, separators=(",", ":")))
+
+
+class _Section:
+    """Times a section and collects the elements sent while it is open."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        _local.stack.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        path = "/".join(_local.stack)
+        _local.stack.pop()
+        stats = _local.run["sections"].setdefault(path, {"count": 0, "seconds": 0.0, "elements": 0, "bytes": 0})
+        stats["count"] += 1
+        stats["seconds"] += elapsed
+        return False
+
+
+def section(name):
+    """
+    Measure the code in a `with` block as a named section of the current run
+
+    Sections nest: a section opened inside "gallery" is reported as
+    "gallery/<name>", and its elements count towards both.
+
+    Args:
+        name (str): Section name, e.g. a tab slug or gallery event title
+
+    Returns:
+        A context manager; a shared no-op one when metrics are off or no run
+        is being measured (e.g. the static export)
+    """
+    if not ENABLED or getattr(_local, "run", None) is None:
+        return _NULL
+    return _Section(name)
+
+
+def record(kind, payload):
+    """
+    Count one element sent to the browser against every open section
+
+    Args:
+        kind (str): Element type, e.g. "markdown", "component", "image"
+        payload (str | bytes): What was sent: markup, image bytes, or a
+            video URL or file path; only measured when metrics are on
+    """
+    if not ENABLED:
+        return
+    run = getattr(_local, "run", None)
+    if run is None:
+        return
+    size = _size(payload)
+    stats = run["kinds"].setdefault(kind, {"elements": 0, "bytes": 0})
+    stats["elements"] += 1
+    stats["bytes"] += size
+
+    path = []
+    for name in _local.stack:
+        path.append(name)
+        stats = run["sections"].setdefault("/".join(path), {"count": 0, "seconds": 0.0, "elements": 0, "bytes": 0})
+        stats["elements"] += 1
+        stats["bytes"] += size
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def _log_bytes():
+    try:
+        megabytes = float(os.environ.get("PORTFOLIO_METRICS_LOG_MB", DEFAULT_LOG_MB))
+    except ValueError:
+        megabytes = DEFAULT_LOG_MB
+    return int(max(megabytes, 0.1) * 1024 * 1024)
+
+
+def _run_logger():
+    global _logger
+    if LOG_PATH is None:
+        return None
+    with _lock:
+        if _logger is None:
+            os.makedirs(os.path.dirname(os.path.abspath(LOG_PATH)), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                LOG_PATH, maxBytes=_log_bytes(), backupCount=LOG_BACKUPS, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.getLogger("portfolio.metrics")
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            _logger = logger
+    return _logger
+
+
+def snapshot():
+    """A copy of the process-wide totals."""
+    with _lock:
+        return json.loads(json.dumps(_totals))
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """
+    The totals in the Prometheus text exposition format
+
+    Returns:
+        str: Counters per section and per element kind, plus the image byte
+            cache's counters
+    """
+    from portfolio import image_cache
+
+    totals = snapshot()
+    lines = [
+        "# HELP portfolio_script_runs_total Script runs measured.",
+        "# TYPE portfolio_script_runs_total counter",
+        f"portfolio_script_runs_total {totals['runs']}",
+        "# HELP portfolio_script_seconds_total Wall time spent in measured script runs.",
+        "# TYPE portfolio_script_seconds_total counter",
+        f"portfolio_script_seconds_total {totals['run_seconds']:.6f}",
+    ]
+
+    series = [
+        ("portfolio_section_renders_total", "Times each section was rendered.", "count", "{}"),
+        ("portfolio_section_seconds_total", "Wall time spent rendering each section.", "seconds", "{:.6f}"),
+        ("portfolio_section_elements_total", "Elements sent by each section.", "elements", "{}"),
+        ("portfolio_section_bytes_total", "Bytes sent by each section.", "bytes", "{}"),
+    ]
+    for metric, help_text, key, fmt in series:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        for name, stats in sorted(totals["sections"].items()):
+            lines.append(f'{metric}{{section="{_label(name)}"}} {fmt.format(stats[key])}')
+
+    for metric, help_text, key in (
+        ("portfolio_elements_total", "Elements sent, by kind.", "elements"),
+        ("portfolio_element_bytes_total", "Bytes sent, by element kind.", "bytes"),
+    ):
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        for kind, stats in sorted(totals["kinds"].items()):
+            lines.append(f'{metric}{{kind="{_label(kind)}"}} {stats[key]}')
+
+    cache = image_cache.stats()
+    lines += [
+        "# HELP portfolio_image_cache_lookups_total Image byte cache lookups.",
+        "# TYPE portfolio_image_cache_lookups_total counter",
+        f'portfolio_image_cache_lookups_total{{result="hit"}} {cache["hits"]}',
+        f'portfolio_image_cache_lookups_total{{result="miss"}} {cache["misses"]}',
+        "# HELP portfolio_image_cache_bytes Bytes held by the image byte cache.",
+        "# TYPE portfolio_image_cache_bytes gauge",
+        f"portfolio_image_cache_bytes {cache['bytes']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+async def serve_metrics(request):
+    """GET /metrics : the totals as Prometheus text (404 when disabled)."""
+    from starlette.responses import PlainTextResponse
+
+    if not ENABLED:
+        return PlainTextResponse("Metrics are off (set PORTFOLIO_METRICS=1)", status_code=404)
+    return PlainTextResponse(prometheus_text(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,286 @@
+# ============================================================================
+# RENDER TARGETS
+# ============================================================================
+# The section renderers in portfolio/sections.py draw through a small "ui"
+# object instead of calling Streamlit directly, so the same code can build
+# the live app (StreamlitPage) or plain HTML for the static export (HtmlPage).
+#
+# Both targets support the same calls:
+#   ui.markdown(html)            raw HTML block
+#   ui.text(text)                paragraph of plain text (st.write)
+#   ui.subheader(text)
+#   ui.component(html, height)   HTML document in an iframe (optional title)
+#   ui.image(path, width)        full-width image, sized for `width` device px
+#   ui.video(src)                YouTube embed URL or local video file
+#   ui.error(message)
+#   ui.columns(spec)             -> containers used with `with`
+#   ui.tabs(labels, **kwargs)    -> containers used with `with`, with `.open`
+#   ui.static_url(path)          URL for a file under static/, for raw HTML
+#   ui.resize_url(photo, w, fmt) URL of a photo resized on demand
+#   ui.video_url(path)           URL a local video is streamed from
+# ============================================================================
+
+import html
+import itertools
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from portfolio import assets, image_cache, images, metrics, server
+
+ROOT = Path(__file__).resolve().parent.parent
+STATIC_DIR = ROOT / "static"
+
+# Published component documents live two levels below the app root
+# (assets/components/); srcdoc frames resolve URLs against the page, so the
+# files get a <base> pointing back at it. srcdoc documents never render in
+# quirks mode, hence the doctype.
+COMPONENT_HEAD = '<!DOCTYPE html><meta charset="utf-8"><base href="../../">'
+COMPONENT_NO_SCROLL = "<style>html,body{overflow:hidden}</style>"
+
+
+class StreamlitPage:
+    """
+    Render target that forwards every call to Streamlit
+
+    Every element sent is also reported to portfolio/metrics.py, which only
+    measures it when metrics are turned on.
+
+    When the app serves the /assets route (app.py), component documents are
+    published as precompressed files and framed with st.iframe, and static
+    files are linked through the route; otherwise components are srcdoc
+    frames and static files are linked at app/static/.
+    """
+
+    def markdown(self, body):
+        metrics.record("markdown", body)
+        st.markdown(body, unsafe_allow_html=True)
+
+    def text(self, body):
+        metrics.record("text", body)
+        st.write(body)
+
+    def subheader(self, body):
+        metrics.record("text", body)
+        st.subheader(body)
+
+    def component(self, body, height, scrolling=False, title=None):
+        metrics.record("component", body)
+        src = self.component_src(body, scrolling)
+        if src:
+            st.iframe(src, height=height, alt=title)
+        else:
+            components.html(body, height=height, scrolling=scrolling)
+
+    def component_src(self, body, scrolling=False):
+        """
+        Publish a component document as a precompressed asset
+
+        Returns:
+            str: Its URL on the /assets route, absolute as st.iframe needs;
+                None when the route isn't being served (main.py)
+        """
+        if not server.routes_mounted():
+            return None
+        head = COMPONENT_HEAD if scrolling else COMPONENT_HEAD + COMPONENT_NO_SCROLL
+        try:
+            url = server.asset_url(assets.publish(head + body, ".html"))
+        except OSError:
+            return None
+        base = st.get_option("server.baseUrlPath").strip("/")
+        return f"/{base}/{url}" if base else f"/{url}"
+
+    def image(self, path, width=None):
+        # Bytes come from the process-wide cache instead of disk on each run
+        data = image_cache.get(path, width)
+        metrics.record("image", data)
+        st.image(data, use_container_width=True)
+
+    def video(self, src):
+        metrics.record("video", src)
+        st.video(src)
+
+    def error(self, message):
+        metrics.record("text", message)
+        st.error(message)
+
+    def columns(self, spec):
+        return st.columns(spec)
+
+    def tabs(self, labels, **kwargs):
+        return st.tabs(labels, **kwargs)
+
+    def static_url(self, path):
+        """
+        URL of a file under static/: on the /assets route when it is served,
+        which sends precompressed copies, else Streamlit's app/static/...
+
+        Raises:
+            OSError: When neither is served or the file is outside static/
+        """
+        if server.routes_mounted():
+            return server.asset_url(path)
+        if not st.get_option("server.enableStaticServing"):
+            raise OSError("server.enableStaticServing is off")
+        try:
+            relative = (ROOT / path).resolve().relative_to(STATIC_DIR)
+        except ValueError:
+            raise OSError(f"{path} is not under static/") from None
+        return f"app/static/{relative.as_posix()}"
+
+    def resize_url(self, source, width, fmt="auto"):
+        """
+        URL of `source` on the /img resize route (portfolio/server.py)
+
+        Raises:
+            OSError: When the app was started without the route (main.py)
+        """
+        return server.image_url(source, width, fmt)
+
+    def video_url(self, source):
+        """
+        URL of a local video on the /video streaming route
+
+        Raises:
+            OSError: When the app was started without the route (main.py)
+        """
+        return server.video_url(source)
+
+
+class _Slot:
+    """A column or tab of an HtmlPage; `with slot:` redirects output into it"""
+
+    def __init__(self, page, label=None):
+        self.page = page
+        self.label = label
+        self.parts = []
+        # Static pages have no reruns, so every tab is rendered up front
+        self.open = True
+
+    def __enter__(self):
+        self.page._stack.append(self.parts)
+        return self
+
+    def __exit__(self, *exc):
+        self.page._stack.pop()
+        return False
+
+
+class HtmlPage:
+    """
+    Render target that collects plain HTML, mirroring Streamlit's markup
+
+    Files referenced by the section (images, local videos, component
+    documents) are handed to `asset_url(path_or_bytes, suffix)`, which copies
+    them somewhere servable and returns the URL to use.
+
+    Args:
+        asset_url (callable): Maps a file path (or bytes plus a suffix) to a URL
+    """
+
+    def __init__(self, asset_url):
+        self.asset_url = asset_url
+        self.parts = []
+        self._stack = [self.parts]
+        # Per page, so the same sections always export to the same HTML
+        self._ids = itertools.count()
+
+    def _emit(self, fragment):
+        self._stack[-1].append(fragment)
+
+    def render(self):
+        return "\n".join(_flatten(self.parts))
+
+    def markdown(self, body):
+        self._emit(body)
+
+    def text(self, body):
+        self._emit(f"<p>{html.escape(' '.join(body.split()))}</p>")
+
+    def subheader(self, body):
+        self._emit(f'<h3 data-testid="stSubheader">{html.escape(body)}</h3>')
+
+    def component(self, body, height, scrolling=False, title=None):
+        # Component documents are written to assets/, one level below the
+        # page. In Streamlit they are srcdoc frames that resolve URLs against
+        # the page, so do the same here.
+        body = '<base href="../">' + body
+        src = self.asset_url(body.encode("utf-8"), ".html")
+        title = f' title="{html.escape(title)}"' if title else ""
+        self._emit(
+            f'<iframe class="st-component" src="{src}" height="{height}"{title} '
+            f'scrolling="{"yes" if scrolling else "no"}" loading="lazy"></iframe>'
+        )
+
+    def image(self, path, width=None):
+        try:
+            src = self.asset_url(images.pick_variant(path, width) if width else path)
+        except OSError:
+            self.error(f"Image {path} not found")
+            return
+        self._emit(f'<div data-testid="stImage"><img src="{src}" alt="" loading="lazy"></div>')
+
+    def video(self, src):
+        if src.startswith(("http://", "https://")):
+            self._emit(
+                f'<iframe class="st-video" src="{html.escape(src)}" loading="lazy" '
+                'allow="accelerometer; autoplay; encrypted-media; picture-in-picture" allowfullscreen></iframe>'
+            )
+            return
+        try:
+            url = self.asset_url(src)
+        except OSError:
+            self.error(f"Video {src} not found")
+            return
+        self._emit(f'<video class="st-video" src="{url}" controls preload="metadata"></video>')
+
+    def error(self, message):
+        self._emit(f'<div class="st-error" role="alert">{html.escape(message)}</div>')
+
+    def static_url(self, path):
+        return self.asset_url(path)
+
+    def resize_url(self, source, width, fmt="auto"):
+        # A static site has no server to resize on; callers fall back to the
+        # prebuilt derivatives
+        raise OSError("static export has no resize route")
+
+    def video_url(self, source):
+        # Static hosts serve range requests for plain files themselves
+        return self.asset_url(source)
+
+    def columns(self, spec):
+        weights = [1] * spec if isinstance(spec, int) else list(spec)
+        slots = [_Slot(self) for _ in weights]
+        self._emit(lambda: '<div class="st-columns">' + "".join(
+            f'<div class="st-column" style="flex:{w} 1 0">{"".join(_flatten(s.parts))}</div>'
+            for w, s in zip(weights, slots)
+        ) + "</div>")
+        return slots
+
+    def tabs(self, labels, **kwargs):
+        # CSS-only tabs: a radio input + label per tab selects which panel shows
+        group = f"tabs-{next(self._ids)}"
+        slots = [_Slot(self, label) for label in labels]
+
+        def markup():
+            out = []
+            for i, slot in enumerate(slots):
+                tab_id = f"{group}-{i}"
+                out.append(
+                    f'<input type="radio" name="{group}" id="{tab_id}"{" checked" if i == 0 else ""}>'
+                    f'<label for="{tab_id}">{html.escape(slot.label)}</label>'
+                    f'<div class="st-tab-panel">{"".join(_flatten(slot.parts))}</div>'
+                )
+            return '<div class="st-tabs">' + "".join(out) + "</div>"
+
+        self._emit(markup)
+        return slots
+
+
+def _flatten(parts):
+    # Columns and tabs are emitted as callables so their content can be
+    # filled in after they were created, just like Streamlit containers.
+    for part in parts:
+        yield part() if callable(part) else part
@@ -0,0 +1,268 @@
+# ============================================================================
+# PHOTO PLACEHOLDERS
+# ============================================================================
+# Lets a photo's space be painted before any of its bytes arrive. For every
+# photo the image build (portfolio/images.py) stores in static/img/
+# manifest.json:
+#
+#   color      the dominant colour, as "#rrggbb"
+#   blurhash   a BlurHash string (https://blurha.sh): the photo's low
+#              frequencies in ~30 characters
+#
+# The page draws the photo's <img> (sized by its width/height attributes)
+# over a background of that colour and a tiny WebP decoded from the
+# BlurHash, which the browser scales up into a soft blur. Both are computed
+# with NumPy on a thumbnail, from the decode the build does anyway.
+#
+# Try:     python -m portfolio.placeholders photos/2.jpeg [--components 4x3]
+# ============================================================================
+
+import argparse
+import base64
+import io
+
+import numpy as np
+
+# Horizontal x vertical cosine components of the BlurHash (1-9 each)
+COMPONENTS = (4, 3)
+
+# Longest side of the thumbnail the placeholder is computed from
+SAMPLE_SIZE = 64
+
+# Longest side of the decoded preview sent with the page, and its WebP
+# quality: ~100 bytes inline (a PNG of the same pixels is ~250). It is
+# blurred by scaling up, so neither more pixels nor lossless encoding add
+# anything visible
+PREVIEW_SIZE = 8
+PREVIEW_QUALITY = 80
+
+# Bits per channel of the colour histogram the dominant colour comes from
+COLOR_BITS = 4
+
+# Bump when the output changes, so the build recomputes every placeholder
+VERSION = 1
+
+_BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+_previews = {}
+
+
+# ============================================================================
+# COLOUR SPACES AND BASE 83
+# ============================================================================
+
+def srgb_to_linear(values):
+    """8-bit sRGB values (any shape) to linear light in 0..1."""
+    v = np.asarray(values, dtype=np.float64) / 255
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(values):
+    """Linear light (any shape) to rounded 8-bit sRGB values."""
+    v = np.clip(values, 0, 1)
+    v = np.where(v <= 0.0031308, v * 12.92, 1.055 * v ** (1 / 2.4) - 0.055)
+    return np.rint(v * 255).astype(np.uint8)
+
+
+def _encode83(value, length):
+    return "".join(_BASE83[(value // 83 ** (length - 1 - i)) % 83] for i in range(length))
+
+
+def _decode83(text):
+    value = 0
+    for char in text:
+        value = value * 83 + _BASE83.index(char)
+    return value
+
+
+def _basis(count, size):
+    """cos(pi * k * p / size) for every component k and pixel p."""
+    return np.cos(np.pi * np.outer(np.arange(count), np.arange(size)) / size)
+
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def thumbnail(im):
+    """Shrink a decoded photo to the sample size placeholders are computed on."""
+    from PIL import Image
+
+    small = im.convert("RGB")
+    small.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE), Image.BOX)
+    return small
+
+
+def dominant_color(pixels):
+    """
+    The most common colour of an image, as "#rrggbb"
+
+    Pixels are binned by their top COLOR_BITS bits per channel; the answer
+    is the mean of the fullest bin, so it is a colour the photo really has
+    (unlike the mean of all pixels, which turns greys and browns muddy).
+
+    Args:
+        pixels (ndarray): (height, width, 3) uint8 RGB
+
+    Returns:
+        str: Hex colour
+    """
+    flat = pixels.reshape(-1, 3)
+    shift = 8 - COLOR_BITS
+    bins = flat >> shift
+    keys = (bins[:, 0].astype(np.int32) << (2 * COLOR_BITS)) | (bins[:, 1].astype(np.int32) << COLOR_BITS) | bins[:, 2]
+    fullest = np.bincount(keys).argmax()
+    r, g, b = np.rint(flat[keys == fullest].mean(axis=0)).astype(int)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def blurhash(pixels, components=COMPONENTS):
+    """
+    Encode an image as a BlurHash string
+
+    Every component is one matrix product over the whole image: the basis
+    rows for x and y against the pixels in linear light.
+
+    Args:
+        pixels (ndarray): (height, width, 3) uint8 RGB, ideally a thumbnail
+        components (tuple): (x, y) component counts, 1-9 each
+
+    Returns:
+        str: BlurHash, 4 + 2 * x * y characters
+    """
+    nx, ny = components
+    height, width = pixels.shape[:2]
+    linear = srgb_to_linear(pixels)
+    # factors[j, i] = mean of basis_y[j] * basis_x[i] * pixel, doubled for AC
+    factors = np.einsum("jy,yxc,ix->jic", _basis(ny, height), linear, _basis(nx, width)) / (width * height)
+    factors[1:] *= 2
+    factors[0, 1:] *= 2
+    factors = factors.reshape(-1, 3)
+    dc, ac = factors[0], factors[1:]
+
+    text = _encode83((nx - 1) + (ny - 1) * 9, 1)
+    if len(ac):
+        quantised_max = int(np.clip(np.floor(np.abs(ac).max() * 166 - 0.5), 0, 82))
+        maximum = (quantised_max + 1) / 166
+    else:
+        quantised_max, maximum = 0, 1
+    text += _encode83(quantised_max, 1)
+
+    r, g, b = (int(v) for v in linear_to_srgb(dc))
+    text += _encode83((r << 16) | (g << 8) | b, 4)
+
+    scaled = np.sign(ac) * np.sqrt(np.abs(ac / maximum))
+    quantised = np.clip(np.floor(scaled * 9 + 9.5), 0, 18).astype(int)
+    for qr, qg, qb in quantised:
+        text += _encode83(qr * 19 * 19 + qg * 19 + qb, 2)
+    return text
+
+
+def describe(im):
+    """
+    Placeholder fields for a decoded photo
+
+    Args:
+        im (PIL.Image.Image): The photo, upright
+
+    Returns:
+        dict: {"version", "color", "blurhash"} for the image manifest
+    """
+    pixels = np.asarray(thumbnail(im))
+    return {"version": VERSION, "color": dominant_color(pixels), "blurhash": blurhash(pixels)}
+
+
+# ============================================================================
+# DECODING
+# ============================================================================
+
+def decode(text, width, height):
+    """
+    Decode a BlurHash string to pixels
+
+    Args:
+        text (str): BlurHash
+        width (int): Output width in pixels
+        height (int): Output height in pixels
+
+    Returns:
+        ndarray: (height, width, 3) uint8 RGB
+
+    Raises:
+        ValueError: When the string is not a valid BlurHash
+    """
+    if len(text) < 6:
+        raise ValueError(f"not a BlurHash: {text!r}")
+    try:
+        size_flag = _decode83(text[0])
+        nx, ny = size_flag % 9 + 1, size_flag // 9 + 1
+        if len(text) != 4 + 2 * nx * ny:
+            raise ValueError(f"BlurHash length doesn't match its components: {text!r}")
+        maximum = (_decode83(text[1]) + 1) / 166
+        dc = _decode83(text[2:6])
+        colors = [srgb_to_linear([dc >> 16, (dc >> 8) & 255, dc & 255])]
+        for k in range(1, nx * ny):
+            value = _decode83(text[4 + 2 * k:6 + 2 * k])
+            quantised = np.array([value // (19 * 19), (value // 19) % 19, value % 19])
+            scaled = (quantised - 9) / 9
+            colors.append(np.sign(scaled) * scaled ** 2 * maximum)
+    except IndexError:
+        raise ValueError(f"not a BlurHash: {text!r}") from None
+
+    colors = np.array(colors).reshape(ny, nx, 3)
+    linear = np.einsum("jy,jic,ix->yxc", _basis(ny, height), colors, _basis(nx, width))
+    return linear_to_srgb(linear)
+
+
+def preview(text, width, height):
+    """
+    A tiny WebP of a BlurHash at a photo's aspect ratio, as a data: URI
+
+    Remembered per hash and size, so rendering a page decodes each once.
+
+    Args:
+        text (str): BlurHash
+        width (int): Width of the photo
+        height (int): Height of the photo
+
+    Returns:
+        str: data:image/webp;base64,...
+
+    Raises:
+        ValueError: When the string is not a valid BlurHash
+    """
+    from PIL import Image
+
+    scale = PREVIEW_SIZE / max(width, height)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    key = (text, size)
+    uri = _previews.get(key)
+    if uri is None:
+        out = io.BytesIO()
+        Image.fromarray(decode(text, *size)).save(out, "WEBP", quality=PREVIEW_QUALITY, method=6)
+        uri = "data:image/webp;base64," + base64.b64encode(out.getvalue()).decode("ascii")
+        _previews[key] = uri
+    return uri
+
+
+def main(argv=None):
+    from portfolio import images
+
+    parser = argparse.ArgumentParser(description="Show the placeholder of a photo.")
+    parser.add_argument("photo", help="photo file, e.g. photos/2.jpeg")
+    parser.add_argument("--components", default="x".join(map(str, COMPONENTS)), help="BlurHash components, e.g. 4x3")
+    args = parser.parse_args(argv)
+
+    components = tuple(int(n) for n in args.components.split("x"))
+    im = images.open_source(args.photo)
+    pixels = np.asarray(thumbnail(im))
+    text = blurhash(pixels, components)
+    uri = preview(text, *im.size)
+    print(f"size      {im.width}x{im.height}")
+    print(f"color     {dominant_color(pixels)}")
+    print(f"blurhash  {text} ({len(text)} characters)")
+    print(f"preview   {len(uri)} bytes inline")
+
+
+if __name__ == "__main__":
+    main()
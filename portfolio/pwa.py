@@ -0,0 +1,320 @@
+# ============================================================================
+# INSTALLABLE APP AND OFFLINE CACHE
+# ============================================================================
+# An optional progressive web app layer for `streamlit run app.py`:
+#
+#   GET /manifest.webmanifest   name, colors and icons, so the portfolio can
+#                               be installed to a home screen
+#   GET /sw.js                  service worker (portfolio/templates/sw.js),
+#                               registered by a hidden component that main.py
+#                               renders on every run
+#
+# The worker precaches, under a cache named after a hash of the list, the
+# CSS bundle and webfont, the app icons, the profile photo and the gallery
+# thumbnails (THUMBNAIL_WIDTH, in the first <picture> format) and an offline
+# copy of every tab. Every other same-origin GET is answered
+# stale-while-revalidate, except responses served as immutable, which are
+# never fetched again. A repeat visit paints from the cache without waiting
+# for the network.
+#
+# Streamlit draws the sections over a websocket, so the live app can't run
+# offline. Offline visits are redirected to the static export of the tabs
+# (portfolio/export.py), written to static/offline/<hash>/. It links the
+# same photo and poster URLs as the app, so whatever the worker has cached
+# shows there too, in any cached size.
+#
+# With PORTFOLIO_PWA unset, /sw.js serves a worker that deletes its caches
+# and unregisters, so turning the layer off also cleans up browsers that
+# installed it.
+#
+# Enable:  PORTFOLIO_PWA=1
+# Runtime: pwa.build() (run by the warm-up, and on the first /sw.js request
+#          after a change); pwa.render(ui) at the top of main.py
+# ============================================================================
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from portfolio import assets, server
+
+ROOT = Path(__file__).resolve().parent.parent
+OFFLINE_DIR = assets.STATIC_DIR / "offline"
+ICON_DIR = assets.STATIC_DIR / "pwa"
+WORKER_TEMPLATE = Path(__file__).resolve().parent / "templates" / "sw.js"
+
+ENABLED = os.environ.get("PORTFOLIO_PWA", "").strip().lower() in ("1", "true", "yes", "on")
+
+MANIFEST_ROUTE = "/manifest.webmanifest"
+MANIFEST_URL = "manifest.webmanifest"
+WORKER_ROUTE = "/sw.js"
+WORKER_URL = "sw.js"
+
+APP_NAME = "Akshat Pandey · Portfolio"
+SHORT_NAME = "Akshat Pandey"
+# --accent-color and --bg of the light theme (portfolio/css/base.css)
+THEME_COLOR = "#0066cc"
+BACKGROUND_COLOR = "#ffffff"
+
+ICON_SIZES = (192, 512)
+
+# Gallery tiles are precached at this width (one of images.WIDTHS)
+THUMBNAIL_WIDTH = 480
+
+# Responses kept in the runtime cache, oldest dropped first
+RUNTIME_ENTRIES = 200
+
+# Paths under the app left to the network: websocket and health checks,
+# metrics, range-requested videos, session media files and the worker
+SKIP = ("_stcore/", "metrics", "video/", "media/", WORKER_URL)
+
+# Title of the registration frame; base.css hides frames with this title
+FRAME_TITLE = "Offline support"
+
+# Offline pages are three levels below the app root (assets/offline/<hash>/)
+LIVE_ROOT = "../../../"
+
+RETIRED_WORKER = (
+    'self.addEventListener("install",function(){self.skipWaiting();});'
+    'self.addEventListener("activate",function(event){event.waitUntil('
+    'caches.keys().then(function(names){return Promise.all(names.filter(function(name){'
+    'return name.indexOf("portfolio-")===0;}).map(function(name){return caches.delete(name);}));})'
+    '.then(function(){return self.registration.unregister();}));});'
+)
+
+_state = {"key": None, "manifest": None, "worker": None, "precache": []}
+_lock = threading.Lock()
+
+
+# ============================================================================
+# ICONS AND OFFLINE PAGES
+# ============================================================================
+
+def _icons():
+    """Square PNG icons cut from the profile photo, written once per photo."""
+    from PIL import Image, ImageOps
+
+    from portfolio import images
+    from portfolio.sections import HERO_PHOTO
+
+    source = ROOT / HERO_PHOTO
+    try:
+        version = assets.version(source)
+    except OSError:
+        return []
+    icons = []
+    photo = None
+    for size in ICON_SIZES:
+        path = ICON_DIR / f"icon-{size}.{version}.png"
+        if not path.exists():
+            if photo is None:
+                photo = images.open_source(source).convert("RGB")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            ImageOps.fit(photo, (size, size), Image.LANCZOS).save(tmp, "PNG", optimize=True)
+            os.replace(tmp, path)
+        icons.append({"src": server.asset_url(path), "sizes": f"{size}x{size}", "type": "image/png"})
+    return icons
+
+
+def _offline_page_class():
+    from portfolio.page import HtmlPage
+
+    class OfflinePage(HtmlPage):
+        """
+        HtmlPage for the offline copy: photos, posters and videos link the
+        live app's URLs, so files the worker cached for the app show offline
+        """
+
+        def __init__(self, writer):
+            super().__init__(self._link)
+            self._writer = writer
+
+        def _link(self, source, suffix=None):
+            if not isinstance(source, bytes):
+                try:
+                    return LIVE_ROOT + server.asset_url(source)
+                except OSError:
+                    pass
+            return self._writer(source, suffix)
+
+        def resize_url(self, source, width, fmt="auto"):
+            return LIVE_ROOT + server.image_url(source, width, fmt)
+
+        def video_url(self, source):
+            return LIVE_ROOT + server.video_url(source)
+
+    return OfflinePage
+
+
+def _write_offline():
+    """
+    Export every tab to static/offline/<hash>/, replacing older copies
+
+    Written to a hidden directory first and renamed, so several workers
+    building at once never serve a half-written copy.
+
+    Returns:
+        tuple: (directory of the copy, its files without compressed copies)
+    """
+    from portfolio import export
+
+    tmp = OFFLINE_DIR / f".build-{os.getpid()}-{threading.get_ident()}"
+    export.export(tmp, page_class=_offline_page_class())
+    files = sorted(p for p in tmp.rglob("*") if p.is_file() and p.name != export.MARKER)
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.relative_to(tmp).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+
+    target = OFFLINE_DIR / digest.hexdigest()[:12]
+    try:
+        os.rename(tmp, target)
+    except OSError:
+        # Already written, by an earlier run or another worker
+        shutil.rmtree(tmp, ignore_errors=True)
+    for other in OFFLINE_DIR.iterdir():
+        if other != target and not other.name.startswith("."):
+            shutil.rmtree(other, ignore_errors=True)
+
+    files = [target / path.relative_to(tmp) for path in files]
+    for path in files:
+        if path.suffix in assets.COMPRESSIBLE:
+            assets.compress(path)
+    return target, files
+
+
+# ============================================================================
+# MANIFEST AND WORKER
+# ============================================================================
+
+def _precache(offline_files, icons):
+    """URLs (relative to the app root) the worker stores when it installs."""
+    from portfolio import content, fonts, images, sections, styles
+
+    urls = [server.asset_url(styles.write_bundle())]
+    urls += [server.asset_url(face["path"]) for face in fonts.load_manifest()["faces"]]
+    urls += [icon["src"] for icon in icons]
+
+    # The first <picture> source a browser that supports it picks
+    fmt = next((f for f in images.available_formats() if f != "jpeg"), "jpeg")
+    photos = [(sections.HERO_PHOTO, sections.HERO_IMAGE_WIDTH)] + [
+        (path, THUMBNAIL_WIDTH) for event in content.load().gallery for path in event.photo_paths
+    ]
+    for path, width in photos:
+        try:
+            urls.append(server.image_url(path, min(width, images.source_size(path)[0]), fmt))
+        except OSError:
+            continue
+
+    # The offline copy sits under a content hash already
+    urls += [
+        f"{server.ASSET_URL}/{path.relative_to(assets.STATIC_DIR).as_posix()}" for path in offline_files
+    ]
+    return list(dict.fromkeys(urls))
+
+
+def build():
+    """
+    Bring the icons, offline copy, manifest and worker up to date
+
+    Rebuilt only when something the pages depend on changed (the render
+    snapshot fingerprint).
+
+    Returns:
+        dict: "manifest" and "worker" text, and the "precache" URL list
+
+    Raises:
+        OSError: When the app was started without the routes (main.py)
+    """
+    from portfolio import snapshot, templates
+
+    if not server.routes_mounted():
+        raise OSError("the offline layer is only served via app.py")
+    key = snapshot.fingerprint()
+    with _lock:
+        if _state["key"] == key:
+            return dict(_state)
+
+        icons = _icons()
+        offline_dir, offline_files = _write_offline()
+        precache = _precache(offline_files, icons)
+        offline_url = f"{server.ASSET_URL}/{offline_dir.relative_to(assets.STATIC_DIR).as_posix()}/index.html"
+        version = hashlib.sha256(
+            json.dumps([precache, assets.version(WORKER_TEMPLATE)]).encode("utf-8")
+        ).hexdigest()[:12]
+
+        manifest = {
+            "name": APP_NAME,
+            "short_name": SHORT_NAME,
+            "start_url": "./",
+            "scope": "./",
+            "display": "standalone",
+            "background_color": BACKGROUND_COLOR,
+            "theme_color": THEME_COLOR,
+            "icons": icons,
+        }
+        worker = templates.render(
+            "sw.js",
+            version=json.dumps(version),
+            precache=json.dumps(precache),
+            offline=json.dumps(offline_url),
+            runtime_entries=RUNTIME_ENTRIES,
+            skip=json.dumps(SKIP),
+        )
+        _state.update(key=key, manifest=json.dumps(manifest, ensure_ascii=False), worker=worker, precache=precache)
+        return dict(_state)
+
+
+def render(ui):
+    """
+    Add the hidden frame that links the manifest and registers the worker
+
+    Does nothing unless the layer is on and the app serves its routes.
+    """
+    from portfolio import templates
+
+    if not ENABLED or not server.routes_mounted():
+        return
+    ui.component(templates.render(
+        "pwa.html",
+        manifest=json.dumps(MANIFEST_URL),
+        worker=json.dumps(WORKER_URL),
+        theme_color=json.dumps(THEME_COLOR),
+    ), height=1, title=FRAME_TITLE)
+
+
+# ============================================================================
+# REQUEST HANDLERS
+# ============================================================================
+
+async def serve_manifest(request):
+    """GET /manifest.webmanifest : the web app manifest (404 when off)."""
+    from starlette.concurrency import run_in_threadpool
+    from starlette.responses import PlainTextResponse, Response
+
+    if not ENABLED:
+        return PlainTextResponse("The offline layer is off (set PORTFOLIO_PWA=1)", status_code=404)
+    state = await run_in_threadpool(build)
+    return Response(state["manifest"], media_type="application/manifest+json", headers={"Cache-Control": "no-cache"})
+
+
+async def serve_worker(request):
+    """GET /sw.js : the service worker, or one that removes itself when off."""
+    from starlette.concurrency import run_in_threadpool
+    from starlette.responses import Response
+
+    # Browsers check the worker for updates on every visit; no-cache makes
+    # that a cheap revalidation instead of a stale copy
+    headers = {"Cache-Control": "no-cache"}
+    if not ENABLED:
+        return Response(RETIRED_WORKER, media_type="text/javascript", headers=headers)
+    state = await run_in_threadpool(build)
+    etag = '"' + hashlib.sha256(state["worker"].encode("utf-8")).hexdigest()[:20] + '"'
+    headers["ETag"] = etag
+    if server.not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(state["worker"], media_type="text/javascript", headers=headers)
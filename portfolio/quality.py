@@ -0,0 +1,155 @@
+# ============================================================================
+# QUALITY-TARGETED ENCODING
+# ============================================================================
+# Instead of one fixed quality setting for every photo, search each image for
+# the lowest JPEG/WebP quality whose decoded result still looks like the
+# source, measured with SSIM (structural similarity, computed with NumPy).
+# Busy photos keep a higher quality; flat ones drop far lower.
+#
+# Used by portfolio/images.py for every JPEG and WebP derivative.
+#
+# Try:     python -m portfolio.quality photos/2.jpeg [--width 480] [--target 0.97]
+# ============================================================================
+
+import argparse
+import io
+import time
+
+import numpy as np
+
+# Default search bounds and similarity target (portfolio/images.py passes
+# its own)
+QUALITY_MIN = 40
+QUALITY_MAX = 92
+SSIM_TARGET = 0.97
+
+# SSIM constants for 8-bit images (Wang et al. 2004) and window size
+_C1 = (0.01 * 255) ** 2
+_C2 = (0.03 * 255) ** 2
+_WINDOW = 8
+
+# Encoder settings that don't affect the search. JPEG is written
+# progressive; neither format gets the source's EXIF or other metadata.
+BASE_OPTIONS = {
+    "jpeg": {"optimize": True, "progressive": True},
+    "webp": {"method": 6},
+}
+
+
+# ============================================================================
+# SSIM
+# ============================================================================
+
+def _window_means(a):
+    """Mean of every _WINDOW x _WINDOW window of `a`, via an integral image."""
+    s = np.pad(a, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    w = _WINDOW
+    return (s[w:, w:] - s[:-w, w:] - s[w:, :-w] + s[:-w, :-w]) / (w * w)
+
+
+def luma(image):
+    """Return an image's luminance as a float64 array."""
+    return np.asarray(image.convert("L"), dtype=np.float64)
+
+
+def ssim(a, b):
+    """
+    Mean structural similarity of two equally sized grayscale arrays
+
+    Args:
+        a (ndarray): Reference luminance
+        b (ndarray): Distorted luminance
+
+    Returns:
+        float: 1.0 for identical images, lower as structure is lost
+    """
+    mu_a = _window_means(a)
+    mu_b = _window_means(b)
+    var_a = _window_means(a * a) - mu_a ** 2
+    var_b = _window_means(b * b) - mu_b ** 2
+    cov = _window_means(a * b) - mu_a * mu_b
+    score = ((2 * mu_a * mu_b + _C1) * (2 * cov + _C2)) / (
+        (mu_a ** 2 + mu_b ** 2 + _C1) * (var_a + var_b + _C2)
+    )
+    return float(score.mean())
+
+
+# ============================================================================
+# QUALITY SEARCH
+# ============================================================================
+
+def encode(image, fmt, quality):
+    """Encode an RGB image at a given quality and return the bytes."""
+    out = io.BytesIO()
+    image.save(out, format=fmt.upper(), quality=quality, **BASE_OPTIONS[fmt])
+    return out.getvalue()
+
+
+def encode_to_target(image, fmt, target=SSIM_TARGET, low=QUALITY_MIN, high=QUALITY_MAX):
+    """
+    Find the smallest encoding of `image` whose SSIM reaches `target`
+
+    Binary-searches the quality setting. If even `high` misses the target,
+    the `high` encoding is used.
+
+    Args:
+        image (PIL.Image.Image): RGB image, already oriented and resized
+        fmt (str): "jpeg" or "webp"
+        target (float): Minimum SSIM against `image`
+        low (int): Lowest quality tried
+        high (int): Highest quality tried
+
+    Returns:
+        dict: data (bytes), quality (int) and ssim (float) of the result
+    """
+    from PIL import Image
+
+    reference = luma(image)
+    ceiling = high
+    best = None
+    tried = {}
+
+    def attempt(quality):
+        if quality not in tried:
+            data = encode(image, fmt, quality)
+            with Image.open(io.BytesIO(data)) as decoded:
+                tried[quality] = {"data": data, "quality": quality, "ssim": ssim(reference, luma(decoded))}
+        return tried[quality]
+
+    while low <= high:
+        mid = (low + high) // 2
+        result = attempt(mid)
+        if result["ssim"] >= target:
+            best = result
+            high = mid - 1
+        else:
+            low = mid + 1
+    return best or attempt(ceiling)
+
+
+def main(argv=None):
+    from PIL import Image, ImageOps
+
+    parser = argparse.ArgumentParser(description="Show the quality search for one image.")
+    parser.add_argument("image", help="image to encode")
+    parser.add_argument("--width", type=int, default=None, help="resize to this width first")
+    parser.add_argument("--target", type=float, default=SSIM_TARGET, help=f"SSIM target (default {SSIM_TARGET})")
+    args = parser.parse_args(argv)
+
+    with Image.open(args.image) as im:
+        im = ImageOps.exif_transpose(im).convert("RGB")
+        if args.width and args.width < im.width:
+            im = im.resize((args.width, round(im.height * args.width / im.width)), Image.LANCZOS)
+        for fmt in ("jpeg", "webp"):
+            start = time.perf_counter()
+            result = encode_to_target(im, fmt, args.target)
+            fixed = len(encode(im, fmt, 80))
+            print(
+                f"{fmt:5} {im.width}x{im.height}: quality {result['quality']}, SSIM {result['ssim']:.4f}, "
+                f"{len(result['data']) / 1024:.1f} KB (quality 80: {fixed / 1024:.1f} KB) "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,532 @@
+# ============================================================================
+# PORTFOLIO SECTIONS
+# ============================================================================
+# Layout of every tab. Each render_<section>(ui) function draws through a
+# render target from portfolio/page.py, so main.py can show it in Streamlit
+# and portfolio/export.py can write it out as static HTML. Lists of entries
+# (education, skills, experience, achievements, gallery events, media embeds)
+# come from content/portfolio.json via portfolio/content.py; list sections
+# are rendered from portfolio/templates/ into one HTML element each.
+# ============================================================================
+
+import html
+import itertools
+
+from portfolio import content, icons, images, metrics, snapshot, templates, videos, youtube
+
+# Profile photo in the Home tab's hero column
+HERO_PHOTO = "photos/profile.jpg"
+
+# Rendered width (device pixels) the hero and gallery images must cover.
+# The 1/4-width hero column and the 4-column gallery are ~180 CSS px wide,
+# so 480px covers them on 2x screens. Build the variants with:
+#   python -m portfolio.images
+HERO_IMAGE_WIDTH = 480
+GALLERY_IMAGE_WIDTH = 480
+
+# Rendered width of the hero photo: a quarter of the page, or the full width
+# once columns stack below 640px
+HERO_IMAGE_SIZES = "(max-width: 640px) 100vw, 180px"
+
+# Rendered width of one gallery photo for each layout in gallery.css
+# (4 columns, 2 columns below 640px, 1 column below 480px); the browser uses
+# it to choose a width from each photo's srcset
+GALLERY_IMAGE_SIZES = "(max-width: 480px) 100vw, (max-width: 640px) 50vw, 180px"
+
+# Height reserved for an Instagram reel without its own "height" in the
+# content file (the embed's iframe does not resize itself)
+INSTAGRAM_HEIGHT = 600
+
+# Height of a YouTube video: 16:9 at the width of the page's content column.
+# Posters are fetched with `python -m portfolio.youtube`
+YOUTUBE_HEIGHT = 396
+
+# Navigation menu: tab label -> URL slug (`?section=<slug>` deep links)
+SECTION_SLUGS = {
+    "Home": "home",
+    "Education": "education",
+    "Skills": "skills",
+    "Experience": "experience",
+    "Achievements": "achievements",
+    "Media": "media",
+    "Photo Gallery": "gallery",
+}
+
+# ============================================================================
+# TAB 0: HOME SECTION
+# ============================================================================
+# Displays the hero section with profile image, name, social links, and bio
+
+def render_home(ui):
+    """Render the Home tab"""
+    # Create two-column layout: profile image (left) and intro (right)
+    col1, col2 = ui.columns([1, 3])
+    
+    with col1:
+        # A responsive <picture> when resized versions can be linked,
+        # otherwise a Streamlit image
+        photo = picture(ui, HERO_PHOTO, HERO_IMAGE_WIDTH)
+        if photo:
+            ui.markdown(templates.render("hero.html", photo=photo, sizes=HERO_IMAGE_SIZES))
+        else:
+            ui.image(HERO_PHOTO, HERO_IMAGE_WIDTH)
+
+    with col2:
+        # Display main heading with custom styling
+        ui.markdown('<p class="header">Akshat Pandey</p>')
+
+        # ================================================================
+        # CLIPBOARD COPY FUNCTIONALITY
+        # JavaScript function to copy text and show notification popup
+        # ================================================================
+        ui.markdown("""
+<div id="copyPopup" class="copy-popup"></div>
+
+<script>
+function copyToClipboard(text, message) {
+    navigator.clipboard.writeText(text).then(() => {
+        const popup = document.getElementById("copyPopup");
+        popup.textContent = message;
+        popup.style.display = "block";
+        setTimeout(() => {
+            popup.style.display = "none";
+        }, 2000);
+    });
+}
+</script>
+        """)
+
+        # ================================================================
+        # SOCIAL MEDIA LINKS AND CONTACT ICONS
+        # Displays interactive social icons with copy-to-clipboard for contact info.
+        # The fa-* tags are served from an inline sprite (portfolio/icons.py).
+        # ================================================================
+        ui.component(icons.inline("""
+        <style>
+        :root {
+            --social-text: #333333;
+            --social-hover: #0066cc;
+        }
+
+        @media (prefers-color-scheme: dark) {
+            :root {
+                --social-text: #a0a0a0;
+                --social-hover: #8ab4ff;
+            }
+        }
+
+        /* Social media icons container */
+        .social-container {
+            display: flex;
+            gap: 26px;
+            margin-top: 0px;
+            align-items: center;
+            flex-wrap: wrap;
+            position: relative;
+            z-index: 0;
+            margin-bottom: 0; 
+            margin: 0px 0px 0px 0px; !important;
+      
+        }
+
+        /* Individual social link styling */
+        .social-link, .copy-icon {
+            color: var(--social-text);
+            text-decoration: none;
+            transition: color 0.3s ease;
+            font-size: 24px;
+            cursor: pointer;
+        }
+        
+        /* Hover effect for social links */
+        .social-link:hover,
+        .copy-icon:hover {
+            color: var(--social-hover);
+        }
+
+        /* Copy notification popup styling */
+        .copy-popup {
+            position: fixed;
+            top: 10px;
+            left: 30%;
+            transform: translateX(-50%);
+            background-color: #ffffff;
+            color: #000000;
+            padding: 10px 18px;
+            border-radius: 6px;
+            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.15);
+            font-size: 14px;
+            font-weight: bold;
+            z-index: 9999;
+            display: none;
+        }
+
+        /* Dark mode popup styling */
+        @media (prefers-color-scheme: dark) {
+            .copy-popup {
+                background-color: #111214;
+                color: #ffffff;
+                box-shadow: 0 2px 10px rgba(0, 0, 0, 0.5);
+            }
+        }
+        </style>
+
+        <!-- Social Media Links Container -->
+        <div class="social-container">
+            <!-- Instagram Link -->
+            <a class="social-link" href="https://instagram.com/akshat_pandey0111" target="_blank" aria-label="Instagram">
+                <i class="fab fa-instagram"></i>
+            </a>
+
+            <!-- LinkedIn Link -->
+            <a class="social-link" href="https://in.linkedin.com/in/akshat-pandey-4739a82a7" target="_blank" aria-label="LinkedIn">
+                <i class="fab fa-linkedin"></i>
+            </a>
+
+            <!-- Phone: Clickable to copy phone number -->
+            <i class="fas fa-phone copy-icon" onclick="copyToClipboard('+91 9925112498', 'Phone copied to clipboard')"></i>
+
+            <!-- Email: Clickable to copy email address -->
+            <i class="fas fa-envelope copy-icon" onclick="copyToClipboard('akshatp0905@gmail.com', 'Email ID copied to clipboard')"></i>
+        </div>
+
+        <!-- Copy Popup Notification -->
+        <div id="copyPopup" class="copy-popup"></div>
+
+        <!-- JavaScript for Copy Functionality -->
+        <script>
+        function copyToClipboard(text, message) {
+            if (navigator.clipboard) {
+                navigator.clipboard.writeText(text).then(() => {
+                    showCopyPopup(message);
+                }).catch(err => {
+                    console.error('Clipboard copy failed:', err);
+                });
+            } else {
+                console.warn('Clipboard not supported');
+            }
+        }
+
+        function showCopyPopup(message) {
+            const popup = document.getElementById("copyPopup");
+            popup.textContent = message;
+            popup.style.display = "block";
+            setTimeout(() => {
+                popup.style.display = "none";
+            }, 2000);
+        }
+        </script>
+        """), height=40)
+
+        # Display tagline/professional description
+        ui.markdown('<p style="margin-top: 0;">Anchor | Orator | Public Speaker | Debater</p>')
+
+    # Add horizontal divider
+    ui.markdown('<hr>')
+    
+    # ================================================================
+    # ABOUT ME SECTION
+    # Brief biography and introduction
+    # ================================================================
+    ui.markdown('<p class="section-header">About Me</p>')
+    ui.text("""
+     I am a passionate anchor, public speaker, and debater with a deep love for literature, mythology, and poetry. 
+    With experience in anchoring major formal and informal events, I take pride in my ability to engage audiences 
+    with confidence and clarity. My journey has been enriched by numerous opportunities that have helped me grow 
+    into a versatile speaker and performer.
+    """)
+
+
+# ============================================================================
+# TAB 1: EDUCATION SECTION
+# ============================================================================
+# Displays educational timeline with institutions and milestones
+
+def render_education(ui):
+    """Render the Education tab"""
+    ui.markdown('<p class="section-header">Education</p>')
+
+    # ================================================================
+    # TIMELINE COMPONENT
+    # Interactive horizontal timeline showing educational background
+    # ================================================================
+    timeline = templates.render("timeline.html", education=content.load().education)
+    ui.component(icons.inline(timeline), height=300)
+
+
+
+# ============================================================================
+# TAB 2: SKILLS SECTION
+# ============================================================================
+# Displays skills in a responsive grid layout with cards
+
+# Display skills section with tab
+def render_skills(ui):
+    """Render the Skills tab"""
+    # ================================================================
+    # SKILLS GRID CONTENT
+    # Heading and all skill cards, sent as one element
+    # (portfolio/templates/skills.html)
+    # ================================================================
+    ui.markdown(templates.render("skills.html", skills=content.load().skills))
+
+
+
+# ============================================================================
+# TAB 3: EXPERIENCE SECTION
+# ============================================================================
+# Displays professional experience and event hosting accomplishments
+
+# Display experience section
+def render_experience(ui):
+    """Render the Experience tab"""
+    # One element holds the grid and every card, so .experience-grid lays
+    # them out (portfolio/templates/experience.html)
+    ui.markdown(templates.render("experience.html", experience=content.load().experience))
+
+
+# ============================================================================
+# TAB 4: ACHIEVEMENTS SECTION
+# ============================================================================
+# Displays awards, certifications, and recognitions
+
+# Display achievements section
+def render_achievements(ui):
+    """Render the Achievements tab"""
+    # One element holds the grid and every card, so .skill-grid lays them
+    # out (portfolio/templates/achievements.html)
+    ui.markdown(templates.render("achievements.html", achievements=content.load().achievements))
+
+
+# ============================================================================
+# TAB 5: MEDIA SECTION
+# ============================================================================
+# Displays featured videos and media content from events
+
+def render_media(ui):
+    """Render the Media tab"""
+    ui.markdown('<p class="section-header">Media Gallery</p>')
+    ui.subheader("Featured Videos")
+
+    # ================================================================
+    # MEDIA TABS
+    # One sub-tab per entry of "media" in content/portfolio.json
+    # ================================================================
+    # Only the open media tab runs, so its videos/embeds are the only ones sent
+    media = content.load().media
+    tabs = ui.tabs([event.title for event in media], key="media_tab", on_change="rerun")
+    for event, tab in zip(media, tabs):
+        with tab:
+            if tab.open:
+                # The sub-tabs depend on the session, their content doesn't
+                snapshot.render(f"media/{event.title}", render_media_items, ui, event.items)
+
+
+def render_media_items(ui, items):
+    """
+    Render a media sub-tab's embeds in order
+
+    Consecutive Instagram reels share one click-to-load document, so
+    Instagram's script is fetched at most once per group, on first click.
+    """
+    for is_reel, group in itertools.groupby(items, key=lambda item: item.kind == "instagram"):
+        group = list(group)
+        if is_reel:
+            reels = [
+                {
+                    "src": item.src,
+                    "caption": item.caption,
+                    "height": item.height or INSTAGRAM_HEIGHT,
+                    "captioned": item.captioned,
+                }
+                for item in group
+            ]
+            document = icons.inline(templates.render("instagram.html", reels=reels))
+            ui.component(document, height=sum(reel["height"] for reel in reels), scrolling=False)
+        else:
+            for item in group:
+                if item.kind == "youtube" and youtube.video_id(item.src):
+                    render_youtube(ui, item)
+                elif item.kind == "video":
+                    render_local_video(ui, item)
+                else:
+                    ui.video(item.src)
+
+
+def render_youtube(ui, item):
+    """A YouTube video as a poster that loads the player when clicked."""
+    poster = youtube.poster_path(youtube.video_id(item.src))
+    try:
+        poster_url = ui.static_url(poster) if poster else None
+    except OSError:
+        # No static serving: the facade shows a plain dark card instead
+        poster_url = None
+    document = templates.render(
+        "youtube.html",
+        player=youtube.player_url(item.src),
+        poster=poster_url,
+        caption=item.caption,
+        width=youtube.POSTER_WIDTH,
+        height=round(youtube.POSTER_WIDTH * 9 / 16),
+    )
+    ui.component(document, height=YOUTUBE_HEIGHT, scrolling=False)
+
+
+def render_local_video(ui, item):
+    """
+    A video from Video/, streamed on demand behind its poster
+
+    Missing files are shown as a placeholder card. Without the streaming
+    route (`streamlit run main.py`) the video falls back to st.video.
+    """
+    info = videos.info(item.src)
+    if info is None:
+        ui.markdown(templates.render("video.html", src=None, caption=item.caption))
+        return
+    try:
+        src = ui.video_url(item.src)
+    except OSError:
+        ui.video(item.src)
+        return
+    try:
+        poster = ui.static_url(info["poster"]) if info["poster"] else None
+    except OSError:
+        poster = None
+    ui.markdown(templates.render(
+        "video.html",
+        src=src,
+        poster=poster,
+        caption=item.caption,
+        duration=videos.format_duration(info["duration"]) if info["duration"] else None,
+        width=info["width"],
+        height=info["height"],
+    ))
+
+
+# ============================================================================
+# TAB 6: PHOTO GALLERY
+# ============================================================================
+# Displays image galleries organized by events
+
+def picture(ui, path, width):
+    """
+    Describe a photo for a responsive <picture> (see gallery.html, hero.html)
+
+    Sources come from the on-demand resize route when the app serves it, and
+    otherwise from the derivatives built by `python -m portfolio.images`.
+
+    Args:
+        ui: Render target, used to turn image paths into URLs
+        path (str): Original photo path, e.g. "photos/2.jpeg"
+        width (int): Device pixels the fallback `src` must cover
+
+    Returns:
+        dict: src/srcset/sources/width/height/placeholder for the template,
+        or None when neither the route nor built derivatives are available
+    """
+    try:
+        return _resized_picture(ui, path, width)
+    except OSError:
+        pass
+
+    variants = images.variant_set(path)
+    if not variants or "jpeg" not in variants["formats"]:
+        return None
+
+    def srcset(fmt):
+        return ", ".join(
+            f"{ui.static_url(v['path'])} {v['width']}w" for v in variants["formats"][fmt]
+        )
+
+    try:
+        return {
+            "src": ui.static_url(images.pick_variant(path, width)),
+            "srcset": srcset("jpeg"),
+            "sources": [
+                {"type": images.MIME_TYPES[fmt], "srcset": srcset(fmt)}
+                for fmt in variants["formats"] if fmt != "jpeg"
+            ],
+            "width": variants["width"],
+            "height": variants["height"],
+            "placeholder": images.placeholder(path),
+        }
+    except OSError:
+        return None
+
+
+def _resized_picture(ui, path, width):
+    """picture() via the /img resize route; raises OSError without it."""
+    original_width, original_height = images.source_size(path)
+    widths = sorted({min(w, original_width) for w in images.WIDTHS})
+
+    def srcset(fmt):
+        return ", ".join(f"{ui.resize_url(path, w, fmt)} {w}w" for w in widths)
+
+    return {
+        "src": ui.resize_url(path, min(width, original_width), "jpeg"),
+        "srcset": srcset("jpeg"),
+        "sources": [
+            {"type": images.MIME_TYPES[fmt], "srcset": srcset(fmt)}
+            for fmt in images.available_formats() if fmt != "jpeg"
+        ],
+        "width": original_width,
+        "height": original_height,
+        "placeholder": images.placeholder(path),
+    }
+
+
+def render_gallery(ui):
+    """Render the Photo Gallery tab"""
+    # ================================================================
+    # DISPLAY EVENT HELPER FUNCTION
+    # Function to display event titles and image galleries
+    # ================================================================
+    def display_event(event):
+        """
+        Display an event section with title and corresponding images
+        
+        Args:
+            event (GalleryEvent): Event title and photo numbers to display
+        """
+        # The whole event is one element: a grid of responsive, lazily
+        # loaded <picture>s (portfolio/templates/gallery.html)
+        photos = [picture(ui, path, GALLERY_IMAGE_WIDTH) for path in event.photo_paths]
+        if all(photos):
+            ui.markdown(templates.render(
+                "gallery.html", event=event, photos=photos, sizes=GALLERY_IMAGE_SIZES
+            ))
+            return
+
+        # No resize route or derivatives to link: fall back to one
+        # Streamlit image per photo in a 4-column grid
+        ui.markdown(
+            f'''
+            <p class="event-title">{html.escape(event.title)}</p>
+            <hr class="event-divider">
+          <br>
+            '''
+        )
+        cols = ui.columns(4)
+        for i, path in enumerate(event.photo_paths):
+            with cols[i % 4]:
+                ui.image(path, GALLERY_IMAGE_WIDTH)
+        ui.markdown("<hr>")
+
+    # ================================================================
+    # EVENT GALLERIES
+    # Display different event photo galleries (content/portfolio.json)
+    # ================================================================
+    for event in content.load().gallery:
+        with metrics.section(event.title):
+            display_event(event)
+
+
+SECTION_RENDERERS = {
+    "Home": render_home,
+    "Education": render_education,
+    "Skills": render_skills,
+    "Experience": render_experience,
+    "Achievements": render_achievements,
+    "Media": render_media,
+    "Photo Gallery": render_gallery,
+}
@@ -0,0 +1,525 @@
+# ============================================================================
+# HTTP ROUTES
+# ============================================================================
+# Extra routes served next to the Streamlit app when it is started through
+# app.py (`streamlit run app.py`), which wraps main.py in an st.App:
+#
+#   GET /img/<photo>?w=<width>&fmt=<avif|webp|jpeg|auto>&v=<version>
+#       The photo from photos/ resized to `w` pixels wide and encoded with the
+#       image pipeline's settings (portfolio/images.py). Results are kept in
+#       a size-capped disk cache, so only the first request for a size pays
+#       for the encode.
+#
+#   GET /video/<file>?v=<version>
+#       A video from Video/, streamed from a memory map shared by every
+#       request. Range requests get 206 with just the bytes asked for, so
+#       browsers can seek without downloading the whole file.
+#
+#   GET /assets/<path>
+#       A file from static/. Text files are sent as their brotli or gzip copy
+#       made at build time (portfolio/assets.py), whichever Accept-Encoding
+#       prefers, so nothing is compressed per request.
+#
+# The URLs the page links carry a hash of the file's contents (in the name,
+# or as `v`), so they change exactly when the file does. Those responses are
+# `Cache-Control: immutable` for a year: a returning visitor requests no
+# image, poster or stylesheet again until it changes. All three routes send
+# a strong ETag from the same hash and answer If-None-Match with 304.
+#
+#   GET /metrics
+#       Render timings and payload sizes per section in the Prometheus text
+#       format, when PORTFOLIO_METRICS is set (portfolio/metrics.py).
+#
+#   GET /manifest.webmanifest, GET /sw.js
+#       Web app manifest and service worker, when PORTFOLIO_PWA is set
+#       (portfolio/pwa.py).
+#
+# Under plain `streamlit run main.py` the routes don't exist; the page then
+# links the prebuilt derivatives under static/ and plays local videos with
+# st.video instead.
+# ============================================================================
+
+import hashlib
+import mmap
+import os
+import threading
+from email.utils import formatdate
+from pathlib import Path
+
+from portfolio import assets, images, metrics, videos
+
+ROOT = Path(__file__).resolve().parent.parent
+PHOTOS_DIR = ROOT / "photos"
+
+IMAGE_ROUTE = "/img/{name}"
+IMAGE_URL = "img"
+VIDEO_ROUTE = "/video/{name}"
+VIDEO_URL = "video"
+ASSET_ROUTE = "/assets/{path:path}"
+ASSET_URL = "assets"
+
+# Bytes sent per chunk of a video response
+VIDEO_CHUNK = 256 * 1024
+
+# Disk cache for resized images; PORTFOLIO_RESIZE_CACHE_MB sets its cap
+RESIZE_CACHE_DIR = ROOT / ".cache" / "img"
+DEFAULT_RESIZE_CACHE_MB = 256
+
+# Requested widths are clamped to [MIN_WIDTH, photo width] and rounded up to
+# a multiple of WIDTH_STEP, so arbitrary `w` values can't fill the cache
+MIN_WIDTH = 32
+WIDTH_STEP = 16
+
+# Responses to URLs without (or with an outdated) content hash; browsers
+# revalidate with If-None-Match after this long
+IMAGE_MAX_AGE = 24 * 60 * 60
+VIDEO_MAX_AGE = 24 * 60 * 60
+ASSET_MAX_AGE = 24 * 60 * 60
+
+# Responses to content-hashed URLs
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+_state = {"mounted": False}
+
+
+# ============================================================================
+# URL HELPERS (used by the page markup)
+# ============================================================================
+
+def routes_mounted():
+    """True when this process serves the routes (started via app.py)."""
+    return _state["mounted"]
+
+
+def image_url(source, width, fmt="auto"):
+    """
+    URL of a photo on the resize route
+
+    Args:
+        source (str): Photo path relative to the repo, e.g. "photos/2.jpeg"
+        width (int): Width in pixels
+        fmt (str): Output format, or "auto" to negotiate from Accept
+
+    Returns:
+        str: Relative URL, e.g. "img/2.jpeg?w=480&fmt=webp&v=<version>"
+
+    Raises:
+        OSError: When the resize route isn't being served or the photo
+            can't be read
+    """
+    if not routes_mounted():
+        raise OSError("the resize route is only served via app.py")
+    version = image_version(ROOT / source)
+    return f"{IMAGE_URL}/{Path(source).name}?w={width}&fmt={fmt}&v={version}"
+
+
+def video_url(source):
+    """
+    URL of a video from Video/ on the streaming route
+
+    Args:
+        source (str): Video path relative to the repo, e.g. "Video/video.mp4"
+
+    Returns:
+        str: Relative URL, e.g. "video/video.mp4?v=<version>"
+
+    Raises:
+        OSError: When the video route isn't being served or the video can't
+            be read
+    """
+    if not routes_mounted():
+        raise OSError("the video route is only served via app.py")
+    return f"{VIDEO_URL}/{Path(source).name}?v={assets.version(ROOT / source)}"
+
+
+def asset_url(path):
+    """
+    URL of a file under static/ on the precompressed asset route
+
+    Args:
+        path (str | Path): Path relative to the repo (or absolute), e.g.
+            "static/css/portfolio.<hash>.css"
+
+    Returns:
+        str: Relative URL, e.g. "assets/css/portfolio.<hash>.css", or
+            "assets/img/<photo>-1080w.webp?v=<version>" for a file whose
+            name doesn't change with its contents
+
+    Raises:
+        OSError: When the asset route isn't being served, the file is outside
+            static/ or it can't be read
+    """
+    if not routes_mounted():
+        raise OSError("the asset route is only served via app.py")
+    full = (ROOT / path).resolve()
+    try:
+        relative = full.relative_to(assets.STATIC_DIR)
+    except ValueError:
+        raise OSError(f"{path} is not under static/") from None
+    url = f"{ASSET_URL}/{relative.as_posix()}"
+    return url if assets.content_hashed(full) else f"{url}?v={assets.version(full)}"
+
+
+def not_modified(request, etag):
+    """
+    True when the request's If-None-Match lists `etag`
+
+    Uses the weak comparison If-None-Match calls for, so a W/ prefix added
+    by a proxy still matches.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+# ============================================================================
+# RESIZE CACHE
+# ============================================================================
+
+def _cache_budget():
+    try:
+        megabytes = float(os.environ.get("PORTFOLIO_RESIZE_CACHE_MB", DEFAULT_RESIZE_CACHE_MB))
+    except ValueError:
+        megabytes = DEFAULT_RESIZE_CACHE_MB
+    return int(max(megabytes, 0) * 1024 * 1024)
+
+
+def _snap_width(requested, original):
+    width = min(max(requested, MIN_WIDTH), original)
+    if width < original:
+        width = min(-(-width // WIDTH_STEP) * WIDTH_STEP, original)
+    return width
+
+
+def image_version(path):
+    """
+    Version of a photo's resized copies: changes with the photo's contents
+    or the encoder settings
+
+    Returns:
+        str: 12 hex digits
+
+    Raises:
+        OSError: When the photo can't be read
+    """
+    key = "|".join(map(str, (
+        assets.version(path), images.PIPELINE_VERSION, images.SSIM_TARGET, images.QUALITY_RANGE,
+    )))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+
+
+def negotiate_format(accept):
+    """Pick the best format the client accepts from an Accept header."""
+    available = images.available_formats()
+    for fmt in ("avif", "webp"):
+        if fmt in available and images.MIME_TYPES[fmt] in accept:
+            return fmt
+    return "jpeg"
+
+
+def _etag(path, width, fmt):
+    # Derived from the source's contents and the encoder settings, so a
+    # conditional request is answered without encoding or reading the cache
+    key = f"{image_version(path)}|{width}|{fmt}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:20]
+
+
+# One lock per cache file being written, so concurrent requests for the same
+# size wait for a single encode instead of each running their own. A lock is
+# dropped once its file exists: later requests only check for the file
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(key):
+    with _locks_guard:
+        return _locks.setdefault(key, threading.Lock())
+
+
+def _evict(cache_dir, budget, keep=None):
+    """
+    Delete least recently used files until the cache fits its budget
+
+    `keep` (the file just written, about to be sent) is never deleted, even
+    when it alone is over the budget.
+    """
+    files = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and not entry.name.endswith(".tmp") and entry.path != str(keep):
+            stat = entry.stat()
+            files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= budget:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def resized_image(path, width, fmt, etag, cache_dir=RESIZE_CACHE_DIR):
+    """
+    Return the cache file holding `path` at `width` in `fmt`, creating it
+
+    Args:
+        path (Path): Original photo
+        width (int): Snapped output width
+        fmt (str): Output format
+        etag (str): Cache key from _etag()
+        cache_dir (Path): Disk cache directory
+
+    Returns:
+        Path: File with the encoded image (another worker's eviction may
+        still delete it before it is read, see resized_image_bytes)
+    """
+    cached = Path(cache_dir) / f"{path.stem}-{etag}.{images.EXTENSIONS[fmt]}"
+    with _lock_for(cached.name):
+        if cached.exists():
+            # Touch it so eviction treats it as recently used
+            os.utime(cached)
+        else:
+            data, _ = images.encode(images.resize(images.open_source(path), width), fmt)
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f"{cached.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, cached)
+            _evict(cached.parent, _cache_budget(), keep=cached)
+        # Requests still waiting on this lock find the file; new ones don't
+        # need a lock at all
+        with _locks_guard:
+            _locks.pop(cached.name, None)
+    return cached
+
+
+def resized_image_bytes(path, width, fmt, etag, cache_dir=RESIZE_CACHE_DIR):
+    """
+    resized_image(), read: the encoded bytes
+
+    When another worker evicts the file between writing and reading it, the
+    image is encoded again for this response without touching the cache.
+    """
+    try:
+        return resized_image(path, width, fmt, etag, cache_dir).read_bytes()
+    except FileNotFoundError:
+        data, _ = images.encode(images.resize(images.open_source(path), width), fmt)
+        return data
+
+
+# ============================================================================
+# VIDEO STREAMING
+# ============================================================================
+
+# One read-only memory map per video, shared by all requests; the OS page
+# cache holds the bytes instead of a copy per session. A changed file gets a
+# new map; the old one is released once the last response using it ends.
+_maps = {}
+_maps_guard = threading.Lock()
+
+
+def _video_map(path):
+    """Return (mmap, stat) for a video, mapping it on first use."""
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _maps_guard:
+        cached = _maps.get(path)
+        if cached is None or cached[0] != key:
+            if stat.st_size == 0:
+                # Empty files can't be mapped
+                cached = (key, b"")
+            else:
+                with open(path, "rb") as f:
+                    cached = (key, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            _maps[path] = cached
+    return cached[1], stat
+
+
+def parse_range(header, size):
+    """
+    Parse a single-range Range header
+
+    Args:
+        header (str): e.g. "bytes=0-1023", "bytes=500-" or "bytes=-500"
+        size (int): Length of the file
+
+    Returns:
+        tuple: (first, last) byte, inclusive; None to send the whole file
+            (no header, an invalid one, or a form this server doesn't serve
+            partially)
+
+    Raises:
+        ValueError: When the range can't be satisfied (answer 416)
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, dash, last = header[len("bytes="):].strip().partition("-")
+    # Plain ASCII digits only (int() would also take "+1", "1_0", ...)
+    if not dash or not (first or last) or not all(
+        part.isascii() and part.isdigit() for part in (first, last) if part
+    ):
+        return None
+    first = int(first) if first else None
+    last = int(last) if last else None
+
+    if first is None:
+        # Suffix range: the last `last` bytes
+        if last == 0 or size == 0:
+            raise ValueError(f"range {header!r} selects no bytes of {size}")
+        return max(size - last, 0), size - 1
+    if last is not None and last < first:
+        # Syntactically invalid (RFC 9110, 14.1.1): ignore the header
+        return None
+    if first >= size:
+        raise ValueError(f"range {header!r} outside {size} bytes")
+    return first, size - 1 if last is None else min(last, size - 1)
+
+
+def _chunks(data, first, last):
+    # A sync generator: Starlette iterates it in a worker thread, so page
+    # faults on the map don't block the event loop
+    position = first
+    while position <= last:
+        end = min(position + VIDEO_CHUNK, last + 1)
+        yield data[position:end]
+        position = end
+
+
+# ============================================================================
+# REQUEST HANDLERS
+# ============================================================================
+
+async def serve_image(request):
+    """GET /img/<photo>?w=&fmt= : a resized photo, from the disk cache."""
+    from starlette.concurrency import run_in_threadpool
+    from starlette.responses import PlainTextResponse, Response
+
+    name = request.path_params["name"]
+    path = PHOTOS_DIR / name
+    if Path(name).name != name or path.suffix.lower() not in images.SOURCE_SUFFIXES or not path.is_file():
+        return PlainTextResponse("Not found", status_code=404)
+
+    fmt = request.query_params.get("fmt", "auto")
+    version = await run_in_threadpool(image_version, path)
+    immutable = request.query_params.get("v") == version
+    headers = {"Cache-Control": IMMUTABLE if immutable else f"public, max-age={IMAGE_MAX_AGE}"}
+    if fmt == "auto":
+        fmt = negotiate_format(request.headers.get("accept", ""))
+        headers["Vary"] = "Accept"
+    elif fmt not in images.available_formats():
+        return PlainTextResponse(f"Unsupported format {fmt!r}", status_code=400)
+
+    source = f"photos/{name}"
+    # Reads the photo's header when it isn't in the manifest
+    original_width = (await run_in_threadpool(images.source_size, source))[0]
+    try:
+        requested = int(request.query_params.get("w", original_width))
+    except ValueError:
+        return PlainTextResponse("w must be an integer", status_code=400)
+    width = _snap_width(requested, original_width)
+
+    etag = _etag(path, width, fmt)
+    headers["ETag"] = f'"{etag}"'
+    if not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    data = await run_in_threadpool(resized_image_bytes, path, width, fmt, etag)
+    return Response(data, media_type=images.MIME_TYPES[fmt], headers=headers)
+
+
+async def serve_video(request):
+    """GET /video/<file> : a local video, with byte-range support."""
+    from starlette.concurrency import run_in_threadpool
+    from starlette.responses import PlainTextResponse, Response, StreamingResponse
+
+    name = request.path_params["name"]
+    path = videos.VIDEO_DIR / name
+    suffix = path.suffix.lower()
+    if Path(name).name != name or suffix not in videos.VIDEO_SUFFIXES or not path.is_file():
+        return PlainTextResponse("Not found", status_code=404)
+
+    data, stat = await run_in_threadpool(_video_map, path)
+    size = stat.st_size
+    version = await run_in_threadpool(assets.version, path)
+    etag = f'"{version}"'
+    immutable = request.query_params.get("v") == version
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": IMMUTABLE if immutable else f"public, max-age={VIDEO_MAX_AGE}",
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+    }
+    if not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    # If-Range: only honour the range if the client's copy is still current
+    range_header = request.headers.get("range")
+    if range_header and request.headers.get("if-range", etag) != etag:
+        range_header = None
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=416, headers=headers)
+
+    status = 200
+    first, last = 0, size - 1
+    if byte_range:
+        status = 206
+        first, last = byte_range
+        headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+    headers["Content-Length"] = str(last - first + 1)
+
+    media_type = videos.MIME_TYPES[suffix]
+    if request.method == "HEAD":
+        return Response(status_code=status, headers=headers, media_type=media_type)
+    return StreamingResponse(_chunks(data, first, last), status_code=status, headers=headers, media_type=media_type)
+
+
+async def serve_asset(request):
+    """GET /assets/<path> : a file from static/, precompressed if accepted."""
+    from starlette.concurrency import run_in_threadpool
+    from starlette.responses import FileResponse, PlainTextResponse, Response
+
+    path = await run_in_threadpool(assets.resolve, request.path_params["path"])
+    if path is None:
+        return PlainTextResponse("Not found", status_code=404)
+
+    version = await run_in_threadpool(assets.version, path)
+    immutable = assets.content_hashed(path) or request.query_params.get("v") == version
+    headers = {"Cache-Control": IMMUTABLE if immutable else f"public, max-age={ASSET_MAX_AGE}"}
+    send, encoding = path, None
+    if path.suffix.lower() in assets.COMPRESSIBLE:
+        send, encoding = await run_in_threadpool(assets.negotiate, path, request.headers.get("accept-encoding", ""))
+        if encoding:
+            # Content-Encoding also keeps Streamlit's gzip middleware off the
+            # response; on uncompressed ones the middleware adds Vary itself
+            headers["Vary"] = "Accept-Encoding"
+
+    # Each encoding's bytes differ, so each gets its own strong ETag
+    headers["ETag"] = f'"{version}-{encoding}"' if encoding else f'"{version}"'
+    if not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return FileResponse(send, media_type=assets.media_type(path), headers=headers)
+
+
+def routes():
+    """Routes to mount on the st.App in app.py."""
+    from starlette.routing import Route
+
+    from portfolio import pwa
+
+    _state["mounted"] = True
+    return [
+        Route(IMAGE_ROUTE, serve_image, methods=["GET", "HEAD"]),
+        Route(VIDEO_ROUTE, serve_video, methods=["GET", "HEAD"]),
+        Route(ASSET_ROUTE, serve_asset, methods=["GET", "HEAD"]),
+        Route(metrics.METRICS_ROUTE, metrics.serve_metrics, methods=["GET"]),
+        Route(pwa.MANIFEST_ROUTE, pwa.serve_manifest, methods=["GET"]),
+        Route(pwa.WORKER_ROUTE, pwa.serve_worker, methods=["GET"]),
+    ]
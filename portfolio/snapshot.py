@@ -0,0 +1,244 @@
+# ============================================================================
+# RENDER SNAPSHOTS
+# ============================================================================
+# Every visitor gets the same output from a section, so there is no need to
+# build its HTML again for each session. With snapshots on, the first run of
+# a section records the calls it makes on its render target (markdown bodies,
+# component documents, images, columns entered and left), and later runs in
+# any session replay that list straight to Streamlit, skipping content
+# loading, template rendering, icon inlining and URL building.
+#
+# A snapshot is keyed by a fingerprint of everything the output depends on:
+# main.py and the portfolio package, the content file, photos, videos and
+# fonts, the build manifests under static/, and whether the HTTP routes and
+# static serving are on. The fingerprint is re-checked at most every
+# CHECK_INTERVAL seconds, so an edit or a rebuild takes effect within that.
+#
+# Sections that create a stateful widget (the Media tab's sub-tabs) depend on
+# the session and are never recorded; render_media snapshots the open
+# sub-tab's content instead.
+#
+# Enable:  PORTFOLIO_SNAPSHOTS=1
+# Runtime: snapshot.render("gallery", render_gallery, ui)
+# ============================================================================
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from portfolio import server
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENABLED = os.environ.get("PORTFOLIO_SNAPSHOTS", "").strip().lower() in ("1", "true", "yes", "on")
+
+# Seconds a computed fingerprint is trusted before the files are checked again
+CHECK_INTERVAL = 2.0
+
+# Files and directories whose contents the sections' output depends on
+WATCHED_FILES = ("main.py", "app.py")
+WATCHED_DIRS = ("portfolio", "content", "photos", "Video", "fonts")
+
+# Under static/, only the build manifests and directory listings are watched:
+# every build rewrites its manifest, and there are hundreds of derivatives.
+# Component documents, the offline copy and the app icons are written from
+# the sections' own output, so watching them would only invalidate it.
+STATIC_DIR = ROOT / "static"
+UNWATCHED_STATIC = (STATIC_DIR / "components", STATIC_DIR / "offline", STATIC_DIR / "pwa")
+
+_snapshots = {}
+_fingerprint_cache = {"checked": 0.0, "value": None}
+_lock = threading.Lock()
+
+
+# ============================================================================
+# FINGERPRINT
+# ============================================================================
+
+def _scan(directory, out):
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name == "__pycache__" or entry.name.startswith("."):
+            continue
+        if entry.is_dir():
+            _scan(entry.path, out)
+        else:
+            stat = entry.stat()
+            out.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+
+def _scan_static(directory, out):
+    try:
+        stat = os.stat(directory)
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    # static/ itself only changes when a build adds its directory, and every
+    # build writes a manifest
+    if Path(directory) != STATIC_DIR:
+        out.append((directory, stat.st_mtime_ns, 0))
+    for entry in entries:
+        if entry.is_dir():
+            if Path(entry.path) not in UNWATCHED_STATIC:
+                _scan_static(entry.path, out)
+        elif entry.name == "manifest.json":
+            stat = entry.stat()
+            out.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+
+def fingerprint():
+    """
+    A value that changes whenever a section's output could
+
+    Returns:
+        int: Hash of the watched files' paths, mtimes and sizes plus the
+            server settings; cached for CHECK_INTERVAL seconds
+    """
+    now = time.monotonic()
+    if now - _fingerprint_cache["checked"] < CHECK_INTERVAL:
+        return _fingerprint_cache["value"]
+
+    import streamlit as st
+
+    state = [("routes", server.routes_mounted(), 0), ("static", st.get_option("server.enableStaticServing"), 0)]
+    for name in WATCHED_FILES:
+        try:
+            stat = os.stat(ROOT / name)
+        except OSError:
+            continue
+        state.append((name, stat.st_mtime_ns, stat.st_size))
+    for name in WATCHED_DIRS:
+        _scan(ROOT / name, state)
+    _scan_static(STATIC_DIR, state)
+
+    value = hash(tuple(state))
+    _fingerprint_cache.update(checked=now, value=value)
+    return value
+
+
+# ============================================================================
+# RECORD AND REPLAY
+# ============================================================================
+
+class _Container:
+    """A recorded column or tab: entering and leaving it is recorded too."""
+
+    def __init__(self, recorder, handle, container):
+        self._recorder = recorder
+        self._handle = handle
+        self._container = container
+
+    def __getattr__(self, name):
+        return getattr(self._container, name)
+
+    def __enter__(self):
+        self._recorder.ops.append(("enter", self._handle))
+        self._container.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        self._recorder.ops.append(("exit", self._handle))
+        return self._container.__exit__(*exc)
+
+
+class Recorder:
+    """
+    Render target that forwards every call to `ui` and records it
+
+    Calls that only compute URLs (static_url, resize_url, ...) pass straight
+    through: their results are already part of the recorded markup.
+
+    Args:
+        ui: The render target being drawn to
+    """
+
+    _EMITTING = ("markdown", "text", "subheader", "component", "image", "video", "error")
+
+    def __init__(self, ui):
+        self.ui = ui
+        self.ops = []
+        self.cacheable = True
+        self._handles = 0
+
+    def __getattr__(self, name):
+        target = getattr(self.ui, name)
+        if name not in self._EMITTING:
+            return target
+
+        def call(*args, **kwargs):
+            self.ops.append(("call", name, args, kwargs))
+            return target(*args, **kwargs)
+
+        return call
+
+    def _containers(self, name, args, kwargs):
+        containers = getattr(self.ui, name)(*args, **kwargs)
+        handles = list(range(self._handles, self._handles + len(containers)))
+        self._handles += len(containers)
+        self.ops.append(("containers", name, args, kwargs, handles))
+        return [_Container(self, h, c) for h, c in zip(handles, containers)]
+
+    def columns(self, spec):
+        return self._containers("columns", (spec,), {})
+
+    def tabs(self, labels, **kwargs):
+        # Tabs with a key track which one is open per session
+        if "key" in kwargs or "on_change" in kwargs:
+            self.cacheable = False
+        return self._containers("tabs", (labels,), kwargs)
+
+
+def replay(ops, ui):
+    """Draw a recorded snapshot to `ui`."""
+    handles = {}
+    for op in ops:
+        kind = op[0]
+        if kind == "call":
+            _, name, args, kwargs = op
+            getattr(ui, name)(*args, **kwargs)
+        elif kind == "containers":
+            _, name, args, kwargs, ids = op
+            handles.update(zip(ids, getattr(ui, name)(*args, **kwargs)))
+        elif kind == "enter":
+            handles[op[1]].__enter__()
+        else:
+            handles[op[1]].__exit__(None, None, None)
+
+
+def render(name, renderer, ui, *args):
+    """
+    Run `renderer(ui, *args)`, or replay its snapshot when one is current
+
+    Args:
+        name (str): Snapshot name, unique per renderer and arguments
+        renderer (callable): Section render function
+        ui: Render target
+        *args: Extra arguments for the renderer
+    """
+    if not ENABLED:
+        renderer(ui, *args)
+        return
+
+    key = fingerprint()
+    with _lock:
+        stored = _snapshots.get(name)
+    if stored and stored[0] == key:
+        replay(stored[1], ui)
+        return
+
+    recorder = Recorder(ui)
+    renderer(recorder, *args)
+    if recorder.cacheable:
+        with _lock:
+            _snapshots[name] = (key, recorder.ops)
+
+
+def clear():
+    """Drop every snapshot and the cached fingerprint."""
+    with _lock:
+        _snapshots.clear()
+        _fingerprint_cache.update(checked=0.0, value=None)
@@ -0,0 +1,441 @@
+# ============================================================================
+# CSS ASSEMBLY
+# ============================================================================
+# Gathers the stylesheets in portfolio/css/, merges rules that repeat the same
+# selector (and :root variables that are redefined per section), minifies the
+# result and writes it once under a content hash:
+#
+#   static/css/portfolio.<hash>.css  ->  served at assets/css/... (app.py)
+#                                        or app/static/css/... (main.py)
+#
+# The app then only sends a ~100 byte <link> per run; the browser downloads
+# and parses the stylesheet once and keeps it cached across reruns. Brotli
+# and gzip copies are written next to it (portfolio/assets.py).
+#
+# Inspect the bundle with:   python -m portfolio.styles
+# ============================================================================
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CSS_DIR = Path(__file__).resolve().parent / "css"
+BUNDLE_DIR = ROOT / "static" / "css"
+BUNDLE_URL = "app/static/css"
+
+# Cascade order: later files win over earlier ones, exactly as the separate
+# <style> blocks used to when they were injected one after another.
+STYLESHEETS = (
+    "base.css",
+    "cards.css",
+    "skills.css",
+    "experience.css",
+    "achievements.css",
+    "gallery.css",
+    "media.css",
+)
+
+# At-rules whose body holds nested rules (merged recursively). Any other
+# at-rule (@font-face, @keyframes, ...) is kept verbatim.
+_NESTING_AT_RULES = ("@media", "@supports")
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+# Nodes are tuples:
+#   ("rule", selector, [(property, value, important), ...])
+#   ("block", prelude, [child nodes])
+#   ("raw", text)
+
+def _strip_comments(css):
+    return re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+
+
+def _scan(text, i, stops):
+    """Return the index of the first char in `stops` outside quotes/parens."""
+    depth = 0
+    quote = None
+    while i < len(text):
+        ch = text[i]
+        if quote:
+            if ch == "\\":
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif depth == 0 and ch in stops:
+            return i
+        i += 1
+    return len(text)
+
+
+def _matching_brace(text, i):
+    """Return the index of the `}` closing the block that opens at text[i]."""
+    depth = 0
+    while i < len(text):
+        i = _scan(text, i, "{}")
+        if i >= len(text):
+            break
+        depth += 1 if text[i] == "{" else -1
+        if depth == 0:
+            return i
+        i += 1
+    raise ValueError("unbalanced braces in stylesheet")
+
+
+def parse_declarations(body):
+    """Split a declaration block into (property, value, important) tuples."""
+    decls = []
+    i = 0
+    while i < len(body):
+        end = _scan(body, i, ";")
+        part = body[i:end].strip()
+        i = end + 1
+        if ":" not in part:
+            continue
+        prop, value = part.split(":", 1)
+        prop = prop.strip()
+        if not prop.startswith("--"):
+            prop = prop.lower()
+        value = value.strip()
+        important = bool(re.search(r"!\s*important\s*$", value, flags=re.I))
+        if important:
+            value = re.sub(r"\s*!\s*important\s*$", "", value, flags=re.I)
+        if prop and value:
+            decls.append((prop, value, important))
+    return decls
+
+
+def parse(css):
+    """Parse a stylesheet into a list of nodes."""
+    text = _strip_comments(css)
+    nodes, _ = _parse_nodes(text, 0)
+    return nodes
+
+
+def _parse_nodes(text, i):
+    nodes = []
+    while True:
+        while i < len(text) and text[i].isspace():
+            i += 1
+        if i >= len(text) or text[i] == "}":
+            return nodes, i + 1
+        stop = _scan(text, i, "{;}")
+        prelude = " ".join(text[i:stop].split())
+        if stop >= len(text) or text[stop] != "{":
+            # Statement at-rule such as @import or @charset
+            if prelude:
+                nodes.append(("raw", prelude + ";"))
+            i = stop + 1
+            continue
+        if prelude.lower().startswith(_NESTING_AT_RULES):
+            children, i = _parse_nodes(text, stop + 1)
+            nodes.append(("block", prelude, children))
+        elif prelude.startswith("@"):
+            end = _matching_brace(text, stop)
+            nodes.append(("raw", prelude + "{" + _minify_raw(text[stop + 1:end]) + "}"))
+            i = end + 1
+        else:
+            end = _matching_brace(text, stop)
+            nodes.append(("rule", prelude, parse_declarations(text[stop + 1:end])))
+            i = end + 1
+
+
+# ============================================================================
+# MERGING
+# ============================================================================
+# The nodes are flattened into rule occurrences tagged with the at-rule
+# conditions around them, e.g. ("@media (prefers-color-scheme: dark)",).
+# Merging then works per declaration:
+#
+#   1. A declaration is dropped when a later one for the same selector and
+#      property always overrides it (same condition or unconditional, with
+#      the same or higher !important weight).
+#   2. Each remaining declaration moves into the earliest earlier rule with
+#      the same selector and condition, as long as that does not carry it
+#      across another declaration of the same property family (margin,
+#      margin-top, ...). That holds for every selector and condition in
+#      between: `.a{color:red}.b{color:blue}.a{color:green}` must keep green
+#      last, as an element with both classes shows.
+#
+# So the light/dark :root variables redefined by every section collapse into
+# one light and one dark :root rule, while order-dependent overrides such as
+# the 768px/480px hero heights keep their order.
+
+def _selector_key(selector):
+    selector = " ".join(selector.split())
+    return re.sub(r"\s*([,>+~])\s*", r"\1", selector)
+
+
+def _condition_key(prelude):
+    return re.sub(r"\s*:\s*", ":", " ".join(prelude.split()))
+
+
+def _family(prop):
+    """Group longhands with their shorthand (margin-top -> margin)."""
+    if prop.startswith("-"):
+        prop = re.sub(r"^-[a-z]+-", "", prop) if not prop.startswith("--") else prop
+    return prop if prop.startswith("--") else prop.split("-")[0]
+
+
+def flatten(nodes, cond=()):
+    """
+    Flatten parsed nodes into a list of occurrences
+
+    Returns:
+        list: dicts with "cond" and either "sel"/"decls" or "raw"
+    """
+    occurrences = []
+    for node in nodes:
+        if node[0] == "rule":
+            occurrences.append({"cond": cond, "sel": _selector_key(node[1]), "decls": list(node[2])})
+        elif node[0] == "block":
+            occurrences.extend(flatten(node[2], cond + (_condition_key(node[1]),)))
+        else:
+            occurrences.append({"cond": cond, "raw": node[1]})
+    return occurrences
+
+
+def merge(occurrences):
+    """
+    Drop overridden declarations and fold duplicate rules together
+
+    Args:
+        occurrences (list): Output of flatten(), in cascade order
+
+    Returns:
+        list: Occurrences with the same cascade result and fewer rules
+    """
+    decls = []
+    for index, occ in enumerate(occurrences):
+        for order, (prop, value, important) in enumerate(occ.get("decls", ())):
+            decls.append({
+                "slot": index, "home": index, "order": (index, order),
+                "cond": occ["cond"], "sel": occ["sel"],
+                "prop": prop, "value": value, "important": important,
+            })
+
+    # 1. Drop declarations that a later one always overrides
+    alive = []
+    for i, d in enumerate(decls):
+        overridden = any(
+            e["sel"] == d["sel"] and e["prop"] == d["prop"]
+            and e["cond"] in (d["cond"], ())
+            and (e["important"] or not d["important"])
+            for e in decls[i + 1:]
+        ) or any(
+            e["sel"] == d["sel"] and e["prop"] == d["prop"]
+            and e["cond"] in (d["cond"], ()) and e["important"] and not d["important"]
+            for e in decls[:i]
+        )
+        if not overridden:
+            alive.append(d)
+
+    # 2. Move each declaration into the earliest compatible rule
+    for i, d in enumerate(alive):
+        family = _family(d["prop"])
+        for index in range(d["home"]):
+            occ = occurrences[index]
+            if "sel" not in occ or occ["sel"] != d["sel"] or occ["cond"] != d["cond"]:
+                continue
+            # Any selector may match the same element, and any condition
+            # may hold, so no declaration of the family may be crossed
+            blocked = any(
+                _family(e["prop"]) == family and index < e["slot"] <= d["home"]
+                for e in alive[:i]
+            )
+            if not blocked:
+                d["slot"] = index
+                break
+
+    merged = []
+    seen_raw = set()
+    for index, occ in enumerate(occurrences):
+        if "raw" in occ:
+            if (occ["cond"], occ["raw"]) not in seen_raw:
+                seen_raw.add((occ["cond"], occ["raw"]))
+                merged.append(occ)
+            continue
+        slot_decls = sorted((d for d in alive if d["slot"] == index), key=lambda d: d["order"])
+        if slot_decls:
+            merged.append({
+                "cond": occ["cond"],
+                "sel": occ["sel"],
+                "decls": [(d["prop"], d["value"], d["important"]) for d in slot_decls],
+            })
+    return merged
+
+
+# ============================================================================
+# MINIFYING
+# ============================================================================
+
+def _minify_value(value):
+    # Leave quoted strings alone; squeeze whitespace everywhere else
+    parts = re.split(r"(\"[^\"]*\"|'[^']*')", value)
+    for i in range(0, len(parts), 2):
+        part = " ".join(parts[i].split())
+        part = re.sub(r"\s*,\s*", ",", part)
+        part = re.sub(r"\(\s+", "(", part)
+        parts[i] = re.sub(r"\s+\)", ")", part)
+    return "".join(parts)
+
+
+def _serialize_declarations(decls):
+    return ";".join(
+        f"{prop}:{_minify_value(value)}{'!important' if important else ''}"
+        for prop, value, important in decls
+    )
+
+
+def _minify_raw(body):
+    # @font-face and friends hold declarations; @keyframes holds nested blocks
+    if "{" in body:
+        return " ".join(body.split())
+    return _serialize_declarations(parse_declarations(body))
+
+
+def serialize(occurrences):
+    """Write occurrences back out as minified CSS, regrouping at-rules."""
+    out = []
+    open_cond = ()
+    for occ in occurrences:
+        cond = occ["cond"]
+        # Close at-rules that no longer apply, then open the new ones
+        common = 0
+        while common < min(len(cond), len(open_cond)) and cond[common] == open_cond[common]:
+            common += 1
+        out.append("}" * (len(open_cond) - common))
+        out.extend(prelude + "{" for prelude in cond[common:])
+        open_cond = cond
+        if "raw" in occ:
+            out.append(occ["raw"])
+        else:
+            out.append(f"{occ['sel']}{{{_serialize_declarations(occ['decls'])}}}")
+    out.append("}" * len(open_cond))
+    return "".join(out)
+
+
+# ============================================================================
+# BUNDLE
+# ============================================================================
+
+def build_bundle(names=STYLESHEETS, css_dir=CSS_DIR):
+    """
+    Assemble the stylesheets into one merged, minified CSS string
+
+    Args:
+        names (tuple): Stylesheet file names in cascade order
+        css_dir (Path): Directory holding the stylesheets
+
+    Returns:
+        str: The minified bundle
+    """
+    occurrences = []
+    for name in names:
+        occurrences.extend(flatten(parse((Path(css_dir) / name).read_text(encoding="utf-8"))))
+    return serialize(merge(occurrences))
+
+
+_bundle_cache = {"key": None, "css": None, "hash": None, "written": None}
+
+
+def bundle():
+    """
+    Return the current bundle, rebuilding it only when a stylesheet changes
+
+    Returns:
+        dict: {"css": minified text, "hash": content hash, "path": file on disk}
+    """
+    key = tuple(os.stat(CSS_DIR / name).st_mtime_ns for name in STYLESHEETS)
+    if key != _bundle_cache["key"]:
+        css = build_bundle()
+        _bundle_cache.update(
+            key=key,
+            css=css,
+            hash=hashlib.sha256(css.encode("utf-8")).hexdigest()[:12],
+        )
+    digest = _bundle_cache["hash"]
+    return {
+        "css": _bundle_cache["css"],
+        "hash": digest,
+        "path": BUNDLE_DIR / f"portfolio.{digest}.css",
+    }
+
+
+def _prune_bundles(current):
+    """Delete bundles (and their copies) other than `current`."""
+    for path in BUNDLE_DIR.glob("portfolio.*.css*"):
+        if path.name.split(".css")[0] != current.stem:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def write_bundle():
+    """
+    Write the bundle under its content hash, with its compressed copies
+
+    Bundles written for earlier versions of the stylesheets are deleted.
+    Only the first call per bundle checks the disk; later ones return the
+    path straight away.
+    """
+    from portfolio import assets
+
+    current = bundle()
+    path = current["path"]
+    if _bundle_cache.get("written") != path:
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(current["css"], encoding="utf-8")
+            os.replace(tmp, path)
+        assets.compress(path)
+        _prune_bundles(path)
+        _bundle_cache["written"] = path
+    return path
+
+
+def stylesheet_tag(inline=False, url_for=None):
+    """
+    Return the markup that loads the bundle
+
+    Args:
+        inline (bool): Embed the CSS in a <style> tag instead of linking the
+            hashed file (for when static file serving is disabled)
+        url_for (callable): Maps a path under static/ to its URL, e.g.
+            ui.static_url; a link to app/static/css/... when omitted. An
+            OSError from it falls back to inlining.
+
+    Returns:
+        str: A <link> (or <style>) tag for st.markdown
+    """
+    if not inline:
+        try:
+            path = write_bundle()
+            href = url_for(path.relative_to(ROOT).as_posix()) if url_for else f"{BUNDLE_URL}/{path.name}"
+        except OSError:
+            inline = True
+        else:
+            return f'<link rel="stylesheet" href="{href}">'
+    return f"<style>{bundle()['css']}</style>"
+
+
+def main():
+    sources = "".join((CSS_DIR / name).read_text(encoding="utf-8") for name in STYLESHEETS)
+    path = write_bundle()
+    size = path.stat().st_size
+    print(f"{len(STYLESHEETS)} stylesheets, {len(sources)} bytes -> {path.relative_to(ROOT)} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
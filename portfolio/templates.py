@@ -0,0 +1,194 @@
+# ============================================================================
+# HTML TEMPLATES
+# ============================================================================
+# A small template language for the section markup in portfolio/templates/.
+# Each template is compiled once into Python code (recompiled when the file
+# changes), and the HTML it produces is memoized by a hash of its inputs, so
+# an unchanged section costs one dictionary lookup per rerun.
+#
+#   {{ expr }}                 value of a Python expression, HTML-escaped
+#   {{ expr | safe }}          value inserted as-is (already HTML)
+#   {% for x in expr %}...{% endfor %}
+#   {% if expr %}...{% elif expr %}...{% else %}...{% endif %}
+#   {# comment #}
+#
+# Line breaks in the template text, and the indentation after them, are not
+# copied to the output. Templates can be laid out readably while each section
+# still renders to a single line, which st.markdown will not mistake for an
+# indented code block.
+#
+# Runtime: templates.render("experience.html", experience=content.experience)
+# ============================================================================
+
+import hashlib
+import html
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+# Rendered sections kept in memory (most recently used last)
+RENDER_CACHE_SIZE = 64
+
+_TOKEN = re.compile(r"(\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})", re.S)
+_SAFE = re.compile(r"^(.*?)\s*\|\s*safe$", re.S)
+_FOR = re.compile(r"^for\s+(.+?)\s+in\s+(.+)$", re.S)
+
+
+class TemplateError(Exception):
+    """Raised for a template with invalid syntax"""
+
+
+def _escape(value):
+    return html.escape(str(value))
+
+
+# ============================================================================
+# COMPILER
+# ============================================================================
+
+def compile_template(source, name="<template>"):
+    """
+    Translate template text into a Python code object
+
+    The code appends output pieces to `_out` and reads template variables
+    as globals, so it runs with `exec(code, dict(context, _out=[], ...))`.
+
+    Args:
+        source (str): Template text
+        name (str): Template name, used in error messages
+
+    Returns:
+        code: Compiled code object
+
+    Raises:
+        TemplateError: For unbalanced blocks or invalid expressions
+    """
+    lines = []
+    stack = []
+    line_no = 1
+
+    def emit(code):
+        lines.append("    " * len(stack) + code)
+
+    def check(expr, mode="eval"):
+        try:
+            compile(expr, name, mode)
+        except SyntaxError as exc:
+            raise TemplateError(f"{name}, line {line_no}: invalid expression {expr!r}") from exc
+
+    for token in _TOKEN.split(source):
+        if token.startswith("{{") and token.endswith("}}"):
+            expr = token[2:-2].strip()
+            safe = _SAFE.match(expr)
+            if safe:
+                check(safe.group(1))
+                emit(f"_out.append(str({safe.group(1)}))")
+            else:
+                check(expr)
+                emit(f"_out.append(_escape({expr}))")
+        elif token.startswith("{%") and token.endswith("%}"):
+            tag = token[2:-2].strip()
+            keyword = tag.split(None, 1)[0] if tag else ""
+            if keyword == "for":
+                loop = _FOR.match(tag)
+                if not loop:
+                    raise TemplateError(f"{name}, line {line_no}: malformed {{% {tag} %}}")
+                check(f"for {loop.group(1)} in {loop.group(2)}: pass", "exec")
+                emit(f"for {loop.group(1)} in {loop.group(2)}:")
+                stack.append("for")
+            elif keyword == "if":
+                check(tag[2:].strip())
+                emit(f"if {tag[2:].strip()}:")
+                stack.append("if")
+            elif keyword in ("elif", "else"):
+                if not stack or stack[-1] != "if":
+                    raise TemplateError(f"{name}, line {line_no}: {{% {keyword} %}} outside an if block")
+                if keyword == "elif":
+                    check(tag[4:].strip())
+                stack.pop()
+                emit(f"elif {tag[4:].strip()}:" if keyword == "elif" else "else:")
+                stack.append("if")
+            elif keyword in ("endfor", "endif"):
+                if not stack or stack[-1] != keyword[3:]:
+                    raise TemplateError(f"{name}, line {line_no}: unexpected {{% {keyword} %}}")
+                emit("pass")
+                stack.pop()
+            else:
+                raise TemplateError(f"{name}, line {line_no}: unknown tag {{% {tag} %}}")
+        elif not token.startswith("{#"):
+            text = re.sub(r"\n[ \t]*", "", token)
+            if text:
+                emit(f"_out.append({text!r})")
+        line_no += token.count("\n")
+
+    if stack:
+        raise TemplateError(f"{name}: {{% {stack[-1]} %}} is never closed")
+    return compile("\n".join(lines) or "pass", name, "exec")
+
+
+# ============================================================================
+# LOADING AND RENDERING
+# ============================================================================
+# Compiled templates are kept until their file's mtime changes, the same way
+# the image manifest and content file are cached.
+
+_compiled = {}
+_rendered = OrderedDict()
+
+
+def load(name):
+    """
+    Return the compiled template `name` and a hash of its source
+
+    Args:
+        name (str): File name inside portfolio/templates/
+
+    Returns:
+        tuple: (code object, source digest)
+    """
+    path = TEMPLATE_DIR / name
+    mtime = os.stat(path).st_mtime_ns
+    cached = _compiled.get(name)
+    if cached is None or cached[0] != mtime:
+        source = path.read_text(encoding="utf-8")
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        cached = (mtime, compile_template(source, name), digest)
+        _compiled[name] = cached
+    return cached[1], cached[2]
+
+
+def render(name, **context):
+    """
+    Render a template to one HTML string, reusing earlier identical output
+
+    The memo key hashes the template source together with the `repr` of the
+    context, so context values must have a stable repr (strings, numbers,
+    tuples and the frozen dataclasses from portfolio/content.py do).
+
+    Args:
+        name (str): File name inside portfolio/templates/
+        **context: Variables the template can use
+
+    Returns:
+        str: Rendered HTML
+    """
+    code, digest = load(name)
+    key = hashlib.sha256(
+        (digest + repr(sorted(context.items()))).encode("utf-8")
+    ).hexdigest()
+    cached = _rendered.get(key)
+    if cached is not None:
+        _rendered.move_to_end(key)
+        return cached
+
+    namespace = dict(context, _out=[], _escape=_escape)
+    exec(code, namespace)
+    output = "".join(namespace["_out"])
+
+    _rendered[key] = output
+    if len(_rendered) > RENDER_CACHE_SIZE:
+        _rendered.popitem(last=False)
+    return output
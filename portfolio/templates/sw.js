@@ -0,0 +1,120 @@
+{# Service worker served at /sw.js (portfolio/pwa.py).
+   Line breaks are not kept: every statement ends with a semicolon and
+   comments are block comments. #}
+const VERSION = {{ version | safe }};
+const PRECACHE = "portfolio-precache-" + VERSION;
+const RUNTIME = "portfolio-runtime";
+const PRECACHE_URLS = {{ precache | safe }};
+const OFFLINE_URL = {{ offline | safe }};
+const RUNTIME_ENTRIES = {{ runtime_entries }};
+/* Paths under the scope left to the network: websocket, health checks,
+   metrics, range-requested videos, session media and this worker */
+const SKIP = {{ skip | safe }};
+
+const scope = self.registration.scope;
+
+function local(path) {
+  return new URL(path, scope).href;
+}
+
+self.addEventListener("install", function (event) {
+  /* One missing file must not stop the worker from installing */
+  event.waitUntil(
+    caches.open(PRECACHE).then(function (cache) {
+      return Promise.all(PRECACHE_URLS.map(function (path) {
+        return cache.add(local(path)).catch(function () { return null; });
+      }));
+    }).then(function () { return self.skipWaiting(); })
+  );
+});
+
+self.addEventListener("activate", function (event) {
+  event.waitUntil(
+    caches.keys().then(function (names) {
+      return Promise.all(names.filter(function (name) {
+        return name.indexOf("portfolio-precache-") === 0 && name !== PRECACHE;
+      }).map(function (name) { return caches.delete(name); }));
+    }).then(function () { return self.clients.claim(); })
+  );
+});
+
+function trim(cache) {
+  return cache.keys().then(function (keys) {
+    return Promise.all(keys.slice(0, Math.max(keys.length - RUNTIME_ENTRIES, 0)).map(function (key) {
+      return cache.delete(key);
+    }));
+  });
+}
+
+function store(key, response) {
+  return caches.open(RUNTIME).then(function (cache) {
+    return cache.put(key, response).then(function () { return trim(cache); });
+  });
+}
+
+/* Any cached size or format of the same photo, for offline use */
+function anyCopy(request) {
+  const path = new URL(request.url).pathname;
+  return caches.keys().then(function (names) {
+    return names.filter(function (name) { return name.indexOf("portfolio-") === 0; }).reduce(function (found, name) {
+      return found.then(function (response) {
+        if (response) { return response; }
+        return caches.open(name).then(function (cache) {
+          return cache.keys().then(function (keys) {
+            const key = keys.find(function (k) { return new URL(k.url).pathname === path; });
+            return key ? cache.match(key) : null;
+          });
+        });
+      });
+    }, Promise.resolve(null));
+  });
+}
+
+function offline(request) {
+  return caches.match(request, { ignoreSearch: true }).then(function (response) {
+    return response || anyCopy(request);
+  }).then(function (response) {
+    return response || Response.error();
+  });
+}
+
+/* Answer from the cache at once and refresh it in the background; files
+   served as immutable never change, so they are not fetched again */
+function staleWhileRevalidate(event, request, key) {
+  return caches.match(key).then(function (cached) {
+    const immutable = cached && (cached.headers.get("Cache-Control") || "").indexOf("immutable") >= 0;
+    if (immutable) { return cached; }
+    const network = fetch(request).then(function (response) {
+      if (response.ok && response.type === "basic") {
+        return store(key, response.clone()).then(function () { return response; });
+      }
+      return response;
+    });
+    event.waitUntil(network.catch(function () { return null; }));
+    return cached || network.catch(function () { return offline(request); });
+  });
+}
+
+/* The app's page: the cached shell (refreshed in the background) while
+   online, the offline copy of the sections when the network is down */
+function navigate(event) {
+  const request = event.request;
+  const url = new URL(request.url);
+  const toOffline = function () { return Response.redirect(local(OFFLINE_URL) + url.search, 302); };
+  if (self.navigator.onLine === false) { return Promise.resolve(toOffline()); }
+  return staleWhileRevalidate(event, request, local("")).then(function (response) {
+    return response.type === "error" ? toOffline() : response;
+  }).catch(toOffline);
+}
+
+self.addEventListener("fetch", function (event) {
+  const request = event.request;
+  if (request.method !== "GET" || request.headers.has("range") || request.url.indexOf(scope) !== 0) { return; }
+  const path = request.url.slice(scope.length);
+  if (SKIP.some(function (prefix) { return path.indexOf(prefix) === 0; })) { return; }
+  if (request.mode === "navigate" && path.split("?")[0] === "") {
+    event.respondWith(navigate(event));
+    return;
+  }
+  event.respondWith(staleWhileRevalidate(event, request, request));
+});
@@ -0,0 +1,339 @@
+# ============================================================================
+# LOCAL VIDEOS
+# ============================================================================
+# Metadata for the videos in Video/ that the Media tab plays. Ahead of time,
+# the build reads each file's duration and frame size from its MP4 headers
+# and grabs a poster frame with ffmpeg:
+#
+#   static/posters/video/<file name>.<version>.jpg
+#   static/posters/video/manifest.json
+#
+# The page then shows a <video preload="none"> with that poster, so nothing
+# is downloaded until it is played, and the bytes are streamed in ranges by
+# the /video route (portfolio/server.py). A video listed in the content file
+# but missing from Video/ is shown as a placeholder card instead.
+#
+# Build:   python -m portfolio.videos [--force]   (posters need ffmpeg)
+# Runtime: videos.info("Video/video.mp4") -> duration, size, poster, or None
+# ============================================================================
+
+import argparse
+import hashlib
+import io
+import os
+import shutil
+import struct
+import subprocess
+from pathlib import Path
+
+from portfolio import images
+
+ROOT = Path(__file__).resolve().parent.parent
+VIDEO_DIR = ROOT / "Video"
+POSTER_DIR = ROOT / "static" / "posters" / "video"
+MANIFEST_PATH = POSTER_DIR / "manifest.json"
+
+VIDEO_SUFFIXES = (".mp4", ".m4v", ".mov", ".webm")
+MIME_TYPES = {".mp4": "video/mp4", ".m4v": "video/mp4", ".mov": "video/quicktime", ".webm": "video/webm"}
+
+# Posters are taken this far in (or halfway through a shorter video), past
+# any fade-in from black, and stored at most this wide
+POSTER_TIME = 1.0
+POSTER_WIDTH = 720
+
+
+# ============================================================================
+# MP4 HEADERS
+# ============================================================================
+# Duration comes from the movie header (mvhd) and the frame size from the
+# first video track header (tkhd); the media data itself is never read.
+
+def _boxes(data, offset=0, end=None):
+    """Yield (type, payload start, payload end) for each box in data[offset:end]."""
+    end = len(data) if end is None else end
+    while offset + 8 <= end:
+        size, kind = struct.unpack_from(">I4s", data, offset)
+        header = 8
+        if size == 1:
+            size = struct.unpack_from(">Q", data, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            return
+        yield kind.decode("latin-1"), offset + header, min(offset + size, end)
+        offset += size
+
+
+def _find_moov(f, file_size):
+    """Read the moov box of an MP4 file, skipping over the media data."""
+    offset = 0
+    while offset + 8 <= file_size:
+        f.seek(offset)
+        head = f.read(16)
+        size, kind = struct.unpack_from(">I4s", head)
+        header = 8
+        if size == 1:
+            size = struct.unpack_from(">Q", head, 8)[0]
+            header = 16
+        elif size == 0:
+            size = file_size - offset
+        if size < header:
+            return None
+        if kind == b"moov":
+            f.seek(offset + header)
+            return f.read(size - header)
+        offset += size
+    return None
+
+
+def probe(path):
+    """
+    Read a video's duration and frame size from its MP4/MOV headers
+
+    Args:
+        path (Path): Video file
+
+    Returns:
+        dict: duration (seconds), width and height; values are None when the
+            file has no readable MP4 headers (e.g. WebM, or a truncated file)
+    """
+    info = {"duration": None, "width": None, "height": None}
+    try:
+        with open(path, "rb") as f:
+            moov = _find_moov(f, os.fstat(f.fileno()).st_size)
+        if moov:
+            _read_moov(moov, info)
+    except struct.error:
+        # A box runs past the end of the file
+        return {"duration": None, "width": None, "height": None}
+    return info
+
+
+def _read_moov(moov, info):
+    """Fill in duration and frame size from the mvhd and first tkhd boxes."""
+    for kind, start, end in _boxes(moov):
+        if kind == "mvhd":
+            if moov[start] == 1:
+                timescale, duration = struct.unpack_from(">IQ", moov, start + 20)
+            else:
+                timescale, duration = struct.unpack_from(">II", moov, start + 12)
+            if timescale:
+                info["duration"] = round(duration / timescale, 2)
+        elif kind == "trak" and info["width"] is None:
+            for child, c_start, c_end in _boxes(moov, start, end):
+                if child == "tkhd":
+                    # Width and height are the last 8 bytes, 16.16 fixed point
+                    width, height = struct.unpack_from(">II", moov, c_end - 8)
+                    if width and height:
+                        info["width"], info["height"] = width >> 16, height >> 16
+
+
+# ============================================================================
+# POSTERS
+# ============================================================================
+
+def ffmpeg_path():
+    """The ffmpeg executable: on PATH, or bundled by imageio-ffmpeg if installed."""
+    found = shutil.which("ffmpeg")
+    if found:
+        return found
+    try:
+        import imageio_ffmpeg
+    except ImportError:
+        return None
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def extract_poster(path, at, ffmpeg):
+    """
+    Grab one frame of a video as a poster JPEG
+
+    Args:
+        path (Path): Video file
+        at (float): Time of the frame in seconds
+        ffmpeg (str): ffmpeg executable
+
+    Returns:
+        bytes: JPEG at most POSTER_WIDTH wide, or None if no frame was decoded
+    """
+    from PIL import Image
+
+    result = subprocess.run(
+        [ffmpeg, "-v", "error", "-ss", f"{at:.2f}", "-i", str(path),
+         "-frames:v", "1", "-f", "image2pipe", "-c:v", "png", "-"],
+        capture_output=True,
+        timeout=120,
+    )
+    if result.returncode or not result.stdout:
+        return None
+    with Image.open(io.BytesIO(result.stdout)) as im:
+        im = im.convert("RGB")
+    data, _ = images.encode(images.resize(im, POSTER_WIDTH), "jpeg")
+    return data
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def video_sources():
+    """Every local video on the Media tab, from content/portfolio.json."""
+    from portfolio import content
+
+    return [
+        item.src
+        for tab in content.load().media
+        for item in tab.items
+        if item.kind == "video"
+    ]
+
+
+def _is_fresh(entry, stat):
+    return entry and entry["bytes"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns
+
+
+def poster_path(source, stat):
+    """
+    Where a video's poster is written
+
+    Named after the whole file name (so "a.mp4" and "a.mov" don't share one)
+    plus a version from its path, size and mtime, so a re-encoded video gets
+    a new URL instead of a cached old frame.
+
+    Args:
+        source (str): Repo-relative video path
+        stat (os.stat_result): The video's current stat
+
+    Returns:
+        Path: JPEG under POSTER_DIR
+    """
+    key = f"{source}:{stat.st_size}:{stat.st_mtime_ns}"
+    version = hashlib.sha256(key.encode("utf-8")).hexdigest()[:10]
+    return POSTER_DIR / f"{Path(source).name}.{version}.jpg"
+
+
+def build(sources=None, force=False):
+    """
+    Probe every local video and extract its poster
+
+    Args:
+        sources (list): Repo-relative video paths (default: the content file's)
+        force (bool): Redo videos that haven't changed
+
+    Returns:
+        tuple: (manifest of source -> entry, list of sources that are missing)
+    """
+    manifest = images.read_manifest(MANIFEST_PATH).get("videos", {})
+    ffmpeg = ffmpeg_path()
+    wanted = video_sources() if sources is None else sources
+    missing = []
+
+    for source in wanted:
+        path = ROOT / source
+        try:
+            stat = os.stat(path)
+        except OSError:
+            missing.append(source)
+            continue
+        entry = manifest.get(source)
+        if _is_fresh(entry, stat) and not force and (entry["poster"] or not ffmpeg):
+            continue
+
+        old_poster = entry["poster"] if entry else None
+        entry = {"bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns, "poster": None, **probe(path)}
+        if ffmpeg:
+            duration = entry["duration"] or 0
+            data = extract_poster(path, min(POSTER_TIME, duration / 2), ffmpeg)
+            if data:
+                poster = poster_path(source, stat)
+                poster.parent.mkdir(parents=True, exist_ok=True)
+                poster.write_bytes(data)
+                entry["poster"] = poster.relative_to(ROOT).as_posix()
+        if old_poster and old_poster != entry["poster"]:
+            (ROOT / old_poster).unlink(missing_ok=True)
+        manifest[source] = entry
+
+    # Drop videos that are gone or no longer listed
+    for source in set(manifest) - (set(wanted) - set(missing)):
+        poster = manifest.pop(source)["poster"]
+        if poster and poster not in {e["poster"] for e in manifest.values()}:
+            (ROOT / poster).unlink(missing_ok=True)
+
+    images.write_manifest({"videos": manifest}, MANIFEST_PATH)
+    return manifest, missing
+
+
+# ============================================================================
+# RUNTIME
+# ============================================================================
+
+_manifest_cache = {"mtime": None, "videos": {}}
+_probe_cache = {}
+
+
+def _manifest():
+    try:
+        mtime = os.stat(MANIFEST_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime != _manifest_cache["mtime"]:
+        _manifest_cache["videos"] = images.read_manifest(MANIFEST_PATH).get("videos", {}) if mtime else {}
+        _manifest_cache["mtime"] = mtime
+    return _manifest_cache["videos"]
+
+
+def info(source):
+    """
+    Duration, frame size and poster of a local video
+
+    Uses the build's manifest while the file is unchanged; otherwise reads
+    the MP4 headers directly (no poster until the next build).
+
+    Args:
+        source (str): Repo-relative path, e.g. "Video/video.mp4"
+
+    Returns:
+        dict: bytes, duration, width, height and poster (path or None), or
+            None when the file does not exist
+    """
+    try:
+        stat = os.stat(ROOT / source)
+    except OSError:
+        return None
+    entry = _manifest().get(source)
+    if _is_fresh(entry, stat) and (not entry["poster"] or (ROOT / entry["poster"]).exists()):
+        return entry
+
+    key = (source, stat.st_size, stat.st_mtime_ns)
+    if key not in _probe_cache:
+        _probe_cache[key] = {"bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns, "poster": None, **probe(ROOT / source)}
+    return _probe_cache[key]
+
+
+def format_duration(seconds):
+    """Duration as m:ss (or h:mm:ss)."""
+    seconds = round(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}:{minutes:02}:{secs:02}" if hours else f"{minutes}:{secs:02}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Probe the local videos and extract their posters.")
+    parser.add_argument("--force", action="store_true", help="redo videos that haven't changed")
+    args = parser.parse_args(argv)
+
+    if not ffmpeg_path():
+        print("ffmpeg not found: reading durations only, no posters")
+    manifest, missing = build(force=args.force)
+    for source, entry in sorted(manifest.items()):
+        duration = format_duration(entry["duration"]) if entry["duration"] else "?"
+        size = f"{entry['width']}x{entry['height']}" if entry["width"] else "?"
+        print(f"{source}: {duration}, {size}, {entry['bytes'] / 1e6:.1f} MB, poster {entry['poster'] or 'none'}")
+    for source in missing:
+        print(f"{source}: missing (shown as a placeholder)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+# ============================================================================
+# WARM-UP AND COLD-START PROFILE
+# ============================================================================
+# Without a warm-up, the first visitor after a deploy pays for every cold
+# cost: importing streamlit.components.v1 and Pillow, parsing the content
+# file, building the CSS bundle, reading photo headers and manifests, and
+# rendering every template and icon sprite. app.py runs warm_up() in its
+# lifespan hook, so the server only answers /_stcore/health (and accepts
+# visitors) once all of that is done:
+#
+#   imports      modules main.py and the sections import on first use
+#   content      content/portfolio.json parsed and validated
+#   stylesheet   CSS bundle built and written, font manifest read
+#   photos       hero and gallery photo sizes and derivative lists; photo
+#                bytes for st.image when there are no derivatives to link
+#   videos       local video metadata and YouTube poster lookups
+#   sections     every tab rendered once to a page that sends nothing,
+#                filling the template, icon and render-snapshot caches and
+#                publishing the precompressed component documents
+#   offline      app icons, offline pages and service worker, when
+#                PORTFOLIO_PWA is set
+#
+# The resize route's disk cache (.cache/img) survives restarts, so it is
+# already warm after the first deploy.
+#
+# `python -m portfolio.warmup` profiles a cold start in a fresh interpreter:
+# import times (python -X importtime) by package and slowest module, plus
+# the time of each warm-up step, appended to benchmarks/coldstart.json.
+#
+# Disable: PORTFOLIO_WARMUP=0
+# Run:     python -m portfolio.warmup [--top 15] [--no-record]
+# ============================================================================
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HISTORY_PATH = ROOT / "benchmarks" / "coldstart.json"
+
+ENABLED = os.environ.get("PORTFOLIO_WARMUP", "1").strip().lower() not in ("0", "false", "no", "off")
+
+# Imported lazily by the app on the first run that needs them
+RUNTIME_IMPORTS = (
+    "streamlit.components.v1",
+    "PIL.Image",
+    "PIL.ImageOps",
+    "portfolio.sections",
+    "portfolio.page",
+)
+
+
+# ============================================================================
+# WARM-UP
+# ============================================================================
+
+class _NullContainer:
+    """A column or tab of _WarmPage; every tab counts as open."""
+
+    open = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _warm_page():
+    from portfolio import image_cache
+    from portfolio.page import StreamlitPage
+
+    class WarmPage(StreamlitPage):
+        """StreamlitPage that prepares everything it would send, but sends nothing"""
+
+        def markdown(self, body):
+            pass
+
+        def text(self, body):
+            pass
+
+        def subheader(self, body):
+            pass
+
+        def component(self, body, height, scrolling=False, title=None):
+            self.component_src(body, scrolling)
+
+        def image(self, path, width=None):
+            image_cache.get(path, width)
+
+        def video(self, src):
+            pass
+
+        def error(self, message):
+            pass
+
+        def columns(self, spec):
+            return [_NullContainer() for _ in range(spec if isinstance(spec, int) else len(spec))]
+
+        def tabs(self, labels, **kwargs):
+            return [_NullContainer() for _ in labels]
+
+    return WarmPage()
+
+
+def _imports():
+    for name in RUNTIME_IMPORTS:
+        importlib.import_module(name)
+
+
+def _content():
+    from portfolio import content
+
+    content.load()
+
+
+def _stylesheet():
+    from portfolio import fonts, styles
+
+    styles.stylesheet_tag(url_for=_warm_page().static_url)
+    fonts.load_manifest()
+
+
+def _photos():
+    from portfolio import content, image_cache, images, sections
+
+    sources = [(sections.HERO_PHOTO, sections.HERO_IMAGE_WIDTH)] + [
+        (path, sections.GALLERY_IMAGE_WIDTH)
+        for event in content.load().gallery
+        for path in event.photo_paths
+    ]
+    for path, width in sources:
+        try:
+            images.source_size(path)
+        except OSError:
+            continue
+        # Without derivatives the page falls back to st.image, which sends
+        # these bytes
+        if not images.variant_set(path):
+            image_cache.get(path, width)
+
+
+def _videos():
+    from portfolio import content, videos, youtube
+
+    for tab in content.load().media:
+        for item in tab.items:
+            if item.kind == "video":
+                videos.info(item.src)
+            elif item.kind == "youtube":
+                youtube.poster_path(youtube.video_id(item.src))
+
+
+def _sections():
+    from portfolio import snapshot
+    from portfolio.sections import SECTION_RENDERERS, SECTION_SLUGS
+
+    page = _warm_page()
+    timings = {}
+    for label, renderer in SECTION_RENDERERS.items():
+        start = time.perf_counter()
+        snapshot.render(SECTION_SLUGS[label], renderer, page)
+        timings[SECTION_SLUGS[label]] = time.perf_counter() - start
+    return timings
+
+
+def _offline():
+    from portfolio import pwa, server
+
+    if pwa.ENABLED and server.routes_mounted():
+        pwa.build()
+
+
+STEPS = (
+    ("imports", _imports),
+    ("content", _content),
+    ("stylesheet", _stylesheet),
+    ("photos", _photos),
+    ("videos", _videos),
+    ("sections", _sections),
+    ("offline", _offline),
+)
+
+
+def warm_up():
+    """
+    Run every warm-up step, timing each
+
+    A step that fails is reported and skipped: the app then pays that cost
+    (or shows that error) on its first run, as it would without a warm-up.
+
+    Returns:
+        dict: step (or "sections/<slug>") -> seconds, and "errors" -> list
+    """
+    timings = {"errors": []}
+    for name, step in STEPS:
+        start = time.perf_counter()
+        try:
+            detail = step()
+        except Exception as exc:  # a failed step must never block startup
+            timings["errors"].append(f"{name}: {exc}")
+            detail = None
+        timings[name] = time.perf_counter() - start
+        for slug, seconds in (detail or {}).items():
+            timings[f"{name}/{slug}"] = seconds
+    return timings
+
+
+def _summary(timings):
+    steps = ", ".join(f"{name} {timings[name] * 1000:.0f} ms" for name, _ in STEPS)
+    total = sum(timings[name] for name, _ in STEPS)
+    return f"warm-up: {total:.2f} s ({steps})"
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    """st.App lifespan hook: warm up before the server starts accepting."""
+    import asyncio
+
+    if ENABLED:
+        timings = await asyncio.to_thread(warm_up)
+        print(_summary(timings), flush=True)
+        for error in timings["errors"]:
+            print(f"warm-up: {error}", flush=True)
+    yield
+
+
+# ============================================================================
+# COLD-START PROFILE
+# ============================================================================
+
+def _profile_child():
+    """Run in a fresh `python -X importtime`: print warm-up timings as JSON."""
+    start = time.perf_counter()
+    import streamlit  # the app's own first import
+
+    timings = {"import streamlit": time.perf_counter() - start}
+    timings.update(warm_up())
+    print(json.dumps(timings))
+
+
+def parse_importtime(stderr):
+    """
+    Parse `python -X importtime` output
+
+    Returns:
+        list: (module, self µs, cumulative µs, depth) per imported module,
+            depth 0 being a top-level import
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|", 2)
+        # One space after the bar, then two per level of nesting
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), int(own), int(cumulative), depth))
+    return modules
+
+
+def profile():
+    """
+    Profile a cold start in a fresh interpreter
+
+    Returns:
+        dict: import_ms, packages (self time per top-level package),
+            slowest (top-level imports by cumulative time) and steps (ms)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from portfolio import warmup; warmup._profile_child()"],
+        cwd=ROOT, capture_output=True, text=True, timeout=300,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "profile failed")
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    modules = parse_importtime(result.stderr)
+
+    packages = {}
+    for name, own, _, _ in modules:
+        root = name.split(".")[0]
+        packages[root] = packages.get(root, 0) + own
+    return {
+        "import_ms": round(sum(own for _, own, _, _ in modules) / 1000, 1),
+        "packages": {
+            name: round(us / 1000, 1) for name, us in sorted(packages.items(), key=lambda kv: -kv[1])
+        },
+        "slowest": [
+            {"module": name, "ms": round(cumulative / 1000, 1)}
+            for name, _, cumulative, depth in sorted(modules, key=lambda m: -m[2])
+            if depth == 0
+        ],
+        "steps": {
+            name: round(seconds * 1000, 1) for name, seconds in timings.items() if name != "errors"
+        },
+        "errors": timings["errors"],
+    }
+
+
+def main(argv=None):
+    from portfolio import bench
+
+    parser = argparse.ArgumentParser(description="Profile the app's cold start: imports and warm-up steps.")
+    parser.add_argument("--top", type=int, default=15, help="packages and modules to list (default 15)")
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH, help="history file (default: benchmarks/coldstart.json)")
+    parser.add_argument("--no-record", action="store_true", help="don't append to the history")
+    args = parser.parse_args(argv)
+
+    report = profile()
+    print(f"imports: {report['import_ms']:.0f} ms in total")
+    print("\nself time by package:")
+    for name, ms in list(report["packages"].items())[:args.top]:
+        print(f"  {ms:8.1f} ms  {name}")
+    print("\nslowest top-level imports (cumulative):")
+    for entry in report["slowest"][:args.top]:
+        print(f"  {entry['ms']:8.1f} ms  {entry['module']}")
+    print("\nfirst-run steps:")
+    for name, ms in report["steps"].items():
+        print(f"  {ms:8.1f} ms  {name}")
+    for error in report["errors"]:
+        print(f"error: {error}")
+
+    if not args.no_record:
+        bench.append_history({
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": bench.git_revision(),
+            "import_ms": report["import_ms"],
+            "steps": report["steps"],
+            "slowest": report["slowest"][:args.top],
+        }, args.history)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+# ============================================================================
+# PAGE WEIGHT
+# ============================================================================
+# Runs main.py headlessly (like portfolio/bench.py), once per tab, and breaks
+# the bytes a visitor downloads for that tab down by where they come from:
+#
+#   css         each inline <style> block, in markdown or component documents
+#   svg         each inline <svg> (icon sprites and icons)
+#   markup      the rest of each st.markdown body
+#   component   the rest of each components.html document
+#   stylesheet, font, image, video, script, document
+#               files the markup references, sized from disk; images are
+#               the srcset candidate a browser picks at --viewport/--dpr
+#   media       files registered through st.image / st.video
+#   external    resources on other hosts (instagram.com, youtube.com, ...),
+#               only sized with --fetch
+#
+# Each item is also tagged with when it is downloaded: "load" (with the
+# page), "lazy" (as it scrolls into view) or "click" (only after the visitor
+# opens a facade or plays a video). Tab totals count load + lazy.
+#
+# Items are ranked by size across the site, identical inline blocks are
+# merged and their copies counted, and each tab's total is checked against
+# its budget in benchmarks/budgets.json; over budget exits with status 1.
+#
+# Run:     python -m portfolio.weight [--section gallery] [--json report.json]
+#                                     [--viewport 1280] [--dpr 1] [--fetch]
+# ============================================================================
+
+import argparse
+import hashlib
+import json
+import re
+import urllib.request
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from portfolio import bench
+from portfolio.sections import SECTION_SLUGS
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGETS_PATH = ROOT / "benchmarks" / "budgets.json"
+
+DEFAULT_VIEWPORT = 1280
+DEFAULT_DPR = 1
+
+_STYLE = re.compile(r"<style\b[^>]*>(.*?)</style>", re.S | re.I)
+_SVG = re.compile(r"<svg\b.*?</svg>", re.S | re.I)
+_SCRIPT = re.compile(r"<script\b[^>]*>(.*?)</script>", re.S | re.I)
+_CSS_URL = re.compile(r"url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+_ABSOLUTE_URL = re.compile(r"https?://[^\s\"'<>)]+")
+_SELECTOR = re.compile(r"([^{}@]+)\{")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CLASS = re.compile(r'class="([\w-]+)')
+_SIZES_ENTRY = re.compile(r"^\(\s*max-width:\s*(\d+)px\s*\)\s*(.+)$")
+
+_SUFFIX_KINDS = {
+    ".css": "stylesheet",
+    ".woff2": "font", ".woff": "font", ".ttf": "font",
+    ".avif": "image", ".webp": "image", ".jpg": "image", ".jpeg": "image", ".png": "image", ".svg": "image",
+    ".mp4": "video", ".m4v": "video", ".mov": "video", ".webm": "video",
+    ".js": "script",
+}
+
+
+# ============================================================================
+# RESOURCES
+# ============================================================================
+
+def _slot_width(sizes, viewport):
+    """CSS px an image fills at `viewport`, from a `sizes` attribute."""
+    for entry in (part.strip() for part in sizes.split(",")):
+        match = _SIZES_ENTRY.match(entry)
+        if match:
+            if viewport > int(match.group(1)):
+                continue
+            entry = match.group(2).strip()
+        if entry.endswith("vw"):
+            return viewport * float(entry[:-2]) / 100
+        if entry.endswith("px"):
+            return float(entry[:-2])
+    return viewport
+
+
+def pick_candidate(srcset, sizes, viewport, dpr):
+    """
+    The srcset candidate a browser would download
+
+    Args:
+        srcset (str): e.g. "a-320w.avif 320w, a-480w.avif 480w"
+        sizes (str): The `sizes` attribute ("" means 100vw)
+        viewport (int): Viewport width in CSS px
+        dpr (float): Device pixel ratio
+
+    Returns:
+        str: URL of the smallest candidate covering the slot, else the largest
+    """
+    candidates = []
+    for part in srcset.split(","):
+        fields = part.split()
+        if not fields:
+            continue
+        width = int(fields[1][:-1]) if len(fields) > 1 and fields[1].endswith("w") else 0
+        candidates.append((width, fields[0]))
+    if not candidates:
+        return None
+    needed = _slot_width(sizes or "100vw", viewport) * dpr
+    candidates.sort()
+    return next((url for width, url in candidates if width >= needed), candidates[-1][1])
+
+
+def local_file(url):
+    """The file behind a same-origin URL, or None."""
+    path = urlsplit(url).path.lstrip("/")
+    for prefix in ("app/static/", "assets/"):
+        if path.startswith(prefix):
+            path = "static/" + path[len(prefix):]
+    candidate = (ROOT / path).resolve()
+    try:
+        candidate.relative_to(ROOT)
+    except ValueError:
+        return None
+    return candidate if candidate.is_file() else None
+
+
+def _resource_kind(url, default="document"):
+    return _SUFFIX_KINDS.get(Path(urlsplit(url).path).suffix.lower(), default)
+
+
+class _References(HTMLParser):
+    """Collects the URLs a document makes the browser fetch, and when."""
+
+    def __init__(self, viewport, dpr):
+        super().__init__(convert_charrefs=True)
+        self.viewport = viewport
+        self.dpr = dpr
+        self.found = []      # (url, kind, when)
+        self._sources = None
+
+    def _add(self, url, kind, when):
+        if url and not url.startswith(("#", "javascript:")):
+            self.found.append((url, kind, when))
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "picture":
+            self._sources = []
+        elif tag == "source" and self._sources is not None:
+            self._sources.append(attrs)
+        elif tag == "img":
+            # Browsers take the first <source> they support; every format
+            # the pipeline writes is assumed supported
+            chosen = (self._sources or [attrs])[0]
+            url = pick_candidate(chosen.get("srcset") or "", chosen.get("sizes") or "", self.viewport, self.dpr)
+            when = "lazy" if attrs.get("loading") == "lazy" else "load"
+            self._add(url or attrs.get("src"), "image", when)
+        elif tag == "link" and attrs.get("href"):
+            rel = (attrs.get("rel") or "").lower()
+            if "stylesheet" in rel or "preload" in rel:
+                kind = {"font": "font", "style": "stylesheet"}.get(attrs.get("as"), _resource_kind(attrs["href"]))
+                self._add(attrs["href"], kind, "load")
+        elif tag == "script" and attrs.get("src"):
+            self._add(attrs["src"], "script", "load")
+        elif tag == "iframe" and attrs.get("src"):
+            self._add(attrs["src"], "document", "lazy" if attrs.get("loading") == "lazy" else "load")
+        elif tag == "video":
+            if attrs.get("poster"):
+                self._add(attrs["poster"], "image", "load")
+            if attrs.get("src"):
+                self._add(attrs["src"], "video", "click" if attrs.get("preload") == "none" else "load")
+        # Facades keep what they load on click in data attributes
+        for name, value in attrs.items():
+            if name.startswith("data-") and value and value.startswith(("http://", "https://")):
+                self._add(value, _resource_kind(value), "click")
+
+    def handle_endtag(self, tag):
+        if tag == "picture":
+            self._sources = None
+
+
+def references(markup, viewport, dpr):
+    """
+    Every resource a document references
+
+    Args:
+        markup (str): HTML (a markdown body or component document)
+        viewport (int): Viewport width used to pick srcset candidates
+        dpr (float): Device pixel ratio used to pick srcset candidates
+
+    Returns:
+        list: (url, kind, when) tuples
+    """
+    parser = _References(viewport, dpr)
+    parser.feed(markup)
+    parser.close()
+    found = parser.found
+    for css in _STYLE.findall(markup):
+        found += [(url, _resource_kind(url, "font"), "load") for url in _CSS_URL.findall(css)]
+    # URLs a script builds, such as embed.js, are only fetched on click
+    for script in _SCRIPT.findall(markup):
+        found += [(url, _resource_kind(url, "script"), "click") for url in _ABSOLUTE_URL.findall(script)]
+    return found
+
+
+# ============================================================================
+# ATTRIBUTION
+# ============================================================================
+
+def _digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:10]
+
+
+def _describe(markup, kind):
+    """Name a document by its first class, e.g. "component .yt-facade"."""
+    match = _CLASS.search(_SVG.sub("", _STYLE.sub("", markup)))
+    return f"{kind} .{match.group(1)}" if match else kind
+
+
+def _inline_items(markup, kind):
+    """
+    Split a document into its style blocks, SVGs and the remaining markup
+
+    Returns:
+        list: (category, name, key, bytes) tuples; identical blocks share a
+            key wherever they appear
+    """
+    context = _describe(markup, kind)
+    items = []
+    for css in _STYLE.findall(markup):
+        match = _SELECTOR.search(_CSS_COMMENT.sub("", css))
+        label = " ".join(match.group(1).split())[:40] if match else "style"
+        items.append(("css", f"{context}: {label}", _digest(css), len(css.encode("utf-8"))))
+    rest = _STYLE.sub("", markup)
+    for svg in _SVG.findall(rest):
+        symbols = svg.count("<symbol")
+        label = f"sprite of {symbols} icons" if symbols else "icon"
+        items.append(("svg", f"{context}: {label}", _digest(svg), len(svg.encode("utf-8"))))
+    rest = _SVG.sub("", rest)
+    items.append((kind, context, _digest(rest), len(rest.encode("utf-8"))))
+    return items
+
+
+def analyze_section(slug, viewport=DEFAULT_VIEWPORT, dpr=DEFAULT_DPR):
+    """
+    Render one tab and attribute its bytes
+
+    Returns:
+        list: Items as dicts with category, name, key (content digest or
+            URL), bytes (None if unknown), when and url (for files)
+    """
+    at, _, media = bench.render(slug)
+    result = []
+    refs = []
+    for element in bench.elements(at._tree):
+        proto = element.proto
+        body = getattr(proto, "body", None)
+        srcdoc = getattr(proto, "srcdoc", None)
+        if isinstance(srcdoc, str) and srcdoc:
+            markup, kind = srcdoc, "component"
+        elif isinstance(body, str) and body.strip():
+            markup, kind = body, "markup"
+        else:
+            continue
+        result += [
+            {"category": c, "name": n, "key": k, "bytes": b, "when": "load", "url": None}
+            for c, n, k, b in _inline_items(markup, kind)
+        ]
+        refs += references(markup, viewport, dpr)
+
+    for index, (mimetype, size) in enumerate(media.files, 1):
+        result.append({
+            "category": "media", "name": f"st.image/st.video file {index} ({mimetype})",
+            "key": f"{slug}-media-{index}", "bytes": size, "when": "load", "url": None,
+        })
+
+    seen = set()
+    for url, kind, when in refs:
+        if url in seen:
+            continue
+        seen.add(url)
+        item = {"category": kind, "name": url, "key": url, "bytes": None, "when": when, "url": url}
+        if url.startswith("data:"):
+            item.update(name=f"data: URL ({kind})", key=_digest(url), bytes=len(url), url=None)
+        elif urlsplit(url).netloc:
+            item.update(category="external", name=f"{urlsplit(url).netloc} {kind}")
+        else:
+            path = local_file(url)
+            if path:
+                item.update(name=path.relative_to(ROOT).as_posix(), bytes=path.stat().st_size)
+        result.append(item)
+    return result
+
+
+def fetch_sizes(items):
+    """Download every external resource once to learn its size (--fetch)."""
+    sizes = {}
+    for item in items:
+        url = item["url"]
+        if item["category"] != "external" or url in sizes:
+            continue
+        try:
+            request = urllib.request.Request(url, headers={"User-Agent": "portfolio-weight"})
+            with urllib.request.urlopen(request, timeout=15) as response:
+                sizes[url] = len(response.read())
+        except OSError:
+            sizes[url] = None
+        item["bytes"] = sizes[url]
+    for item in items:
+        if item["category"] == "external":
+            item["bytes"] = sizes.get(item["url"])
+
+
+def build_report(slugs, viewport=DEFAULT_VIEWPORT, dpr=DEFAULT_DPR, fetch=False, budgets=None):
+    """
+    Attribute the page weight of every tab
+
+    Args:
+        slugs (list): Section slugs to analyze
+        viewport (int): Viewport width in CSS px for srcset selection
+        dpr (float): Device pixel ratio for srcset selection
+        fetch (bool): Download external resources to size them
+        budgets (dict): slug -> budget in KB (load + lazy bytes)
+
+    Returns:
+        dict: "sections" (per-tab totals and items) and "ranking" (items
+            merged across tabs, largest first)
+    """
+    budgets = budgets or {}
+    sections = {slug: analyze_section(slug, viewport, dpr) for slug in slugs}
+    if fetch:
+        fetch_sizes([item for items in sections.values() for item in items])
+
+    merged = {}
+    report = {"viewport": viewport, "dpr": dpr, "sections": {}, "ranking": []}
+    for slug, items in sections.items():
+        totals = {"load": 0, "lazy": 0, "click": 0, "unknown": 0}
+        by_category = {}
+        for item in items:
+            size = item["bytes"]
+            if size is None:
+                totals["unknown"] += 1
+            else:
+                totals[item["when"]] += size
+                if item["when"] != "click":
+                    by_category[item["category"]] = by_category.get(item["category"], 0) + size
+            entry = merged.setdefault((item["category"], item["key"]), dict(item, copies=0, sections=[]))
+            entry["copies"] += 1
+            if slug not in entry["sections"]:
+                entry["sections"].append(slug)
+
+        weight = totals["load"] + totals["lazy"]
+        budget = budgets.get(slug)
+        report["sections"][slug] = {
+            "weight": weight,
+            "totals": totals,
+            "by_category": dict(sorted(by_category.items(), key=lambda kv: -kv[1])),
+            "budget": budget * 1024 if budget is not None else None,
+            "over_budget": budget is not None and weight > budget * 1024,
+            "items": items,
+        }
+
+    # Unsized external resources rank first: they are the unknowns
+    report["ranking"] = sorted(merged.values(), key=lambda item: -(item["bytes"] if item["bytes"] is not None else float("inf")))
+    return report
+
+
+def read_budgets(path=BUDGETS_PATH):
+    """Per-tab budgets in KB from benchmarks/budgets.json ({} when absent)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["budgets_kb"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def _kb(size):
+    return "?" if size is None else f"{size / 1024:.1f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Break each portfolio tab's page weight down by source.")
+    parser.add_argument(
+        "--section", action="append", choices=list(SECTION_SLUGS.values()),
+        help="only analyze this section (repeatable)",
+    )
+    parser.add_argument("--viewport", type=int, default=DEFAULT_VIEWPORT, help="viewport width in CSS px (default 1280)")
+    parser.add_argument("--dpr", type=float, default=DEFAULT_DPR, help="device pixel ratio (default 1)")
+    parser.add_argument("--fetch", action="store_true", help="download external resources to size them")
+    parser.add_argument("--top", type=int, default=25, help="rows of the ranked table (default 25)")
+    parser.add_argument("--json", type=Path, help="also write the full report to this file")
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_PATH, help="budgets file (default: benchmarks/budgets.json)")
+    args = parser.parse_args(argv)
+
+    bench.quiet_logs()
+    slugs = args.section or list(SECTION_SLUGS.values())
+    report = build_report(slugs, args.viewport, args.dpr, args.fetch, read_budgets(args.budgets))
+
+    print(f"{'KB':>8}  {'copies':>6}  {'when':5}  {'category':10}  name (tabs)")
+    for item in report["ranking"][:args.top]:
+        tabs = "all" if len(item["sections"]) == len(slugs) > 1 else ",".join(item["sections"])
+        print(f"{_kb(item['bytes']):>8}  {item['copies']:>6}  {item['when']:5}  {item['category']:10}  {item['name']} ({tabs})")
+
+    print()
+    print(f"{'section':14} {'weight KB':>10} {'budget KB':>10} {'click KB':>9}  largest")
+    for slug, section in report["sections"].items():
+        budget = _kb(section["budget"]) if section["budget"] is not None else "-"
+        largest = ", ".join(f"{c} {_kb(b)}" for c, b in list(section["by_category"].items())[:3])
+        flag = "  OVER BUDGET" if section["over_budget"] else ""
+        print(f"{slug:14} {_kb(section['weight']):>10} {budget:>10} {_kb(section['totals']['click']):>9}  {largest}{flag}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote {args.json}")
+    raise SystemExit(1 if any(s["over_budget"] for s in report["sections"].values()) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# ============================================================================
+# YOUTUBE POSTERS
+# ============================================================================
+# The Media tab shows YouTube videos as a poster with a play button and only
+# loads YouTube's player once it is clicked (portfolio/templates/youtube.html).
+# The posters are the videos' thumbnails, fetched once at build time, cropped
+# to 16:9 and re-encoded with the image pipeline:
+#
+#   static/posters/youtube/<video id>.jpg
+#   static/posters/youtube/manifest.json
+#
+# Offline (--offline, or when a download fails) a neutral stand-in from
+# portfolio/fixtures/ is stored instead, so builds and tests never need the
+# network; the next online build replaces it.
+#
+# Build:   python -m portfolio.youtube [--offline] [--force]
+# Runtime: youtube.poster_path("7Fzq5t4BTVs") -> "static/posters/youtube/..."
+# ============================================================================
+
+import argparse
+import io
+import os
+import re
+import urllib.request
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from portfolio import images
+
+ROOT = Path(__file__).resolve().parent.parent
+POSTER_DIR = ROOT / "static" / "posters" / "youtube"
+MANIFEST_PATH = POSTER_DIR / "manifest.json"
+FIXTURE_POSTER = Path(__file__).resolve().parent / "fixtures" / "youtube-poster.jpg"
+
+# Thumbnails tried in order; not every video has a maxres one, hqdefault
+# always exists but is letterboxed to 4:3
+THUMBNAIL_URL = "https://i.ytimg.com/vi/{id}/{name}.jpg"
+THUMBNAIL_NAMES = ("maxresdefault", "sddefault", "hqdefault")
+
+# Posters fill the Media tab's width (~700 CSS px) at 1x
+POSTER_WIDTH = 720
+
+_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+
+def video_id(url):
+    """
+    Extract the video ID from a YouTube embed, watch or youtu.be URL
+
+    Args:
+        url (str): e.g. "https://www.youtube.com/embed/7Fzq5t4BTVs?si=..."
+
+    Returns:
+        str: The 11-character video ID, or None when `url` isn't a YouTube video
+    """
+    parts = urlsplit(url)
+    host = parts.netloc.lower().removeprefix("www.").removeprefix("m.")
+    if host == "youtu.be":
+        candidate = parts.path.strip("/")
+    elif host in ("youtube.com", "youtube-nocookie.com"):
+        segments = parts.path.strip("/").split("/")
+        if segments[0] in ("embed", "shorts", "live") and len(segments) > 1:
+            candidate = segments[1]
+        else:
+            candidate = dict(parse_qsl(parts.query)).get("v", "")
+    else:
+        return None
+    return candidate if _VIDEO_ID.match(candidate) else None
+
+
+def player_url(url, autoplay=True):
+    """Embed URL for the player that replaces the poster once clicked."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.pop("v", None)
+    if autoplay:
+        query["autoplay"] = "1"
+    return urlunsplit(("https", "www.youtube.com", f"/embed/{video_id(url)}", urlencode(query), ""))
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def _download_thumbnail(vid):
+    """Return the best available thumbnail's bytes, or None when offline."""
+    for name in THUMBNAIL_NAMES:
+        try:
+            with urllib.request.urlopen(THUMBNAIL_URL.format(id=vid, name=name), timeout=15) as response:
+                return response.read()
+        except OSError:
+            continue
+    return None
+
+
+def _crop_16_9(im):
+    """Cut the letterbox bars off a 4:3 thumbnail of a 16:9 video."""
+    height = round(im.width * 9 / 16)
+    if height >= im.height:
+        return im
+    top = (im.height - height) // 2
+    return im.crop((0, top, im.width, top + height))
+
+
+def make_poster(data):
+    """
+    Turn thumbnail bytes into a poster JPEG
+
+    Args:
+        data (bytes): Downloaded thumbnail
+
+    Returns:
+        bytes: 16:9 JPEG at most POSTER_WIDTH wide, quality picked by SSIM
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as im:
+        im = _crop_16_9(im.convert("RGB"))
+    poster, _ = images.encode(images.resize(im, POSTER_WIDTH), "jpeg")
+    return poster
+
+
+def youtube_urls():
+    """Every YouTube URL on the Media tab, from content/portfolio.json."""
+    from portfolio import content
+
+    return [
+        item.src
+        for tab in content.load().media
+        for item in tab.items
+        if item.kind == "youtube"
+    ]
+
+
+def build(urls=None, offline=False, force=False):
+    """
+    Store a poster for every YouTube video the portfolio embeds
+
+    Args:
+        urls (list): Video URLs (default: those in the content file)
+        offline (bool): Use the fixture poster instead of downloading
+        force (bool): Re-fetch posters that are already stored
+
+    Returns:
+        dict: Manifest of video ID -> {"path", "bytes", "fixture"}
+    """
+    manifest = images.read_manifest(MANIFEST_PATH).get("posters", {})
+    ids = []
+    for url in youtube_urls() if urls is None else urls:
+        vid = video_id(url)
+        if vid and vid not in ids:
+            ids.append(vid)
+
+    for vid in ids:
+        entry = manifest.get(vid)
+        path = POSTER_DIR / f"{vid}.jpg"
+        fresh = entry and path.exists() and not (entry["fixture"] and not offline)
+        if fresh and not force:
+            continue
+        thumbnail = None if offline else _download_thumbnail(vid)
+        data = make_poster(thumbnail) if thumbnail else FIXTURE_POSTER.read_bytes()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        manifest[vid] = {
+            "path": path.relative_to(ROOT).as_posix(),
+            "bytes": len(data),
+            "fixture": thumbnail is None,
+        }
+
+    # Posters of videos no longer embedded
+    for vid in set(manifest) - set(ids):
+        (ROOT / manifest.pop(vid)["path"]).unlink(missing_ok=True)
+
+    images.write_manifest({"posters": manifest}, MANIFEST_PATH)
+    return manifest
+
+
+# ============================================================================
+# RUNTIME
+# ============================================================================
+
+def poster_path(vid):
+    """Repo-relative path of a video's stored poster, or None if not built."""
+    if vid is None:
+        return None
+    path = POSTER_DIR / f"{vid}.jpg"
+    return path.relative_to(ROOT).as_posix() if os.path.exists(path) else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch poster images for the embedded YouTube videos.")
+    parser.add_argument("--offline", action="store_true", help="store the fixture stand-in instead of downloading")
+    parser.add_argument("--force", action="store_true", help="re-fetch posters that already exist")
+    args = parser.parse_args(argv)
+
+    manifest = build(offline=args.offline, force=args.force)
+    for vid, entry in sorted(manifest.items()):
+        kind = "fixture stand-in" if entry["fixture"] else "thumbnail"
+        print(f"{vid}: {entry['bytes'] / 1024:.1f} KB {kind} ({entry['path']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Tests for content hashing and encoding negotiation in portfolio/assets.py"""
+
+import os
+
+import pytest
+
+from portfolio import assets
+
+
+@pytest.mark.parametrize("relative", [
+    "css/portfolio.0123456789ab.css",
+    "fonts/poppins-400.0123456789.woff2",
+    "components/0123456789abcdef.html",
+    "pwa/icon-192.0123456789ab.png",
+    "offline/0123456789ab/index.html",
+])
+def test_build_written_names_are_content_hashed(relative):
+    assert assets.content_hashed(assets.STATIC_DIR / relative)
+
+
+@pytest.mark.parametrize("relative", [
+    # Photo derivatives are named after the source, not the encoded bytes
+    "img/10-84637a6b-1080w.webp",
+    "posters/video/video.mp4.0123456789.jpg",
+    "css/deadbeefcafe.css",
+    "offline/0123456789ab/.hidden",
+])
+def test_other_names_are_not_content_hashed(relative):
+    assert not assets.content_hashed(assets.STATIC_DIR / relative)
+
+
+def test_paths_outside_static_are_not_content_hashed():
+    assert not assets.content_hashed(assets.ROOT / "css" / "portfolio.0123456789ab.css")
+
+
+def test_parse_accept_encoding_reads_q_values():
+    assert assets.parse_accept_encoding("gzip, br;q=0.5, X-GZIP;q=0.1") == {"gzip": 0.1, "br": 0.5}
+    assert assets.parse_accept_encoding("br;q=oops, ,identity") == {"br": 0.0, "identity": 1.0}
+    assert assets.parse_accept_encoding(None) == {}
+
+
+@pytest.fixture
+def stylesheet(tmp_path):
+    path = tmp_path / "site.css"
+    path.write_text("body{}")
+    for suffix in (".br", ".gz"):
+        path.with_name(path.name + suffix).write_bytes(b"x")
+    return path
+
+
+def test_negotiate_prefers_brotli(stylesheet):
+    assert assets.negotiate(stylesheet, "gzip, deflate, br") == (stylesheet.with_name("site.css.br"), "br")
+
+
+def test_negotiate_follows_higher_gzip_q(stylesheet):
+    assert assets.negotiate(stylesheet, "br;q=0.5, gzip") == (stylesheet.with_name("site.css.gz"), "gzip")
+
+
+def test_negotiate_wildcard_and_refusals(stylesheet):
+    assert assets.negotiate(stylesheet, "*")[1] == "br"
+    assert assets.negotiate(stylesheet, "br;q=0, *;q=0.5")[1] == "gzip"
+    assert assets.negotiate(stylesheet, "identity") == (stylesheet, None)
+    assert assets.negotiate(stylesheet, "") == (stylesheet, None)
+
+
+def test_negotiate_ignores_stale_and_missing_copies(stylesheet):
+    brotli = stylesheet.with_name("site.css.br")
+    stale = stylesheet.stat().st_mtime_ns - 10**9
+    os.utime(brotli, ns=(stale, stale))
+    stylesheet.with_name("site.css.gz").unlink()
+    assert assets.negotiate(stylesheet, "br, gzip") == (stylesheet, None)
@@ -0,0 +1,60 @@
+"""Tests for routing and header rewriting in portfolio/cluster.py"""
+
+import pytest
+
+from portfolio import cluster
+
+
+@pytest.fixture
+def balancer():
+    c = cluster.Cluster(3)
+    for worker in c.workers:
+        worker.healthy = True
+    return c
+
+
+def test_pick_follows_routing_cookie(balancer):
+    assert balancer.pick("theme=dark; portfolio_worker=w2") == (balancer.workers[2], False)
+
+
+def test_pick_keeps_draining_worker_for_its_sessions(balancer):
+    balancer.workers[1].draining = True
+    assert balancer.pick("portfolio_worker=w1") == (balancer.workers[1], False)
+    worker, new_cookie = balancer.pick("")
+    assert worker is not balancer.workers[1] and new_cookie
+
+
+def test_pick_reassigns_unhealthy_or_unknown_worker(balancer):
+    balancer.workers[0].healthy = False
+    assert balancer.pick("portfolio_worker=w0") == (balancer.workers[1], True)
+    assert balancer.pick("portfolio_worker=w9")[1]
+    assert balancer.pick("other_portfolio_worker=w2")[1]
+
+
+def test_pick_balances_new_browsers(balancer):
+    balancer.workers[0].active = 5
+    picked = [balancer.pick("")[0].index for _ in range(4)]
+    assert picked == [1, 2, 1, 2]
+
+
+def test_pick_without_available_workers(balancer):
+    for worker in balancer.workers:
+        worker.healthy = False
+    assert balancer.pick("portfolio_worker=w0") == (None, False)
+
+
+def test_strip_header_removes_every_copy_case_insensitively():
+    head = (
+        b"GET / HTTP/1.1\r\nHost: x\r\nX-Forwarded-For: 1.2.3.4\r\n"
+        b"x-forwarded-for : 5.6.7.8\r\nX-Forwarded-Host: y\r\n\r\n"
+    )
+    stripped = cluster._strip_header(head, "X-Forwarded-For")
+    assert stripped == b"GET / HTTP/1.1\r\nHost: x\r\nX-Forwarded-Host: y\r\n\r\n"
+    assert cluster._splice_header(stripped, "X-Forwarded-For: 9.9.9.9") == (
+        b"GET / HTTP/1.1\r\nHost: x\r\nX-Forwarded-Host: y\r\nX-Forwarded-For: 9.9.9.9\r\n\r\n"
+    )
+
+
+def test_strip_header_keeps_request_line():
+    head = b"GET /X-Forwarded-For: HTTP/1.1\r\nHost: x\r\n\r\n"
+    assert cluster._strip_header(head, "X-Forwarded-For") == head
@@ -0,0 +1,77 @@
+"""Tests for validation and loading in portfolio/content.py"""
+
+import json
+
+import pytest
+
+from portfolio import content
+
+SCHEMA = {
+    "type": "object",
+    "required": ["title", "tags"],
+    "additionalProperties": False,
+    "properties": {
+        "title": {"type": "string", "minLength": 1},
+        "kind": {"type": "string", "enum": ["photo", "video"]},
+        "height": {"type": "integer", "minimum": 0},
+        "tags": {"type": "array", "minItems": 1, "items": {"type": "string"}},
+    },
+}
+
+
+def test_valid_value_has_no_problems():
+    assert content.validate({"title": "x", "kind": "photo", "height": 3, "tags": ["a"]}, SCHEMA) == []
+
+
+def test_reports_every_problem_with_its_location():
+    value = {"title": "", "kind": "audio", "height": -1, "tags": [1], "extra": 0}
+    assert content.validate(value, SCHEMA) == [
+        "$.title must not be empty",
+        "$.kind must be one of photo, video",
+        "$.height must be at least 0",
+        "$.tags[0] should be of type string",
+        "$ has unknown key 'extra'",
+    ]
+
+
+def test_reports_missing_keys_and_short_arrays():
+    assert content.validate({"tags": []}, SCHEMA) == [
+        "$ is missing 'title'",
+        "$.tags needs at least 1 item(s)",
+    ]
+
+
+def test_booleans_are_not_integers():
+    assert content.validate(True, {"type": "integer"}) == ["$ should be of type integer"]
+    assert content.validate(2.5, {"type": "number"}) == []
+
+
+def test_real_content_file_is_valid():
+    assert content.parse().gallery
+
+
+def test_parse_reports_missing_and_repeated_photos(tmp_path):
+    with open(content.CONTENT_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    first = data["gallery"][0]["photos"][0]
+    data["gallery"][0]["photos"] += [first, 9999]
+    path = tmp_path / "portfolio.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    with pytest.raises(content.ContentError) as caught:
+        content.parse(path)
+    assert len(caught.value.problems) == 2
+    assert "repeats photo" in caught.value.problems[0]
+    assert "photos/9999.jpeg does not exist" in caught.value.problems[1]
+
+
+def test_parse_reports_invalid_json(tmp_path):
+    path = tmp_path / "portfolio.json"
+    path.write_text("{", encoding="utf-8")
+    with pytest.raises(content.ContentError, match="invalid JSON"):
+        content.parse(path)
+
+
+def test_load_reports_a_missing_file(tmp_path):
+    with pytest.raises(content.ContentError, match="cannot read"):
+        content.load(tmp_path / "missing.json")
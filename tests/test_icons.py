@@ -0,0 +1,42 @@
+"""Tests for the Font Awesome to SVG rewriting in portfolio/icons.py"""
+
+import pytest
+
+from portfolio import icons
+
+
+def test_aliased_name_uses_the_renamed_glyph():
+    assert icons.glyph("solid", "university") == icons.glyph("solid", "building-columns")
+
+
+def test_inline_aliased_icon():
+    out = icons.inline('<i class="fas fa-university"></i>')
+    view_box, paths = icons.glyph("solid", "building-columns")
+    assert f'<symbol id="fa-solid-university" viewBox="{view_box}">{paths}</symbol>' in out
+    assert out.endswith(
+        f'<svg class="fa-icon fa-university" viewBox="{view_box}" aria-hidden="true">'
+        '<use href="#fa-solid-university"/></svg>'
+    )
+
+
+def test_inline_keeps_extra_classes_and_attributes():
+    out = icons.inline('<a><i class="fab fa-linkedin social" onclick="go()"></i></a>')
+    assert 'class="fa-icon fa-linkedin social"' in out
+    assert 'onclick="go()"><use href="#fa-brands-linkedin"/></svg></a>' in out
+    assert "<i " not in out
+
+
+def test_inline_puts_each_icon_in_the_sprite_once():
+    out = icons.inline('<i class="fas fa-phone"></i><i class="fa-solid fa-phone"></i>')
+    assert out.count("<symbol") == 1
+    assert out.count('href="#fa-solid-phone"') == 2
+
+
+def test_inline_leaves_markup_without_icons_alone():
+    markup = '<p class="fa-note">no icons</p>'
+    assert icons.inline(markup) is markup
+
+
+def test_inline_rejects_unknown_icons():
+    with pytest.raises(icons.IconError, match="fa-not-an-icon"):
+        icons.inline('<i class="fas fa-not-an-icon"></i>')
@@ -0,0 +1,72 @@
+"""Tests for the byte-budgeted LRU in portfolio/image_cache.py"""
+
+from PIL import Image
+
+from portfolio import image_cache
+
+
+def loader(data, calls):
+    def load():
+        calls.append(data)
+        return data
+    return load
+
+
+def test_hits_do_not_reload():
+    cache = image_cache.ImageCache(100)
+    calls = []
+    assert cache.get("a", loader(b"x" * 10, calls)) == b"x" * 10
+    assert cache.get("a", loader(b"other", calls)) == b"x" * 10
+    assert calls == [b"x" * 10]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+
+def test_evicts_least_recently_used_to_fit_budget():
+    cache = image_cache.ImageCache(100)
+    calls = []
+    cache.get("a", loader(b"a" * 40, calls))
+    cache.get("b", loader(b"b" * 40, calls))
+    cache.get("a", loader(b"a" * 40, calls))  # "b" is now the oldest
+    cache.get("c", loader(b"c" * 40, calls))
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 80, 1)
+
+    cache.get("a", loader(b"a" * 40, calls))
+    cache.get("b", loader(b"b" * 40, calls))
+    assert calls == [b"a" * 40, b"b" * 40, b"c" * 40, b"b" * 40]
+
+
+def test_entry_larger_than_budget_is_returned_but_not_cached():
+    cache = image_cache.ImageCache(10)
+    calls = []
+    cache.get("small", loader(b"s" * 5, calls))
+    assert cache.get("big", loader(b"b" * 11, calls)) == b"b" * 11
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (1, 5, 0)
+
+
+def test_clear_keeps_counters():
+    cache = image_cache.ImageCache(100)
+    cache.get("a", loader(b"a", []))
+    cache.clear()
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["misses"]) == (0, 0, 1)
+
+
+def test_budget_from_env(monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_IMAGE_CACHE_MB", "0.5")
+    assert image_cache._budget_from_env() == 512 * 1024
+    monkeypatch.setenv("PORTFOLIO_IMAGE_CACHE_MB", "lots")
+    assert image_cache._budget_from_env() == image_cache.DEFAULT_BUDGET_MB * 1024 * 1024
+    monkeypatch.setenv("PORTFOLIO_IMAGE_CACHE_MB", "-1")
+    assert image_cache._budget_from_env() == 0
+
+
+def test_prepare_compares_the_upright_width(tmp_path):
+    # Stored 400x200 but tagged as rotated: upright it is 200 wide
+    path = tmp_path / "portrait.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    Image.new("RGB", (400, 200), "navy").save(path, exif=exif)
+    assert image_cache._prepare(path, 300) == path.read_bytes()
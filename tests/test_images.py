@@ -0,0 +1,77 @@
+"""Tests for the incremental derivative build in portfolio/images.py"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from portfolio import images
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, "ROOT", tmp_path)
+    # Threads instead of processes, so the patched ROOT is seen by the workers
+    monkeypatch.setattr(images, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(images, "available_formats", lambda: ("jpeg",))
+    photos = tmp_path / "photos"
+    photos.mkdir()
+    Image.new("RGB", (600, 400), "olive").save(photos / "1.jpeg")
+    Image.new("RGB", (300, 200), "teal").save(photos / "2.jpeg")
+    return tmp_path
+
+
+def build(site, **kwargs):
+    return images.build(site / "photos", site / "static" / "img", workers=1, **kwargs)
+
+
+def manifest(site):
+    return json.loads((site / "static" / "img" / "manifest.json").read_text())
+
+
+def test_builds_every_width_up_to_the_original(site):
+    assert build(site) == {"built": 2, "skipped": 0, "removed": 0, "placeholders": 0}
+    entry = manifest(site)["images"]["photos/2.jpeg"]
+    assert [v["width"] for v in entry["variants"]] == [300]
+    assert entry["placeholder"]["version"]
+    widths = [v["width"] for v in manifest(site)["images"]["photos/1.jpeg"]["variants"]]
+    assert widths == [320, 480, 600]
+
+
+def test_unchanged_photos_are_skipped(site):
+    build(site)
+    assert build(site) == {"built": 0, "skipped": 2, "removed": 0, "placeholders": 0}
+
+
+def test_changed_photo_is_rebuilt_and_old_files_removed(site):
+    build(site)
+    Image.new("RGB", (300, 200), "maroon").save(site / "photos" / "2.jpeg")
+    assert build(site) == {"built": 1, "skipped": 1, "removed": 1, "placeholders": 0}
+    (variant,) = manifest(site)["images"]["photos/2.jpeg"]["variants"]
+    assert (site / variant["path"]).exists()
+
+
+def test_missing_placeholder_is_added_without_rebuilding(site):
+    build(site)
+    data = manifest(site)
+    del data["images"]["photos/1.jpeg"]["placeholder"]
+    (site / "static" / "img" / "manifest.json").write_text(json.dumps(data))
+    assert build(site) == {"built": 0, "skipped": 2, "removed": 0, "placeholders": 1}
+    assert "placeholder" in manifest(site)["images"]["photos/1.jpeg"]
+
+
+def test_pick_variant_takes_smallest_wide_enough(site, monkeypatch):
+    build(site)
+    monkeypatch.setattr(images, "load_manifest", lambda: manifest(site))
+    assert images.pick_variant("photos/1.jpeg", 400).endswith("-480w.jpg")
+    assert images.pick_variant("photos/1.jpeg", 2000).endswith("-600w.jpg")
+    assert images.pick_variant("photos/9.jpeg", 400) == "photos/9.jpeg"
+    assert images.pick_variant("photos/1.jpeg", 400, formats=("avif",)) == "photos/1.jpeg"
+
+
+def test_summary_of_format_without_variants(monkeypatch, capsys):
+    monkeypatch.setattr(images, "build", lambda **kwargs: {"built": 0, "skipped": 0, "removed": 0, "placeholders": 0})
+    monkeypatch.setattr(images, "read_manifest", lambda: {"config": {"formats": ["avif"]}, "images": {}})
+    images.main([])
+    assert "avif  no files" in capsys.readouterr().out
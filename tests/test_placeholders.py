@@ -0,0 +1,70 @@
+"""Tests for the BlurHash and dominant colour code in portfolio/placeholders.py"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from portfolio import placeholders
+
+
+@pytest.fixture
+def pixels():
+    # Red on the left, blue on the right, darker towards the bottom
+    x = np.linspace(0, 1, 48)[None, :]
+    y = np.linspace(1, 0.5, 32)[:, None]
+    return np.rint(np.stack([255 * (1 - x) * y, 40 * y + 0 * x, 255 * x * y], axis=-1)).astype(np.uint8)
+
+
+def test_blurhash_matches_reference_encoder(pixels):
+    # Outputs of the reference implementation (github.com/woltapp/blurhash)
+    flat = np.full((4, 4, 3), (255, 0, 0), dtype=np.uint8)
+    assert placeholders.blurhash(flat, (1, 1)) == "00TI:j"
+    assert placeholders.blurhash(pixels, (4, 3)) == "LbDPvf|T$9wv,_$0sXo0sqn~jujs"
+
+
+@pytest.mark.parametrize("components", [(1, 1), (4, 3), (9, 9)])
+def test_blurhash_length_follows_components(pixels, components):
+    nx, ny = components
+    assert len(placeholders.blurhash(pixels, components)) == 4 + 2 * nx * ny
+
+
+def test_decode_round_trip_keeps_the_low_frequencies(pixels):
+    text = placeholders.blurhash(pixels, (4, 3))
+    decoded = placeholders.decode(text, 48, 32)
+    assert decoded.shape == (32, 48, 3) and decoded.dtype == np.uint8
+    # Coarse blocks of the decode stay close to the source's
+    block = lambda a: a.reshape(4, 8, 4, 12, 3).mean(axis=(1, 3))
+    assert np.abs(block(decoded.astype(float)) - block(pixels.astype(float))).mean() < 15
+
+
+def test_decode_of_flat_hash_is_flat():
+    decoded = placeholders.decode("00TI:j", 5, 3)
+    assert (decoded == (255, 0, 0)).all()
+
+
+@pytest.mark.parametrize("text", ["", "00TI:", "L00TI:j", "00TI:j!!"])
+def test_decode_rejects_invalid_hashes(text):
+    with pytest.raises(ValueError):
+        placeholders.decode(text, 4, 4)
+
+
+def test_dominant_color_is_the_most_common_colour():
+    pixels = np.zeros((10, 10, 3), dtype=np.uint8)
+    pixels[:6] = (200, 100, 50)
+    pixels[6:] = (10, 200, 240)
+    assert placeholders.dominant_color(pixels) == "#c86432"
+
+
+def test_preview_is_a_small_webp_at_the_photo_aspect():
+    uri = placeholders.preview("00TI:j", 1200, 600)
+    assert uri.startswith("data:image/webp;base64,")
+    assert placeholders.preview("00TI:j", 1200, 600) is uri
+
+
+def test_describe_uses_the_thumbnail():
+    im = Image.new("RGB", (640, 480), (12, 34, 56))
+    assert placeholders.describe(im) == {
+        "version": placeholders.VERSION,
+        "color": "#0c2238",
+        "blurhash": placeholders.blurhash(np.full((48, 64, 3), (12, 34, 56), dtype=np.uint8)),
+    }
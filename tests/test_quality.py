@@ -0,0 +1,48 @@
+"""Tests for SSIM and the quality search in portfolio/quality.py"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from portfolio import quality
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    gradient = np.linspace(0, 200, 96)[None, :, None] + np.zeros((64, 96, 3))
+    pixels = np.clip(gradient + rng.normal(0, 20, gradient.shape), 0, 255).astype(np.uint8)
+    return Image.fromarray(pixels)
+
+
+def score(image, data):
+    with Image.open(io.BytesIO(data)) as decoded:
+        return quality.ssim(quality.luma(image), quality.luma(decoded))
+
+
+def test_ssim_of_identical_images_is_one(image):
+    a = quality.luma(image)
+    assert quality.ssim(a, a) == pytest.approx(1.0)
+    assert quality.ssim(a, np.full_like(a, a.mean())) < 0.5
+
+
+@pytest.mark.parametrize("fmt", ["jpeg", "webp"])
+def test_finds_lowest_quality_reaching_target(image, fmt):
+    result = quality.encode_to_target(image, fmt, target=0.9, low=10, high=95)
+    assert 10 <= result["quality"] <= 95
+    assert result["ssim"] >= 0.9
+    assert result["ssim"] == pytest.approx(score(image, result["data"]))
+    if result["quality"] > 10:
+        assert score(image, quality.encode(image, fmt, result["quality"] - 1)) < 0.9
+
+
+def test_unreachable_target_falls_back_to_high(image):
+    result = quality.encode_to_target(image, "jpeg", target=1.01, low=40, high=60)
+    assert result["quality"] == 60
+    assert result["ssim"] < 1.01
+
+
+def test_trivial_target_takes_low(image):
+    assert quality.encode_to_target(image, "webp", target=0.0, low=40, high=60)["quality"] == 40
@@ -0,0 +1,101 @@
+"""Tests for the resize, range and caching helpers in portfolio/server.py"""
+
+import pytest
+from PIL import Image
+
+from portfolio import server
+
+
+@pytest.fixture
+def photo(tmp_path):
+    path = tmp_path / "photo.jpg"
+    Image.new("RGB", (640, 480), "teal").save(path)
+    return path
+
+
+def test_resized_image_survives_a_zero_budget(photo, tmp_path, monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_RESIZE_CACHE_MB", "0")
+    cache = tmp_path / "cache"
+    cached = server.resized_image(photo, 320, "jpeg", "abc", cache_dir=cache)
+    assert cached.exists()
+    with Image.open(cached) as im:
+        assert im.size == (320, 240)
+
+
+def test_eviction_drops_older_files_first(photo, tmp_path, monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_RESIZE_CACHE_MB", "0")
+    cache = tmp_path / "cache"
+    first = server.resized_image(photo, 320, "jpeg", "first", cache_dir=cache)
+    second = server.resized_image(photo, 480, "jpeg", "second", cache_dir=cache)
+    assert not first.exists()
+    assert second.exists()
+
+
+def test_resized_image_bytes_when_the_file_is_evicted(photo, tmp_path, monkeypatch):
+    # Another worker deleted the file before this one read it
+    monkeypatch.setattr(server, "resized_image", lambda *args: tmp_path / "evicted.jpg")
+    data = server.resized_image_bytes(photo, 320, "jpeg", "abc", cache_dir=tmp_path)
+    assert data[:2] == b"\xff\xd8"
+
+
+def test_snap_width_never_upscales():
+    assert server._snap_width(5000, 853) == 853
+    assert server._snap_width(1, 853) <= 853
+
+
+def test_negotiate_format_prefers_modern_formats(monkeypatch):
+    monkeypatch.setattr(server.images, "available_formats", lambda: ("avif", "webp", "jpeg"))
+    assert server.negotiate_format("image/avif,image/webp,*/*") == "avif"
+    assert server.negotiate_format("image/webp,*/*") == "webp"
+    assert server.negotiate_format("*/*") == "jpeg"
+    monkeypatch.setattr(server.images, "available_formats", lambda: ("webp", "jpeg"))
+    assert server.negotiate_format("image/avif,*/*") == "jpeg"
+
+
+def test_etag_changes_with_photo_width_and_format(photo):
+    etag = server._etag(photo, 320, "jpeg")
+    assert etag == server._etag(photo, 320, "jpeg")
+    assert len({etag, server._etag(photo, 480, "jpeg"), server._etag(photo, 320, "webp")}) == 3
+    Image.new("RGB", (640, 480), "coral").save(photo)
+    assert server._etag(photo, 320, "jpeg") != etag
+
+
+def test_parse_range_without_header_sends_whole_file():
+    assert server.parse_range(None, 100) is None
+    assert server.parse_range("", 100) is None
+
+
+def test_parse_range_bounded_and_open_ranges():
+    assert server.parse_range("bytes=0-9", 100) == (0, 9)
+    assert server.parse_range("bytes=90-", 100) == (90, 99)
+    assert server.parse_range("bytes=90-500", 100) == (90, 99)
+
+
+def test_parse_range_suffix_range():
+    assert server.parse_range("bytes=-10", 100) == (90, 99)
+    assert server.parse_range("bytes=-500", 100) == (0, 99)
+
+
+@pytest.mark.parametrize("header, size", [
+    ("bytes=-0", 100),
+    ("bytes=-5", 0),
+    ("bytes=100-", 100),
+    ("bytes=0-", 0),
+])
+def test_parse_range_unsatisfiable(header, size):
+    with pytest.raises(ValueError):
+        server.parse_range(header, size)
+
+
+@pytest.mark.parametrize("header", [
+    "bytes=5-2",
+    "bytes=0-1,5-9",
+    "bytes=-",
+    "bytes=a-b",
+    "bytes=+1-5",
+    "bytes=1_0-20",
+    "bytes=1--5",
+    "items=0-9",
+])
+def test_parse_range_ignores_invalid_headers(header):
+    assert server.parse_range(header, 100) is None
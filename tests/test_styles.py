@@ -0,0 +1,67 @@
+"""Tests for the CSS merger in portfolio/styles.py"""
+
+from portfolio import styles
+
+
+def bundle(css):
+    return styles.serialize(styles.merge(styles.flatten(styles.parse(css))))
+
+
+def test_drops_declaration_a_later_one_overrides():
+    assert bundle(".a{color:red}.a{color:green}") == ".a{color:green}"
+
+
+def test_keeps_important_over_later_normal_declaration():
+    assert bundle(".a{color:red!important}.a{color:green}") == ".a{color:red!important}"
+
+
+def test_folds_repeated_selector_into_first_rule():
+    assert bundle(".a{color:red}.b{margin:0}.a{padding:0}") == ".a{color:red;padding:0}.b{margin:0}"
+
+
+def test_does_not_move_past_other_selector_setting_same_property():
+    # An element with class="a b" must stay green
+    assert bundle(".a{color:red}.b{color:blue}.a{color:green}") == ".b{color:blue}.a{color:green}"
+
+
+def test_does_not_move_past_other_selector_setting_same_family():
+    css = ".a{padding:0}.b{margin:0}.a{margin-top:1px}"
+    assert bundle(css) == css
+
+
+def test_does_not_move_past_conditional_rule_setting_same_family():
+    css = ".a{padding:0}@media (max-width:480px){.b{margin:0}}.a{margin-top:1px}"
+    assert bundle(css) == css
+
+
+def test_keeps_shorthand_before_longhand():
+    css = ".a{margin-top:1px}.a{margin:0}.a{margin-left:2px}"
+    assert bundle(css) == ".a{margin-top:1px;margin:0;margin-left:2px}"
+
+
+def test_collapses_redefined_root_variables_per_condition():
+    dark = "@media (prefers-color-scheme: dark)"
+    css = (
+        f":root{{--bg:#fff}}{dark}{{:root{{--bg:#000}}}}"
+        f":root{{--fg:#111}}{dark}{{:root{{--fg:#eee}}}}"
+    )
+    assert bundle(css) == f":root{{--bg:#fff;--fg:#111}}{dark.replace(': ', ':')}{{:root{{--bg:#000;--fg:#eee}}}}"
+
+
+def test_keeps_order_of_overrides_in_different_conditions():
+    css = (
+        ".hero{height:320px}"
+        "@media (max-width:768px){.hero{height:220px}}"
+        "@media (max-width:480px){.hero{height:160px}}"
+    )
+    assert bundle(css) == css
+
+
+def test_keeps_at_rules_verbatim_once():
+    face = "@font-face{font-family:x;src:url(x.woff2)}"
+    assert bundle(face + ".a{color:red}" + face) == face + ".a{color:red}"
+
+
+def test_real_bundle_is_stable():
+    css = styles.build_bundle()
+    assert bundle(css) == css
@@ -0,0 +1,69 @@
+"""Tests for the template compiler and render memo in portfolio/templates.py"""
+
+import os
+
+import pytest
+
+from portfolio import templates
+
+
+def run(source, **context):
+    namespace = dict(context, _out=[], _escape=templates._escape)
+    exec(templates.compile_template(source), namespace)
+    return "".join(namespace["_out"])
+
+
+def test_escapes_expressions_unless_safe():
+    assert run("<p>{{ text }}</p>", text="<b>&\"") == "<p>&lt;b&gt;&amp;&quot;</p>"
+    assert run("<p>{{ text | safe }}</p>", text="<b>x</b>") == "<p><b>x</b></p>"
+
+
+def test_loops_and_conditions():
+    source = "{% for n in items %}{% if n > 1 %}[{{ n }}]{% elif n == 1 %}one{% else %}-{% endif %}{% endfor %}"
+    assert run(source, items=(0, 1, 2, 3)) == "-one[2][3]"
+
+
+def test_nested_loops_unpack():
+    source = "{% for key, values in groups %}{{ key }}:{% for v in values %}{{ v }}{% endfor %};{% endfor %}"
+    assert run(source, groups=(("a", (1, 2)), ("b", ()))) == "a:12;b:;"
+
+
+def test_drops_comments_and_line_breaks_with_indentation():
+    source = "<ul>\n    {# one item per skill #}\n    <li>{{ skill }}</li>\n</ul>\n"
+    assert run(source, skill="Python") == "<ul><li>Python</li></ul>"
+
+
+def test_comment_hides_template_syntax():
+    assert run("a{# {{ missing }} {% if %} #}b") == "ab"
+
+
+@pytest.mark.parametrize("source, message", [
+    ("{% for x in items %}", "never closed"),
+    ("{% if x %}{% endfor %}", "unexpected"),
+    ("{% else %}", "outside an if block"),
+    ("{% for x items %}{% endfor %}", "malformed"),
+    ("{% while x %}", "unknown tag"),
+    ("{{ 1 + }}", "invalid expression"),
+])
+def test_rejects_invalid_templates(source, message):
+    with pytest.raises(templates.TemplateError, match=message):
+        templates.compile_template(source)
+
+
+def test_error_names_the_line():
+    with pytest.raises(templates.TemplateError, match="card.html, line 3"):
+        templates.compile_template("<div>\n\n{{ ) }}</div>", "card.html")
+
+
+def test_render_memoizes_and_follows_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(templates, "TEMPLATE_DIR", tmp_path)
+    path = tmp_path / "card.html"
+    path.write_text("<p>{{ title }}</p>", encoding="utf-8")
+    first = templates.render("card.html", title="A")
+    assert first == "<p>A</p>"
+    assert templates.render("card.html", title="A") is first
+
+    path.write_text("<h2>{{ title }}</h2>", encoding="utf-8")
+    later = os.stat(path).st_mtime_ns + 10**9
+    os.utime(path, ns=(later, later))
+    assert templates.render("card.html", title="A") == "<h2>A</h2>"
@@ -0,0 +1,49 @@
+"""Tests for the MP4 header reader and poster names in portfolio/videos.py"""
+
+import os
+import struct
+
+from portfolio import videos
+
+
+def box(kind, payload):
+    return struct.pack(">I4s", 8 + len(payload), kind.encode("latin-1")) + payload
+
+
+def mp4(duration=10, timescale=1000, width=640, height=360):
+    mvhd = box("mvhd", bytes(12) + struct.pack(">II", timescale, duration * timescale) + bytes(80))
+    tkhd = box("tkhd", bytes(76) + struct.pack(">II", width << 16, height << 16))
+    return box("ftyp", b"isom") + box("mdat", bytes(64)) + box("moov", mvhd + box("trak", tkhd))
+
+
+def test_probe_reads_duration_and_size(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(mp4())
+    assert videos.probe(path) == {"duration": 10.0, "width": 640, "height": 360}
+
+
+def test_probe_of_truncated_file_has_no_metadata(tmp_path):
+    path = tmp_path / "clip.mp4"
+    short_mvhd = box("ftyp", b"isom") + box("moov", box("mvhd", bytes(8)))
+    cut_large_header = box("ftyp", b"isom") + struct.pack(">I4s", 1, b"mdat") + bytes(2)
+    for cut in (short_mvhd, cut_large_header):
+        path.write_bytes(cut)
+        assert videos.probe(path) == {"duration": None, "width": None, "height": None}
+
+
+def test_posters_of_same_stem_do_not_collide(tmp_path):
+    mp4_path, mov_path = tmp_path / "a.mp4", tmp_path / "a.mov"
+    mp4_path.write_bytes(b"1")
+    mov_path.write_bytes(b"1")
+    first = videos.poster_path("Video/a.mp4", os.stat(mp4_path))
+    second = videos.poster_path("Video/a.mov", os.stat(mov_path))
+    assert first != second
+    assert first.name.startswith("a.mp4.") and first.suffix == ".jpg"
+
+
+def test_poster_name_changes_with_the_video(tmp_path):
+    path = tmp_path / "a.mp4"
+    path.write_bytes(b"1")
+    before = videos.poster_path("Video/a.mp4", os.stat(path))
+    path.write_bytes(b"22")
+    assert videos.poster_path("Video/a.mp4", os.stat(path)) != before